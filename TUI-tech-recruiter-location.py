@@ -6,10 +6,19 @@ Interface para configurar e executar o bot com filtros de localização
 
 import curses
 import os
-import subprocess
-import json
+import sys
+import time
 import platform
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from bot_config import CONFIG_FILE, ConfigError, coerce, load_config, save_config
+from bot_progress import BotProcess, ProgressLog
+from browser_daemon import DEFAULT_PROFILE_DIRECTORY, matching_daemon
+
+# Depois de pedir o cancelamento, espera o bot fechar o navegador antes de forçar
+CANCEL_TIMEOUT = 30
+
 def get_system_paths():
     """Retorna os caminhos padrão baseados no sistema operacional"""
     system = platform.system()
@@ -34,8 +43,8 @@ def get_system_paths():
 
 class TechRecruiterLocationTUI:
     def __init__(self):
-        self.config_file = "config_location.json"
-        self.config = self.load_config()
+        self.config_file = CONFIG_FILE
+        self.config = load_config(self.config_file)
         self.current_field = 0
         self.fields = [
             "location",
@@ -45,35 +54,10 @@ class TechRecruiterLocationTUI:
             "max_weekly_connections"
         ]
         
-    def load_config(self):
-        """Carrega configurações salvas"""
-        default_config = {
-            "location": "São Paulo, Brasil",
-            "companies": ["Google", "Amazon", "Microsoft", "Meta", "Apple"],
-            "search_terms": ["tech recruiter", "recrutador", "talent acquisition"],
-            "max_daily_connections": 15,
-            "max_weekly_connections": 100
-        }
-        
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge com config padrão
-                    for key, value in default_config.items():
-                        if key not in loaded_config:
-                            loaded_config[key] = value
-                    return loaded_config
-        except Exception as e:
-            pass
-            
-        return default_config
-    
     def save_config(self):
         """Salva configurações"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            save_config(self.config, self.config_file)
         except Exception as e:
             pass
     
@@ -200,19 +184,13 @@ class TechRecruiterLocationTUI:
         try:
             new_value = edit_win.getstr(1, len(prompt) + 2, 50).decode('utf-8')
             
-            if field_name in ["companies", "search_terms"]:
-                # Converte para lista
-                new_list = [item.strip() for item in new_value.split(',') if item.strip()]
-                if new_list:
-                    self.config[field_name] = new_list
-            elif field_name in ["max_daily", "max_weekly"]:
-                # Converte para número
-                try:
-                    self.config[field_name] = int(new_value)
-                except ValueError:
-                    pass
-            else:
-                self.config[field_name] = new_value
+            # Converte pelo tipo do campo (lista separada por vírgula, número, texto)
+            try:
+                value = coerce(field_name, new_value)
+                if value != []:  # Lista vazia mantém o valor anterior
+                    self.config.set_field(field_name, value)
+            except ConfigError:
+                pass
                 
         except:
             pass
@@ -221,8 +199,33 @@ class TechRecruiterLocationTUI:
             curses.curs_set(0)
             edit_win.clear()
     
-    def execute_bot(self):
-        """Executa o bot"""
+    def draw_progress(self, stdscr, progress, cancelling):
+        """Tela de progresso: totais dos eventos do bot e as últimas linhas do log"""
+        try:
+            stdscr.erase()
+            height, width = stdscr.getmaxyx()
+            stdscr.addstr(0, 2, "Executando bot - Localizacao & Empresas"[:width - 4], curses.A_BOLD)
+            
+            y = 2
+            for line in progress.state.lines():
+                if y < height - 2:
+                    stdscr.addstr(y, 2, line[:width - 4])
+                y += 1
+            
+            y += 1
+            visible = max(0, height - y - 2)
+            for line in list(progress.tail)[-visible:] if visible else []:
+                stdscr.addstr(y, 2, line[:width - 4])
+                y += 1
+            
+            footer = "Cancelando... aguardando o bot fechar o navegador" if cancelling else "C: cancelar"
+            stdscr.addstr(height - 1, 2, footer[:width - 4], curses.A_REVERSE)
+            stdscr.refresh()
+        except curses.error:
+            pass
+    
+    def execute_bot(self, stdscr):
+        """Executa o bot mostrando o progresso ao vivo; C cancela a execução"""
         self.save_config()
         
         # Caminho do script
@@ -231,22 +234,46 @@ class TechRecruiterLocationTUI:
         if not os.path.exists(script_path):
             return False, "Script não encontrado"
         
+        # Com o daemon do navegador ativo no mesmo perfil do bot, ele se conecta ao daemon
+        # em vez de abrir outro Chrome
+        paths = get_system_paths()
+        command = [paths["python"], script_path]
+        attached = matching_daemon(paths["profile"], DEFAULT_PROFILE_DIRECTORY, warn=False) is not None
+        if attached:
+            command.append("--attach")
+        
         try:
-            # Executa o bot
-            result = subprocess.run(
-                [get_system_paths()["python"], script_path],
-                capture_output=True,
-                text=True,
-                cwd="."
-            )
-            
-            if result.returncode == 0:
-                return True, "Bot executado com sucesso!"
-            else:
-                return False, f"Erro: {result.stderr}"
-                
+            process = BotProcess(command, cwd=".")
         except Exception as e:
             return False, f"Erro ao executar: {e}"
+        
+        progress = ProgressLog()
+        cancel_deadline = None
+        stdscr.timeout(100)  # getch não bloqueia: a tela atualiza a cada 100 ms
+        try:
+            while not process.finished():
+                progress.feed(process.drain())
+                self.draw_progress(stdscr, progress, process.cancelled)
+                try:
+                    key = stdscr.getch()
+                except KeyboardInterrupt:
+                    key = ord('c')  # Ctrl+C na TUI também cancela o bot
+                
+                if key in (ord('c'), ord('C')) and not process.cancelled:
+                    process.cancel()
+                    cancel_deadline = time.monotonic() + CANCEL_TIMEOUT
+                if cancel_deadline and time.monotonic() > cancel_deadline:
+                    process.kill()
+            progress.feed(process.drain())
+        finally:
+            stdscr.timeout(-1)
+        
+        state = progress.state
+        if process.cancelled:
+            return False, f"Execução cancelada ({state.invites_sent} convites enviados)"
+        if process.returncode == 0 and not state.error:
+            return True, f"Concluído: {state.invites_sent} convites enviados" + (" (daemon)" if attached else "")
+        return False, f"Erro: {state.error or (progress.tail[-1] if progress.tail else process.returncode)}"
     
     def main_screen(self, stdscr):
         """Tela principal"""
@@ -314,12 +341,8 @@ class TechRecruiterLocationTUI:
                         stdscr.addstr(height - 1, 2, "Configuracao salva! Pressione qualquer tecla...")
                         stdscr.getch()
                 elif key == curses.KEY_F5:
-                    # Executa bot
-                    if height > 10:
-                        stdscr.addstr(height - 1, 2, "Executando bot...")
-                        stdscr.refresh()
-                    
-                    success, message = self.execute_bot()
+                    # Executa bot (com progresso ao vivo)
+                    success, message = self.execute_bot(stdscr)
                     
                     # Mostra resultado
                     try:
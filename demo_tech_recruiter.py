@@ -10,20 +10,8 @@ import os
 # Adiciona o diretório scripts ao path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'scripts'))
 
-# Palavras-chave para identificar Tech Recruiters
-TECH_RECRUITER_KEYWORDS = [
-    "tech recruiter", "technical recruiter", "talent acquisition", 
-    "recruitment specialist", "headhunter", "talent hunter",
-    "recruiter", "hr specialist", "human resources"
-]
-
-def is_tech_recruiter(profile_text):
-    """Verifica se o perfil é de um tech recruiter baseado nas palavras-chave"""
-    if not profile_text:
-        return False
-    
-    profile_text_lower = profile_text.lower()
-    return any(keyword in profile_text_lower for keyword in TECH_RECRUITER_KEYWORDS)
+# Classificador compartilhado com os bots
+from recruiter_matcher import classify_many
 
 def test_tech_recruiter_filter():
     """Testa o filtro de Tech Recruiters"""
@@ -47,8 +35,9 @@ def test_tech_recruiter_filter():
     
     tech_recruiters_encontrados = []
     
-    for perfil in perfis_teste:
-        if is_tech_recruiter(perfil):
+    # Classifica todos os perfis de uma vez
+    for perfil, is_recruiter in zip(perfis_teste, classify_many(perfis_teste)):
+        if is_recruiter:
             tech_recruiters_encontrados.append(perfil)
             print(f"✅ TECH RECRUITER: {perfil}")
         else:
@@ -55,6 +55,6 @@ echo ""
 echo "📁 Arquivos criados:"
 echo "• config_location.json - Suas configurações"
 echo "• AccountLog.txt - Log de conexões"
-echo "• connections.json - Histórico de conexões"
+echo "• seen_profiles.bin - Perfis já convidados"
 echo ""
 echo "🎯 Boa caçada de Tech Recruiters!"
\ No newline at end of file
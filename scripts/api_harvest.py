@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Coleta de candidatos direto das respostas JSON da busca do LinkedIn (nodriver + CDP)
+Não depende da renderização nem das classes CSS; cai para a extração do DOM se nada casar
+"""
+
+import asyncio
+import base64
+import json
+
+try:
+    import nodriver as uc
+except ImportError:
+    uc = None
+
+from card_extractor import extract_cards_async
+
+# Trechos de URL das chamadas que alimentam a página de busca de pessoas
+SEARCH_API_MARKERS = (
+    "/voyager/api/search/",
+    "voyagerSearchDashClusters",
+    "searchDashClustersByAll",
+)
+
+
+def is_search_response(url):
+    return any(marker in url for marker in SEARCH_API_MARKERS)
+
+
+def _text(value):
+    if isinstance(value, dict):
+        return (value.get("text") or "").strip()
+    if isinstance(value, str):
+        return value.strip()
+    return ""
+
+
+def _walk(node):
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value)
+
+
+def parse_search_payload(payload):
+    """Candidatos (no mesmo formato do card_extractor) encontrados em um JSON da busca
+
+    Funciona com o formato normalizado ('included') e com o GraphQL ('data'),
+    porque procura qualquer objeto com navigationUrl de perfil e título.
+    """
+    cards = []
+    seen_urls = set()
+    for node in _walk(payload):
+        url = node.get("navigationUrl")
+        if not isinstance(url, str) or "/in/" not in url or "title" not in node:
+            continue
+        url = url.split("?")[0]
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
+        cards.append({
+            "index": None,
+            "name": _text(node.get("title")),
+            "url": url,
+            "subtitle": _text(node.get("primarySubtitle")),
+            "location": _text(node.get("secondarySubtitle")),
+            "button_state": "unknown",
+        })
+    return cards
+
+
+class SearchResponseCollector:
+    """Escuta Network.responseReceived e lê o corpo das respostas da busca
+
+    Os handlers são registrados uma vez por aba e só desligados por uma flag: no nodriver,
+    remove_handler apaga todos os handlers do evento, inclusive o contador do modo leve.
+    """
+
+    def __init__(self, tab):
+        self.tab = tab
+        self.pending = {}
+        self.tasks = []
+        self.cards = []
+        self.active = False
+        self.registered = False
+
+    @classmethod
+    def for_tab(cls, tab):
+        """O coletor da aba (criado na primeira busca e reaproveitado nas seguintes)"""
+        collector = getattr(tab, "_search_collector", None)
+        if collector is None:
+            collector = cls(tab)
+            tab._search_collector = collector
+        return collector
+
+    async def start(self):
+        await self.tab.send(uc.cdp.network.enable())
+        if not self.registered:
+            self.tab.add_handler(uc.cdp.network.ResponseReceived, self._on_response)
+            self.tab.add_handler(uc.cdp.network.LoadingFinished, self._on_finished)
+            self.registered = True
+        self.pending = {}
+        self.active = True
+        return self
+
+    def stop(self):
+        self.active = False
+        self.pending = {}
+
+    async def _on_response(self, event):
+        if self.active and is_search_response(event.response.url):
+            self.pending[event.request_id] = event.response.url
+
+    async def _on_finished(self, event):
+        # O corpo só fica disponível depois do loadingFinished
+        if self.active and event.request_id in self.pending:
+            self.tasks.append(asyncio.ensure_future(self._read_body(self.pending.pop(event.request_id), event.request_id)))
+
+    async def _read_body(self, url, request_id):
+        try:
+            body, is_base64 = await self.tab.send(uc.cdp.network.get_response_body(request_id))
+            if is_base64:
+                body = base64.b64decode(body).decode("utf-8", errors="replace")
+            self.cards.extend(parse_search_payload(json.loads(body)))
+        except Exception as e:
+            print(f"Erro ao ler resposta da busca ({url[:60]}): {e}")
+
+    async def collect(self, timeout=15):
+        """Espera a primeira resposta útil (ou o timeout) e devolve os candidatos"""
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline and not self.cards:
+            if self.tasks:
+                await asyncio.gather(*self.tasks)
+                self.tasks = []
+            else:
+                await asyncio.sleep(0.1)
+        if self.tasks:
+            await asyncio.gather(*self.tasks)
+            self.tasks = []
+
+        cards, seen_urls = [], set()
+        for card in self.cards:
+            if card["url"] not in seen_urls:
+                seen_urls.add(card["url"])
+                cards.append(card)
+        self.cards = []
+        return cards
+
+
+async def harvest_search_page(browser, url, timeout=15, tab=None):
+    """Abre a busca e devolve (tab, cards) vindos da API; sem payload, usa o DOM"""
+    if tab is None:
+        tab = await browser.get("about:blank")
+    collector = await SearchResponseCollector.for_tab(tab).start()
+    try:
+        await tab.get(url)
+        cards = await collector.collect(timeout)
+    finally:
+        collector.stop()
+
+    if cards:
+        print(f"📡 {len(cards)} candidatos lidos da API de busca")
+        return tab, cards
+
+    print("📄 Nenhuma resposta da API reconhecida, extraindo do DOM")
+    try:
+        await tab.wait_for(selector="div[class*='entity-result']", timeout=timeout)
+    except Exception:
+        pass
+    return tab, await extract_cards_async(tab)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Configuração única do bot por localização (config_location.json)
+Um esquema com tipos, padrões e limites; o arquivo é validado uma vez, guardado em cache
+pelo mtime e recarregado quando muda (bots longos pegam termos e limites novos sem reiniciar)
+"""
+
+import json
+import os
+
+from negative_cache import DEFAULT_TTL_DAYS
+
+CONFIG_FILE = "config_location.json"
+
+# (campo, tipo, padrão, mínimo para números)
+SCHEMA = (
+    ("location", str, "", None),
+    ("companies", list, [], None),
+    ("search_terms", list, ["tech recruiter", "recrutador", "talent acquisition"], None),
+    ("max_daily_connections", int, 15, 0),
+    ("max_weekly_connections", int, 100, 0),
+    ("negative_cache_days", int, DEFAULT_TTL_DAYS, 1),
+    ("location_aliases", dict, {}, None),
+    ("include_remote", bool, False, None),
+    ("company_aliases", dict, {}, None),
+    ("harvest_locations", list, [], None),
+    ("harvest_max_pages", int, 10, 1),
+    ("harvest_concurrency", int, 3, 1),
+)
+
+FIELDS = {name: (kind, default, minimum) for name, kind, default, minimum in SCHEMA}
+DEFAULT_CONFIG = {name: default for name, _, default, _ in SCHEMA}
+
+_TRUE = {"1", "true", "sim", "yes", "s", "y"}
+_FALSE = {"0", "false", "nao", "não", "no", "n", ""}
+
+
+class ConfigError(ValueError):
+    """Valor que não pode ser convertido para o tipo do campo"""
+
+
+def coerce(name, value):
+    """Converte o valor para o tipo do campo (aceita o texto digitado na TUI)"""
+    kind, _, minimum = FIELDS[name]
+    try:
+        if kind is bool:
+            if isinstance(value, str):
+                if value.strip().lower() not in _TRUE | _FALSE:
+                    raise ValueError(value)
+                value = value.strip().lower() in _TRUE
+            return bool(value)
+        if kind is int:
+            if isinstance(value, bool):
+                raise ValueError(value)
+            value = int(str(value).strip()) if isinstance(value, str) else int(value)
+            if minimum is not None and value < minimum:
+                raise ValueError(f"mínimo {minimum}")
+            return value
+        if kind is list:
+            if isinstance(value, str):
+                value = value.split(',')
+            if not isinstance(value, (list, tuple)):
+                raise ValueError(value)
+            return [str(item).strip() for item in value if str(item).strip()]
+        if kind is dict:
+            if not isinstance(value, dict):
+                raise ValueError(value)
+            return {str(k): v for k, v in value.items()}
+        if not isinstance(value, str):
+            raise ValueError(value)
+        return value.strip()
+    except (TypeError, ValueError) as e:
+        raise ConfigError(f"{name}: {value!r} não é um {kind.__name__} válido ({e})") from None
+
+
+class BotConfig:
+    """Config validado; campos como atributos e também config["campo"] / config.get()"""
+
+    def __init__(self, values=None, extra=None):
+        values = values or {}
+        for name, (_, default, _) in FIELDS.items():
+            setattr(self, name, values.get(name, _copy(default)))
+        # Chaves desconhecidas são preservadas para não se perderem ao salvar
+        self.extra = dict(extra or {})
+        self.errors = []
+        # Campos que vieram do arquivo ou foram editados; os outros não são gravados
+        self.present = {name for name in values if name in FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Valida cada campo; um valor inválido vira o padrão e fica em `errors`"""
+        values, errors = {}, []
+        for name, value in data.items():
+            if name not in FIELDS:
+                continue
+            try:
+                values[name] = coerce(name, value)
+            except ConfigError as e:
+                errors.append(str(e))
+        config = cls(values, {k: v for k, v in data.items() if k not in FIELDS})
+        config.errors = errors
+        config.present.update(name for name in data if name in FIELDS)
+        return config
+
+    def copy(self):
+        config = BotConfig({name: _copy(getattr(self, name)) for name in FIELDS}, self.extra)
+        config.errors = list(self.errors)
+        config.present = set(self.present)
+        return config
+
+    def set_field(self, name, value):
+        """Atualiza um campo com conversão de tipo; levanta ConfigError se inválido"""
+        if name not in FIELDS:
+            raise ConfigError(f"campo desconhecido: {name}")
+        setattr(self, name, coerce(name, value))
+        self.present.add(name)
+
+    def to_dict(self):
+        data = dict(self.extra)
+        data.update({name: getattr(self, name) for name in FIELDS})
+        return data
+
+    def file_dict(self):
+        """O que vai para o arquivo: campos do usuário e os diferentes do padrão (o resto vem do SCHEMA)"""
+        data = dict(self.extra)
+        data.update({
+            name: getattr(self, name) for name, (_, default, _) in FIELDS.items()
+            if name in self.present or getattr(self, name) != default
+        })
+        return data
+
+    def __getitem__(self, name):
+        if name in FIELDS:
+            return getattr(self, name)
+        return self.extra[name]
+
+    def __setitem__(self, name, value):
+        self.set_field(name, value)
+
+    def __contains__(self, name):
+        return name in FIELDS or name in self.extra
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __eq__(self, other):
+        return isinstance(other, BotConfig) and self.to_dict() == other.to_dict()
+
+
+def _copy(value):
+    return type(value)(value) if isinstance(value, (list, dict)) else value
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+# Cache por processo: (caminho) -> (mtime, BotConfig)
+_cache = {}
+
+
+def load_config(path=CONFIG_FILE):
+    """Config do arquivo (ou os padrões); só relê o disco quando o mtime muda
+
+    Devolve sempre uma cópia: edições não salvas (TUI) não vazam para o cache do processo.
+    """
+    mtime = _mtime(path)
+    cached = _cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1].copy()
+
+    data = {}
+    if mtime is not None:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("o arquivo precisa conter um objeto JSON")
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar config: {e}")
+            data = {}
+
+    config = BotConfig.from_dict(data)
+    for error in config.errors:
+        print(f"⚠️ Config inválido, usando o padrão para {error}")
+    _cache[path] = (mtime, config)
+    return config.copy()
+
+
+def save_config(config, path=CONFIG_FILE):
+    """Grava o config de forma atômica e atualiza o cache"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(config.file_dict(), f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    _cache[path] = (_mtime(path), config.copy())
+
+
+def connection_limits(path=CONFIG_FILE):
+    """(max_daily, max_weekly) da conta; todos os bots reservam no ledger com estes limites"""
+    config = load_config(path)
+    return config.max_daily_connections, config.max_weekly_connections
+
+
+class ConfigWatcher:
+    """Acompanha o mtime do arquivo; refresh() recarrega quando ele foi editado"""
+
+    def __init__(self, path=CONFIG_FILE):
+        self.path = path
+        self.mtime = _mtime(path)
+        self.config = load_config(path)
+
+    def refresh(self):
+        """True se o arquivo foi editado e `config` mudou"""
+        mtime = _mtime(self.path)
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        config = load_config(self.path)
+        changed = config != self.config
+        self.config = config
+        if changed:
+            print(f"🔄 Config recarregado de {self.path}")
+        return changed
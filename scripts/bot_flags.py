@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Flags opcionais de linha de comando para os bots que leem argumentos posicionais
+(caminho do navegador, perfil, LoggedIn); a flag é removida do sys.argv antes da leitura
+"""
+
+import sys
+
+
+def pop_flag(name, argv=None):
+    """Remove a flag (ex.: "--lean") do argv e retorna se ela estava presente"""
+    argv = sys.argv if argv is None else argv
+    if name not in argv:
+        return False
+    while name in argv:
+        argv.remove(name)
+    return True
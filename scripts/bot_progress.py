@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Progresso ao vivo do bot para a TUI
+O bot escreve eventos em JSON no stdout (linhas "@@event {...}"), só quando rodado pela TUI;
+a TUI lê o pipe em uma thread, atualiza a tela sem bloquear e pode cancelar a execução
+"""
+
+import json
+import os
+import platform
+import queue
+import signal
+import subprocess
+import threading
+from collections import deque
+
+EVENT_PREFIX = "@@event "
+# A TUI liga esta variável; rodando direto no terminal o bot não polui a saída
+PROGRESS_ENV = "BOT_PROGRESS_EVENTS"
+
+
+def emit(event, **fields):
+    """Publica um evento de progresso (page, quota, invite, done, error...)"""
+    if not os.environ.get(PROGRESS_ENV):
+        return
+    print(EVENT_PREFIX + json.dumps(dict(fields, event=event), ensure_ascii=False), flush=True)
+
+
+def parse_event(line):
+    """Evento de uma linha do stdout do bot, ou None para linhas comuns"""
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        event = json.loads(line[len(EVENT_PREFIX):])
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) and "event" in event else None
+
+
+def install_cancel_handler():
+    """No Windows o cancelamento chega como CTRL_BREAK; trata como Ctrl+C (KeyboardInterrupt)"""
+    if hasattr(signal, "SIGBREAK"):
+        signal.signal(signal.SIGBREAK, signal.default_int_handler)
+
+
+class ProgressState:
+    """Totais da execução, montados a partir dos eventos"""
+
+    def __init__(self):
+        self.status = "iniciando"
+        self.page = 0
+        self.cards_seen = 0
+        self.matches = 0
+        self.invites_sent = 0
+        self.queued = 0
+        self.quota_left = None
+        self.last_invite = ""
+        self.error = ""
+
+    def apply(self, event):
+        kind = event["event"]
+        if kind == "start":
+            self.status = event.get("mode", "executando")
+        elif kind == "quota":
+            self.quota_left = event.get("quota_left")
+        elif kind == "page":
+            self.page = event.get("page", self.page)
+            self.cards_seen += event.get("cards", 0)
+            self.matches += event.get("matches", 0)
+            self.queued += event.get("queued", 0)
+        elif kind == "invite":
+            self.invites_sent += 1
+            self.last_invite = event.get("name", "")
+            self.quota_left = event.get("quota_left", self.quota_left)
+        elif kind == "error":
+            self.error = event.get("message", "")
+        elif kind in ("done", "cancelled"):
+            self.status = "concluído" if kind == "done" else "cancelado"
+
+    def lines(self):
+        quota = "-" if self.quota_left is None else self.quota_left
+        lines = [
+            f"Status: {self.status}",
+            f"Página: {self.page}   Cards vistos: {self.cards_seen}   Candidatos: {self.matches}",
+            f"Convites enviados: {self.invites_sent}   Cota restante: {quota}   Enfileirados: {self.queued}",
+        ]
+        if self.last_invite:
+            lines.append(f"Último convite: {self.last_invite}")
+        if self.error:
+            lines.append(f"Erro: {self.error}")
+        return lines
+
+
+class BotProcess:
+    """Bot em um subprocesso; as linhas do stdout chegam por uma fila, sem bloquear a tela"""
+
+    def __init__(self, command, cwd="."):
+        env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+        env[PROGRESS_ENV] = "1"
+        # Grupo de processos próprio: o sinal de cancelamento não atinge a TUI
+        if platform.system() == "Windows":
+            group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {"start_new_session": True}
+        self.process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            **group,
+        )
+        self.lines = queue.Queue()
+        self.cancelled = False
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.lines.put(line.rstrip("\n"))
+        self.process.stdout.close()
+
+    def drain(self):
+        """Linhas recebidas desde a última chamada"""
+        lines = []
+        while True:
+            try:
+                lines.append(self.lines.get_nowait())
+            except queue.Empty:
+                return lines
+
+    def running(self):
+        return self.process.poll() is None
+
+    def finished(self):
+        """Processo encerrado e todo o stdout já lido"""
+        return not self.running() and not self.reader.is_alive() and self.lines.empty()
+
+    def cancel(self):
+        """Pede a parada (Ctrl+C no bot): ele fecha o navegador e libera a cota no finally"""
+        if not self.running():
+            return
+        self.cancelled = True
+        if platform.system() == "Windows":
+            self.process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            self.process.send_signal(signal.SIGINT)
+
+    def kill(self):
+        """Encerra à força o bot e tudo que ele abriu (chromedriver, Chrome) no mesmo grupo"""
+        if not self.running():
+            return
+        if platform.system() == "Windows":
+            subprocess.run(
+                ["taskkill", "/T", "/F", "/PID", str(self.process.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            try:
+                # start_new_session: o grupo do bot tem o id do próprio processo
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    @property
+    def returncode(self):
+        return self.process.returncode
+
+
+class ProgressLog:
+    """Estado + últimas linhas de log, alimentados pelas linhas do bot"""
+
+    def __init__(self, tail=200):
+        self.state = ProgressState()
+        self.tail = deque(maxlen=tail)
+
+    def feed(self, lines):
+        for line in lines:
+            event = parse_event(line)
+            if event:
+                self.state.apply(event)
+            elif line.strip():
+                self.tail.append(line)
@@ -2,7 +2,6 @@
 import datetime
 import os
 import sys
-import time
 import platform
 from random import *
 from random import randint, random
@@ -10,17 +9,34 @@ from random import randint, random
 import nodriver as uc
 from nodriver import *
 
+from api_harvest import harvest_search_page
+from bot_config import connection_limits
+from bot_flags import pop_flag
+from browser_daemon import start_nodriver
+from browser_presets import RssSampler, nodriver_pid
+from card_extractor import action_selector, extract_cards_async
+from invite_modal import (
+    ADD_NOTE, DISMISS, EMAIL_REQUIRED, LIMIT_REACHED, NOTE_FIELD, SEND, SEND_WITHOUT_NOTE, SENT,
+    click_modal_async, modal_selector, resolve_modal_async,
+)
+from lean_mode import enable_lean_nodriver
+from log_compaction import compact_account_log
+from pacing import human_pause
+from quota_ledger import QuotaLedger
+from recruiter_matcher import classify_many
+from seen_profiles import SeenProfiles, canonical_profile_id
+
 # Configurações do bot
-TECH_RECRUITER_KEYWORDS = [
-    "tech recruiter", "technical recruiter", "talent acquisition", 
-    "recruitment specialist", "headhunter", "talent hunter",
-    "recruiter", "hr specialist", "human resources"
-]
+SEARCH_URL = "https://www.linkedin.com/search/results/people/?keywords=tech%20recruiter&network=%5B%22S%22%5D"
 
 DEFAULT_MESSAGE = """Olá! Sou desenvolvedor de software em busca de novas oportunidades na área de tecnologia. 
 Estou aberto a vagas de desenvolvimento web, mobile e backend. 
 Seria um prazer me conectar e explorar possíveis oportunidades."""
 
+HEADLESS = pop_flag("--headless")  # --headless: sem janela, preset de baixo consumo
+ATTACH = pop_flag("--attach")  # --attach: usa o navegador do daemon se estiver ativo
+LEAN = pop_flag("--lean")  # --lean: bloqueia imagens, fontes e rastreadores
+
 if len(sys.argv) > 4:
     browserPath = sys.argv[1]
     profilePath = sys.argv[2]
@@ -50,161 +66,128 @@ else:
     customMessage = DEFAULT_MESSAGE
 
 
-def is_tech_recruiter(profile_text):
-    """Verifica se o perfil é de um tech recruiter baseado nas palavras-chave"""
-    if not profile_text:
-        return False
-    
-    profile_text_lower = profile_text.lower()
-    return any(keyword in profile_text_lower for keyword in TECH_RECRUITER_KEYWORDS)
-
-
 async def send_connection_request(tab, connect_button, message):
     """Envia solicitação de conexão com mensagem personalizada"""
     try:
         # Clica no botão de conectar
         await connect_button.click()
-        time.sleep(2 + 3 * random())
-        
-        # Procura pelo botão "Add a note" ou similar
-        add_note_button = await tab.find("Add a note", timeout=10)
-        if add_note_button:
-            await add_note_button.click()
-            time.sleep(1 + 2 * random())
-            
-            # Procura pelo campo de texto da mensagem
-            message_field = await tab.find("custom-message", timeout=10)
-            if message_field:
+        await human_pause(2, 3)
+
+        # Observa todas as variantes do modal ao mesmo tempo (a primeira que aparecer vence)
+        state = await resolve_modal_async(
+            tab, [ADD_NOTE, SEND_WITHOUT_NOTE, SEND, EMAIL_REQUIRED, LIMIT_REACHED, SENT], timeout=10
+        )
+        if state == ADD_NOTE:
+            await click_modal_async(tab, ADD_NOTE)
+            await human_pause(1, 2)
+
+            # Campo de texto da mensagem
+            if await resolve_modal_async(tab, [NOTE_FIELD], timeout=10) == NOTE_FIELD:
+                message_field = await tab.select(modal_selector(NOTE_FIELD), timeout=5)
                 await message_field.send_keys(message)
-                time.sleep(1 + 2 * random())
-                
+                await human_pause(1, 2)
+
                 # Envia a solicitação
-                send_button = await tab.find("Send invitation", timeout=10)
-                if send_button:
-                    await send_button.click()
+                if await resolve_modal_async(tab, [SEND], timeout=10) == SEND:
+                    await click_modal_async(tab, SEND)
                     return True
-        
-        # Se não conseguir adicionar mensagem, envia sem mensagem
-        send_button = await tab.find("Send without note", timeout=5)
-        if send_button:
-            await send_button.click()
+
+            # Se não conseguir adicionar mensagem, envia sem mensagem
+            state = await resolve_modal_async(tab, [SEND_WITHOUT_NOTE, SEND], timeout=5)
+
+        if state in (SEND_WITHOUT_NOTE, SEND):
+            await click_modal_async(tab, state)
             return True
-            
+        if state == SENT:
+            return True
+
+        if state in (EMAIL_REQUIRED, LIMIT_REACHED):
+            print(f"Convite bloqueado pelo modal: {state}")
+            if await resolve_modal_async(tab, [DISMISS], timeout=2) == DISMISS:
+                await click_modal_async(tab, DISMISS)
         return False
     except Exception as e:
         print(f"Erro ao enviar solicitação: {e}")
         return False
 
 
-async def get_profile_info(tab, profile_element):
-    """Obtém informações do perfil para verificar se é tech recruiter"""
-    try:
-        # Tenta encontrar o título/cargo da pessoa
-        title_element = await profile_element.find("span[class*='entity-result__title-text']", timeout=5)
-        if title_element:
-            title_text = await title_element.get_text()
-            return title_text
-        return ""
-    except:
-        return ""
-
-
 async def main():
     current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-    total_accounts = 0
     tech_recruiters_connected = 0
     Skip = 0
 
-    if not os.path.exists("AccountLog.txt"):
-        open("AccountLog.txt", "w").close()
-
-    with open("AccountLog.txt", "r") as log_file:
-        for line in log_file:
-            if " on " not in line:
-                continue
-            parts = line.strip().split(" on ")
-            if len(parts) < 2:
-                continue
-            accounts_part = parts[0]
-            date_part = parts[1]
-
-            try:
-                accounts_count = int(accounts_part.split(": ")[1])
-            except (IndexError, ValueError):
-                continue
-
-            try:
-                log_date = datetime.datetime.strptime(date_part, "%Y-%m-%d")
-            except ValueError:
-                continue
-
-            if log_date >= datetime.datetime.now() - datetime.timedelta(days=7):
-                total_accounts += accounts_count
-
-    if total_accounts >= 100:
+    ledger = QuotaLedger()
+    total_accounts = ledger.sent_last_7_days()
+    max_daily, max_weekly = connection_limits()
+
+    if total_accounts >= max_weekly:
+        Skip = 1
+        print("Total de contas esta semana: " + str(total_accounts))
+
+    if ledger.has_run_today():
         Skip = 1
+        print(
+            "A data atual ("
+            + current_date
+            + ") já está no arquivo de log."
+        )
         print("Total de contas esta semana: " + str(total_accounts))
 
-    with open("AccountLog.txt", "r") as log_file:
-        for line in log_file:
-            if current_date in line:
-                Skip = 1
-                print(
-                    "A data atual ("
-                    + current_date
-                    + ") já está no arquivo de log."
-                )
-                print("Total de contas esta semana: " + str(total_accounts))
+    if not Skip:
+        # Reserva as vagas antes de abrir o navegador (cota compartilhada)
+        reservation = ledger.reserve(15, max_daily=max_daily, max_weekly=max_weekly)
+        if not reservation:
+            Skip = 1
+            print("Cota compartilhada esgotada por outros bots.")
 
     if not Skip:
+        seen = SeenProfiles()
         x = 0
         y = 0
+        lean_stats = None
+        rss = None
         try:
-            driver = await uc.start(
-                headless=False,
-                browser_executable_path=browserPath,
-                user_data_dir=profilePath,
-                browser_args=[
-                    f"--window-size={randint(500, 1920)},{randint(500, 1080)}",
-                ],
-            )
-
-            # Navega para a página de network com filtros de busca
-            tab = await driver.get("https://www.linkedin.com/search/results/people/?keywords=tech%20recruiter&network=%5B%22S%22%5D")
-            
+            driver, attached = await start_nodriver(browserPath, profilePath, HEADLESS, ATTACH)
+            rss = RssSampler(nodriver_pid(driver)).start()
+
             if LoggedIn:
-                await driver.wait(time=random())  # Pausa aleatória
+                # Lê os candidatos direto das respostas da API de busca (ou do DOM, sem payload)
+                tab = await driver.get("about:blank", new_tab=attached)
+                if LEAN:
+                    lean_stats = await enable_lean_nodriver(tab)
+                tab, cards = await harvest_search_page(driver, SEARCH_URL, timeout=25, tab=tab)
+                await human_pause(0, 1)  # Pausa aleatória
                 
-                # Aguarda os resultados da busca carregarem
-                await tab.wait_for_element("div[class*='entity-result']", timeout=25)
+                print(f"Encontrados {len(cards)} perfis")
                 
-                # Rola a página para carregar mais resultados
-                while y < 5:  # Limita o número de scrolls
-                    await tab.scroll_down(500)
-                    time.sleep(2 + 3 * random())
-                    y += 1
-
-                # Encontra todos os cards de perfil
-                profile_cards = await tab.find_all("div[class*='entity-result__item']", timeout=25)
+                # Perfis já convidados em execuções anteriores são ignorados
+                cards = [card for card in cards if not (card["url"] and card["url"] in seen)]
+                recruiter_flags = classify_many([f"{card['name']} {card['subtitle']}" for card in cards])
+                matches = [card for card, is_recruiter in zip(cards, recruiter_flags) if is_recruiter]
                 
-                print(f"Encontrados {len(profile_cards)} perfis")
+                if matches and matches[0]["index"] is None:
+                    # Vieram da API: os botões só existem no DOM, então rola a página e associa pela URL
+                    while y < 5:  # Limita o número de scrolls
+                        await tab.scroll_down(500)
+                        await human_pause(2, 3)
+                        y += 1
+                    dom_cards = {canonical_profile_id(card["url"]): card for card in await extract_cards_async(tab)}
+                    matches = [
+                        dom_cards[canonical_profile_id(card["url"])]
+                        for card in matches
+                        if canonical_profile_id(card["url"]) in dom_cards
+                    ]
                 
-                for card in profile_cards:
-                    if x >= 15:  # Limite de conexões por execução
+                for card in matches:
+                    if x >= reservation.slots:  # Limite de conexões por execução
                         break
                     
                     try:
-                        # Obtém informações do perfil
-                        profile_info = await get_profile_info(tab, card)
-                        
-                        # Verifica se é tech recruiter
-                        if is_tech_recruiter(profile_info):
-                            print(f"Tech Recruiter encontrado: {profile_info}")
+                        # Tech recruiter com botão de conectar no card
+                        if card["button_state"] == "connect":
+                            print(f"Tech Recruiter encontrado: {card['name']} | {card['subtitle']}")
                             
-                            # Procura o botão de conectar neste card
-                            connect_button = await card.find("button[aria-label*='Connect']", timeout=5)
-                            if not connect_button:
-                                connect_button = await card.find("button[aria-label*='Invite']", timeout=5)
+                            connect_button = await tab.select(action_selector(card), timeout=5)
                             
                             if connect_button:
                                 await connect_button.scroll_into_view()
@@ -212,30 +195,39 @@ async def main():
                                 # Envia solicitação com mensagem
                                 if await send_connection_request(tab, connect_button, customMessage):
                                     tech_recruiters_connected += 1
+                                    seen.add(card["url"])
                                     print(f"Conectado com Tech Recruiter #{tech_recruiters_connected}")
                                 
-                                time.sleep(3 + 5 * random())
+                                await human_pause(3, 5)
                                 x += 1
                         
                     except Exception as e:
                         print(f"Erro ao processar perfil: {e}")
                         continue
 
-                with open("AccountLog.txt", "a") as log_file:
-                    log_file.write(f"Tech Recruiters connected: {tech_recruiters_connected} on {current_date}\n")
+                ledger.log_summary("Tech Recruiters connected", tech_recruiters_connected, reservation)
 
                 print(f"Total de Tech Recruiters conectados: {tech_recruiters_connected}")
                 await tab.close()
             else:
+                tab = await driver.get(SEARCH_URL, new_tab=attached)
                 input("Pressione Enter para continuar...")
                 await tab.close()
         except Exception as e:
             print(e)
             if tech_recruiters_connected > 0:
-                with open("AccountLog.txt", "a") as log_file:
-                    log_file.write(f"Tech Recruiters connected: {tech_recruiters_connected} on {current_date}\n")
+                ledger.log_summary("Tech Recruiters connected", tech_recruiters_connected, reservation)
             if 'tab' in locals():
                 await tab.close()
+        finally:
+            reservation.release()
+            seen.close()
+            if lean_stats:
+                print(lean_stats.summary())
+            if rss:
+                rss.stop("bot_tech_recruiters.py")
+
+    compact_account_log()
 
 
 if __name__ == "__main__":
@@ -4,20 +4,38 @@ LinkedIn Tech Recruiter Bot - Localização e Empresas
 Automatiza conexões com Tech Recruiters considerando localização e empresas desejadas
 """
 
+import argparse
 import os
-import time
-import random
-import json
-from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import platform
 
+from bot_config import CONFIG_FILE, ConfigWatcher, save_config
+from bot_progress import emit, install_cancel_handler
+from browser_daemon import DEFAULT_PROFILE_DIRECTORY, attach_selenium_options
+from browser_presets import RssSampler, apply_headless_options, selenium_pid
+from candidate_filter import CandidateFilter
+from candidate_queue import CandidateQueue
+from card_extractor import action_selector
+from company_matcher import CompanyMatcher
+from driver_resolver import resolve_chromedriver
+from invite_modal import DISMISS, EMAIL_REQUIRED, LIMIT_REACHED, SEND, SEND_WITHOUT_NOTE, SENT, click_modal, resolve_modal
+from lean_mode import apply_lean_selenium, collect_selenium_stats, enable_lean_options, enable_lean_selenium
+from location_index import load_location_index
+from log_compaction import compact_account_log
+from negative_cache import NegativeCache, unconnectable_reason
+from pacing import pause
+from page_readiness import selector_present, use_eager_page_load, wait_ready
+from quota_ledger import QuotaLedger
+from recruiter_matcher import is_tech_recruiter
+from search_paginator import SearchPaginator
+from seen_profiles import SeenProfiles
+
 class TechRecruiterLocationBot:
     def __init__(self):
         self.setup_paths()
@@ -39,178 +57,188 @@ class TechRecruiterLocationBot:
             
         # Arquivos de log
         self.log_file = "AccountLog.txt"
-        self.connections_file = "connections.json"
+        self.seen_file = "seen_profiles.bin"
+        self.seen = SeenProfiles(self.seen_file)
+        self.ledger = QuotaLedger(log_file=self.log_file)
+        self.reservation = None
+        self.profile_handle = None
+        self.lean = False
         
     def setup_config(self):
         """Carrega configurações de localização e empresas"""
-        self.config_file = "config_location.json"
-        self.config = self.load_config()
-        
-    def load_config(self):
-        """Carrega configurações salvas"""
-        default_config = {
-            "location": "",
-            "companies": [],
-            "search_terms": ["tech recruiter", "recrutador", "talent acquisition"],
-            "max_daily_connections": 15,
-            "max_weekly_connections": 100
-        }
+        self.config_file = CONFIG_FILE
+        self.config_watcher = ConfigWatcher(self.config_file)
+        self.config = self.config_watcher.config
+        self.negative_cache = NegativeCache(ttl_days=self.config["negative_cache_days"])
+        self.apply_config()
+        self.queue = CandidateQueue()
         
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge com config padrão
-                    for key, value in default_config.items():
-                        if key not in loaded_config:
-                            loaded_config[key] = value
-                    return loaded_config
-        except Exception as e:
-            print(f"Erro ao carregar config: {e}")
-            
-        return default_config
+    def apply_config(self):
+        """Monta os filtros a partir do config atual"""
+        self.negative_cache.ttl_days = self.config["negative_cache_days"]
+        self.location_index = load_location_index(self.config)
+        self.company_matcher = CompanyMatcher.from_config(self.config)
+        self.candidate_filter = CandidateFilter(
+            self.config, self.seen, self.negative_cache, self.location_index, self.company_matcher
+        )
+    
+    def refresh_config(self):
+        """Recarrega o config se o arquivo foi editado durante a execução"""
+        if not self.config_watcher.refresh():
+            return False
+        self.config = self.config_watcher.config
+        self.apply_config()
+        return True
     
     def save_config(self):
         """Salva configurações"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            save_config(self.config, self.config_file)
             print(f"✅ Config salvo: {self.config_file}")
         except Exception as e:
             print(f"Erro ao salvar config: {e}")
     
-    def setup_driver(self):
-        """Configura o driver do Chrome"""
-        chrome_options = Options()
-        chrome_options.add_argument(f"--user-data-dir={self.profile_path}")
-        chrome_options.add_argument("--profile-directory=Profile 1")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+    def setup_driver(self, lean=False, headless=False, attach=False):
+        """Configura o driver do Chrome (ou conecta ao daemon do navegador com attach)"""
+        chrome_options = attach_selenium_options(Options, self.profile_path) if attach else None
+        attached = chrome_options is not None
+        if not attached:
+            chrome_options = Options()
+            chrome_options.add_argument(f"--user-data-dir={self.profile_path}")
+            chrome_options.add_argument(f"--profile-directory={DEFAULT_PROFILE_DIRECTORY}")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option('useAutomationExtension', False)
+            if headless:
+                apply_headless_options(chrome_options)
+        if lean:
+            enable_lean_options(chrome_options)
+        use_eager_page_load(chrome_options)
         
-        service = Service(ChromeDriverManager().install())
+        # Driver resolvido uma vez por versão do navegador (sem rede nas execuções seguintes)
+        driver_path = resolve_chromedriver(self.chrome_path)
+        service = Service(driver_path) if driver_path else Service()
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.maximize_window()
+        if not headless and not attached:
+            driver.maximize_window()
         
         return driver
     
     def is_tech_recruiter(self, profile_text):
         """Verifica se é Tech Recruiter baseado no texto do perfil"""
-        if not profile_text:
-            return False
-            
-        keywords = [
-            "tech recruiter", "technical recruiter", "recruiter", 
-            "talent acquisition", "talent sourcer", "headhunter",
-            "recrutador", "recrutamento", "contratação", "rh"
-        ]
-        
-        text_lower = profile_text.lower()
-        return any(keyword in text_lower for keyword in keywords)
+        return is_tech_recruiter(profile_text)
     
     def is_from_desired_company(self, company_text):
         """Verifica se é de uma empresa desejada"""
-        if not company_text or not self.config["companies"]:
-            return True  # Se não houver empresas específicas, aceita qualquer uma
-            
-        company_lower = company_text.lower()
-        for company in self.config["companies"]:
-            if company.lower() in company_lower:
-                return True
-        return False
+        return self.candidate_filter.from_desired_company(company_text)
     
     def is_in_location(self, location_text):
         """Verifica se está na localização desejada"""
-        if not location_text or not self.config["location"]:
-            return True  # Se não houver localização específica, aceita qualquer uma
-            
-        location_lower = location_text.lower()
-        config_location = self.config["location"].lower()
-        return config_location in location_lower or location_lower in config_location
+        return self.candidate_filter.in_location(location_text)
     
     def get_connection_stats(self):
         """Obtém estatísticas de conexões do dia/semana"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        week = datetime.now().strftime("%Y-W%U")
-        
-        daily_count = 0
-        weekly_count = 0
-        
-        try:
-            if os.path.exists(self.log_file):
-                with open(self.log_file, 'r') as f:
-                    for line in f:
-                        if today in line and "Conexão enviada" in line:
-                            daily_count += 1
-                        if week in line and "Conexão enviada" in line:
-                            weekly_count += 1
-        except Exception as e:
-            print(f"Erro ao ler logs: {e}")
-            
-        return daily_count, weekly_count
+        return self.ledger.sent_today(), self.ledger.sent_last_7_days()
     
     def log_connection(self, name, profile_url, company, location):
-        """Registra conexão no log"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] Conexão enviada: {name} | {company} | {location} | {profile_url}\n"
-        
+        """Registra conexão no log (o formato da linha fica no QuotaLedger)"""
         try:
-            with open(self.log_file, 'a') as f:
-                f.write(log_entry)
+            self.ledger.log_connection(name, profile_url, company, location, reservation=self.reservation)
             print(f"✅ Log: {name} - {company}")
         except Exception as e:
             print(f"Erro ao salvar log: {e}")
     
+    def confirm_invite(self, driver, profile_url):
+        """Resolve o modal aberto pelo Conectar e envia o convite (sem nota)"""
+        pause(0.5, 1)
+        
+        # Observa todas as variantes do modal ao mesmo tempo (a primeira que aparecer vence)
+        state = resolve_modal(driver, [SEND_WITHOUT_NOTE, SEND, EMAIL_REQUIRED, LIMIT_REACHED, SENT], timeout=5)
+        if state in (SEND_WITHOUT_NOTE, SEND):
+            click_modal(driver, state)
+            pause(1, 1)
+            return True
+        if state == SENT:
+            return True
+        
+        if state == EMAIL_REQUIRED:
+            self.negative_cache.add(profile_url, EMAIL_REQUIRED)
+        print(f"Convite não enviado ({state or 'modal não reconhecido'})")
+        
+        # Fecha o modal para não travar a próxima ação
+        if resolve_modal(driver, [DISMISS], timeout=1) == DISMISS:
+            click_modal(driver, DISMISS)
+        return False
+    
+    def invite_from_card(self, driver, card):
+        """Envia o convite pelo botão Conectar do próprio card da busca (sem abrir o perfil)"""
+        try:
+            connect_button = driver.find_element(By.CSS_SELECTOR, action_selector(card))
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", connect_button)
+            pause(1, 1)
+            driver.execute_script("arguments[0].click();", connect_button)
+            return self.confirm_invite(driver, card["url"])
+        except NoSuchElementException:
+            # O card mudou desde a extração: cai para a visita ao perfil
+            return self.send_connection_request(driver, card["url"])
+        except Exception as e:
+            print(f"Erro ao enviar solicitação pelo card: {e}")
+            return False
+    
+    def profile_tab(self, driver):
+        """Aba reutilizada para visitar perfis (criada uma vez por execução)"""
+        handles = set(driver.window_handles)
+        if self.profile_handle not in handles:
+            driver.execute_script("window.open('about:blank', 'bot-profile');")
+            self.profile_handle = (set(driver.window_handles) - handles).pop()
+            if self.lean:
+                # O modo leve é por aba: aplica na aba nova antes do primeiro perfil
+                current = driver.current_window_handle
+                driver.switch_to.window(self.profile_handle)
+                apply_lean_selenium(driver)
+                driver.switch_to.window(current)
+        return self.profile_handle
+    
     def send_connection_request(self, driver, profile_url):
-        """Envia solicitação de conexão (sem mensagem)"""
+        """Envia solicitação de conexão pelo perfil (sem mensagem), carregando-o uma única vez"""
+        search_handle = driver.current_window_handle
         try:
+            driver.switch_to.window(self.profile_tab(driver))
             driver.get(profile_url)
-            time.sleep(3 + random.random() * 2)
+            wait_ready(driver, selector_present("main button"))
+            pause(1, 1)
             
             # Procura pelo botão "Conectar" ou "Connect"
             try:
                 connect_button = WebDriverWait(driver, 10).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'Conectar') or contains(@aria-label, 'Connect')]"))
                 )
-                
-                # Scroll até o botão
-                driver.execute_script("arguments[0].scrollIntoView(true);", connect_button)
-                time.sleep(1 + random.random())
-                
-                # Clica no botão
-                driver.execute_script("arguments[0].click();", connect_button)
-                time.sleep(2 + random.random() * 2)
-                
-                # Procura pelo botão de enviar (sem nota)
-                try:
-                    send_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'Enviar convite') or contains(@aria-label, 'Send invitation') or contains(@aria-label, 'Send now')]"))
-                    )
-                    send_button.click()
-                    time.sleep(1 + random.random())
-                    return True
-                    
-                except TimeoutException:
-                    # Se não encontrar o botão de enviar, tenta fechar o modal
-                    try:
-                        close_button = driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Dismiss') or contains(@aria-label, 'Fechar')]")
-                        close_button.click()
-                    except:
-                        pass
-                    return False
-                    
             except TimeoutException:
-                print("Botão Conectar não encontrado")
+                # Guarda o motivo para não recarregar este perfil nas próximas execuções
+                reason = unconnectable_reason(driver)
+                self.negative_cache.add(profile_url, reason)
+                print(f"Botão Conectar não encontrado ({reason})")
                 return False
+            
+            # Scroll até o botão
+            driver.execute_script("arguments[0].scrollIntoView(true);", connect_button)
+            pause(1, 1)
+            
+            # Clica no botão
+            driver.execute_script("arguments[0].click();", connect_button)
+            return self.confirm_invite(driver, profile_url)
                 
         except Exception as e:
             print(f"Erro ao enviar solicitação: {e}")
             return False
+        finally:
+            # Volta para a página de busca (a aba de perfis fica aberta para o próximo)
+            driver.switch_to.window(search_handle)
     
-    def search_recruiters(self, driver):
-        """Busca Tech Recruiters no LinkedIn"""
+    def reserve_quota(self):
+        """Confere os limites e reserva as vagas desta execução na cota compartilhada"""
         daily_count, weekly_count = self.get_connection_stats()
         
         print(f"📊 Estatísticas atuais:")
@@ -219,117 +247,160 @@ class TechRecruiterLocationBot:
         
         if daily_count >= self.config['max_daily_connections']:
             print("⚠️ Limite diário atingido!")
-            return
+            return False
             
         if weekly_count >= self.config['max_weekly_connections']:
             print("⚠️ Limite semanal atingido!")
-            return
+            return False
         
-        # Monta a busca
+        # Reserva as vagas na cota compartilhada com outros bots da mesma conta
+        self.reservation = self.ledger.reserve(
+            self.config['max_daily_connections'],
+            self.config['max_daily_connections'],
+            self.config['max_weekly_connections'],
+        )
+        if not self.reservation:
+            print("⚠️ Cota compartilhada esgotada por outros bots!")
+            return False
+        emit("quota", quota_left=self.reservation.slots, daily=daily_count, weekly=weekly_count)
+        return True
+    
+    def build_search_url(self):
+        """Monta a URL da busca a partir dos termos e da localização"""
         search_terms = " OR ".join([f'"{term}"' for term in self.config["search_terms"]])
         location_filter = f' AND "{self.config["location"]}"' if self.config["location"] else ""
         
         search_query = f"({search_terms}){location_filter}"
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={search_query.replace(' ', '%20')}"
-        
         print(f"🔍 Buscando: {search_query}")
-        driver.get(search_url)
-        time.sleep(5)
+        return f"https://www.linkedin.com/search/results/people/?keywords={search_query.replace(' ', '%20')}"
+    
+    def search_pages(self, driver, max_pages=100):
+        """(página, cards) da busca; recomeça da página 1 se termos ou localização mudarem no config"""
+        while True:
+            query = (tuple(self.config["search_terms"]), self.config["location"])
+            # Páginas endereçadas por URL; a próxima já carrega em segundo plano
+            paginator = SearchPaginator(driver, self.build_search_url(), max_pages=max_pages,
+                                        on_new_tab=apply_lean_selenium if self.lean else None)
+            try:
+                for page, cards in paginator.pages():
+                    yield page, cards
+                    if self.refresh_config() and query != (tuple(self.config["search_terms"]), self.config["location"]):
+                        print("🔄 Termos de busca alterados, recomeçando a busca")
+                        break
+                else:
+                    return
+            finally:
+                paginator.close()
+    
+    def limits_reached(self):
+        """Limites do config (que podem ter sido editados durante a execução) já atingidos"""
+        daily_count, weekly_count = self.get_connection_stats()
+        return (daily_count >= self.config['max_daily_connections']
+                or weekly_count >= self.config['max_weekly_connections'])
+    
+    def select_candidates(self, cards):
+        """Cards da página que passam por todos os filtros (recrutador, local, empresa, caches)"""
+        return self.candidate_filter.select(cards)
+    
+    def invite(self, driver, card, from_page=True):
+        """Envia o convite e registra; pelo card quando ele está na página, senão pelo perfil"""
+        print(f"🎯 Encontrado: {card['name']} | {card['subtitle']} | {card['location']}")
+        
+        # Conecta pelo próprio card; o perfil só é visitado quando o card não tem Conectar
+        if from_page and card["button_state"] == "connect":
+            sent = self.invite_from_card(driver, card)
+        else:
+            sent = self.send_connection_request(driver, card["url"])
         
+        if sent:
+            self.log_connection(card["name"], card["url"], card["subtitle"], card["location"])
+            self.seen.add(card["url"])
+            print(f"✅ Conexão enviada para {card['name']}")
+            emit("invite", name=card["name"], url=card["url"],
+                 quota_left=self.reservation.remaining if self.reservation else None)
+        
+        pause(2, 3)
+        return sent
+    
+    def harvest(self, driver):
+        """Etapa de coleta: varre a busca e enfileira os candidatos, sem enviar convites"""
+        queued = 0
+        pages = self.search_pages(driver, max_pages=self.config["harvest_max_pages"])
+        for page, cards in pages:
+            candidates = self.select_candidates(cards)
+            added = self.queue.push(candidates, source="location")
+            queued += added
+            print(f"📄 Página {page}: {added} candidatos novos na fila")
+            emit("page", page=page, cards=len(cards), matches=len(candidates), queued=added)
+        pages.close()
+        
+        print(f"📥 Candidatos enfileirados: {queued} (fila com {len(self.queue)})")
+    
+    def invite_from_queue(self, driver):
+        """Etapa de envio: consome a fila dentro da cota reservada"""
         connections_sent = 0
-        page = 1
         
-        while connections_sent < (self.config['max_daily_connections'] - daily_count):
-            print(f"📄 Página {page}")
+        for candidate in self.queue.peek():
+            self.refresh_config()
+            if connections_sent >= self.reservation.slots or self.limits_reached():
+                break
             
-            # Pega todos os cards de pessoas
-            people_cards = driver.find_elements(By.XPATH, "//div[@data-view-name='search-entity-result']")
+            profile_url = candidate["url"]
+            if profile_url in self.seen or profile_url in self.negative_cache:
+                self.queue.remove(profile_url)
+                continue
             
-            if not people_cards:
-                print("Nenhum resultado encontrado")
-                break
+            try:
+                if self.invite(driver, candidate, from_page=False):
+                    connections_sent += 1
+                    self.queue.remove(profile_url)
+                elif profile_url in self.negative_cache:
+                    self.queue.remove(profile_url)
+                else:
+                    self.queue.retry_later(profile_url)
+            except Exception as e:
+                print(f"Erro ao processar candidato da fila: {e}")
+                self.queue.retry_later(profile_url)
+        
+        print(f"📤 Conexões enviadas a partir da fila: {connections_sent}")
+        return connections_sent
+    
+    def search_recruiters(self, driver, connections_sent=0):
+        """Busca Tech Recruiters no LinkedIn e convida até esgotar a reserva"""
+        pages = self.search_pages(driver)
+        for page, cards in pages:
+            print(f"📄 Página {page}")
             
-            for card in people_cards:
+            candidates = self.select_candidates(cards)
+            emit("page", page=page, cards=len(cards), matches=len(candidates))
+            for position, card in enumerate(candidates):
+                if connections_sent >= self.reservation.slots:
+                    # Cota esgotada: o resto da página vai para a fila da próxima execução
+                    self.queue.push(candidates[position:], source="location")
+                    break
+                
                 try:
-                    # Extrai informações do card
-                    name_element = card.find_element(By.XPATH, ".//span[@aria-hidden='true'][contains(@class, 'entity-result__title-text')]//a")
-                    name = name_element.text.strip()
-                    profile_url = name_element.get_attribute('href')
-                    
-                    # Pega informações de cargo/empresa
-                    try:
-                        subtitle_element = card.find_element(By.XPATH, ".//div[contains(@class, 'entity-result__primary-subtitle')]")
-                        subtitle = subtitle_element.text.strip()
-                    except:
-                        subtitle = ""
-                    
-                    # Pega localização
-                    try:
-                        location_element = card.find_element(By.XPATH, ".//div[contains(@class, 'entity-result__secondary-subtitle')]")
-                        location = location_element.text.strip()
-                    except:
-                        location = ""
-                    
-                    # Verifica se é Tech Recruiter
-                    if not self.is_tech_recruiter(name + " " + subtitle):
-                        continue
-                    
-                    # Verifica localização
-                    if not self.is_in_location(location):
-                        continue
-                    
-                    # Verifica empresa desejada
-                    if not self.is_from_desired_company(subtitle):
-                        continue
-                    
-                    # Verifica se já não está conectado
-                    try:
-                        card.find_element(By.XPATH, ".//span[contains(text(), 'Conectado') or contains(text(), 'Connected')]")
-                        continue  # Já está conectado
-                    except:
-                        pass
-                    
-                    print(f"🎯 Encontrado: {name} | {subtitle} | {location}")
-                    
-                    # Abre o perfil em nova aba
-                    driver.execute_script("window.open(arguments[0], '_blank');", profile_url)
-                    driver.switch_to.window(driver.window_handles[-1])
-                    
-                    # Envia conexão
-                    if self.send_connection_request(driver, profile_url):
-                        self.log_connection(name, profile_url, subtitle, location)
+                    if self.invite(driver, card):
                         connections_sent += 1
-                        print(f"✅ Conexão enviada para {name}")
-                        
-                        # Verifica limites
-                        if connections_sent >= (self.config['max_daily_connections'] - daily_count):
-                            break
-                    
-                    # Volta para a página de busca
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-                    time.sleep(2 + random.random() * 3)
-                    
                 except Exception as e:
                     print(f"Erro ao processar card: {e}")
                     continue
             
-            # Próxima página
-            try:
-                next_button = driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Próxima') or contains(@aria-label, 'Next')]")
-                if next_button.is_enabled():
-                    next_button.click()
-                    page += 1
-                    time.sleep(5)
-                else:
-                    break
-            except:
+            if connections_sent >= self.reservation.slots or self.limits_reached():
                 break
+        pages.close()
         
         print(f"🎉 Conexões enviadas hoje: {connections_sent}")
     
-    def run(self):
-        """Executa o bot"""
+    def run(self, mode="all", lean=False, headless=False, attach=False):
+        """Executa o bot
+
+        mode: "harvest" só coleta para a fila, "invite" só consome a fila,
+        "all" consome a fila e completa a cota com uma busca nova;
+        lean liga o modo leve (sem imagens, fontes, rastreadores e animações);
+        headless usa o preset sem janela e de baixo consumo;
+        attach conecta ao navegador do browser_daemon em vez de abrir outro
+        """
         print("🚀 Iniciando Tech Recruiter Bot - Localização & Empresas")
         print("=" * 60)
         
@@ -337,24 +408,65 @@ class TechRecruiterLocationBot:
         print(f"📍 Localização: {self.config['location'] or 'Qualquer'}")
         print(f"🏢 Empresas: {', '.join(self.config['companies']) or 'Qualquer'}")
         print(f"🔍 Termos: {', '.join(self.config['search_terms'])}")
+        print(f"📋 Fila de candidatos: {len(self.queue)}")
         
         driver = None
+        lean_stats = None
+        rss = None
+        emit("start", mode=mode)
         try:
-            driver = self.setup_driver()
-            self.search_recruiters(driver)
+            driver = self.setup_driver(lean, headless, attach)
+            rss = RssSampler(selenium_pid(driver)).start()
+            if lean:
+                self.lean = True
+                lean_stats = enable_lean_selenium(driver)
+            if mode == "harvest":
+                self.harvest(driver)
+            elif self.reserve_quota():
+                connections_sent = self.invite_from_queue(driver)
+                if mode == "all" and connections_sent < self.reservation.slots:
+                    self.search_recruiters(driver, connections_sent)
+            emit("done")
             
         except KeyboardInterrupt:
             print("\n⏹️ Bot interrompido pelo usuário")
+            emit("cancelled")
         except Exception as e:
             print(f"❌ Erro: {e}")
+            emit("error", message=str(e))
         finally:
             if driver:
+                if lean_stats:
+                    print(collect_selenium_stats(driver, lean_stats).summary())
+                # No navegador do daemon só a aba de perfis é fechada; o quit não encerra o Chrome
+                if attach and self.profile_handle in driver.window_handles:
+                    driver.switch_to.window(self.profile_handle)
+                    driver.close()
                 driver.quit()
+            if rss:
+                rss.stop("bot_tech_recruiters_location.py")
+            if self.reservation:
+                self.reservation.release()
+            self.seen.close()
+            self.negative_cache.save()
+            compact_account_log(self.log_file)
             print("✅ Bot finalizado")
 
 def main():
+    parser = argparse.ArgumentParser(description="Tech Recruiter Bot - Localização & Empresas")
+    stage = parser.add_mutually_exclusive_group()
+    stage.add_argument("--harvest", action="store_true", help="só coleta candidatos para a fila")
+    stage.add_argument("--invite", action="store_true", help="só envia convites a partir da fila")
+    parser.add_argument("--lean", action="store_true", help="modo leve: bloqueia imagens, fontes e rastreadores")
+    parser.add_argument("--headless", action="store_true", help="sem janela, preset de baixo consumo")
+    parser.add_argument("--attach", action="store_true", help="usa o navegador do browser_daemon se estiver ativo")
+    args = parser.parse_args()
+    
+    # Cancelamento pela TUI (Ctrl+C / CTRL_BREAK) cai no KeyboardInterrupt do run()
+    install_cancel_handler()
     bot = TechRecruiterLocationBot()
-    bot.run()
+    bot.run("harvest" if args.harvest else "invite" if args.invite else "all", lean=args.lean, headless=args.headless,
+            attach=args.attach)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,9 +7,8 @@ Versão compatível com MacOS e mais estável
 import datetime
 import os
 import sys
-import time
 import platform
-from random import randint, random, uniform
+from random import randint
 
 try:
     from selenium import webdriver
@@ -24,12 +23,23 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     print("⚠️  Selenium não instalado. Instale com: pip3 install selenium")
 
-# Palavras-chave para identificar Tech Recruiters
-TECH_RECRUITER_KEYWORDS = [
-    "tech recruiter", "technical recruiter", "talent acquisition", 
-    "recruitment specialist", "headhunter", "talent hunter",
-    "recruiter", "hr specialist", "human resources", "staffing"
-]
+from bot_config import connection_limits
+from bot_flags import pop_flag
+from browser_daemon import DEFAULT_PROFILE_DIRECTORY, attach_selenium_options
+from browser_presets import RssSampler, apply_headless_options, selenium_pid
+from driver_resolver import resolve_chromedriver
+from invite_modal import (
+    ADD_NOTE, DISMISS, EMAIL_REQUIRED, LIMIT_REACHED, NOTE_FIELD, SEND, SEND_WITHOUT_NOTE, SENT,
+    click_modal, modal_selector, resolve_modal,
+)
+from lean_mode import apply_lean_selenium, collect_selenium_stats, enable_lean_options, enable_lean_selenium
+from log_compaction import compact_account_log
+from negative_cache import NegativeCache, unconnectable_reason
+from pacing import pause
+from page_readiness import document_ready, selector_present, use_eager_page_load, wait_ready
+from quota_ledger import QuotaLedger
+from recruiter_matcher import classify_many
+from search_paginator import SearchPaginator
 
 # Mensagem padrão
 DEFAULT_MESSAGE = """Olá! Sou desenvolvedor de software em busca de novas oportunidades na área de tecnologia. 
@@ -58,51 +68,48 @@ def get_system_paths():
             "driver": "chromedriver.exe"
         }
 
-def is_tech_recruiter(profile_text):
-    """Verifica se o perfil é de um tech recruiter baseado nas palavras-chave"""
-    if not profile_text:
-        return False
-    
-    profile_text_lower = profile_text.lower()
-    return any(keyword in profile_text_lower for keyword in TECH_RECRUITER_KEYWORDS)
-
-def setup_driver(browser_path, profile_path, headless=False):
-    """Configura e retorna o driver do Chrome"""
-    chrome_options = Options()
+def setup_driver(browser_path, profile_path, headless=False, lean=False, attach=False):
+    """Configura e retorna o driver do Chrome (ou conecta ao daemon do navegador com attach)"""
+    chrome_options = attach_selenium_options(Options, profile_path) if attach else None
     
-    # Configurações básicas
-    chrome_options.add_argument(f"--user-data-dir={profile_path}")
-    chrome_options.add_argument("--profile-directory=Profile 1")
-    chrome_options.add_argument(f"--window-size={randint(1024, 1920)},{randint(768, 1080)}")
-    
-    if headless:
-        chrome_options.add_argument("--headless")
+    if chrome_options is None:
+        chrome_options = Options()
+        
+        # Configurações básicas
+        chrome_options.add_argument(f"--user-data-dir={profile_path}")
+        chrome_options.add_argument(f"--profile-directory={DEFAULT_PROFILE_DIRECTORY}")
+        if not headless:
+            chrome_options.add_argument(f"--window-size={randint(1024, 1920)},{randint(768, 1080)}")
+        
+        if headless:
+            apply_headless_options(chrome_options)
+        
+        # Configurações adicionais para evitar detecção
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
     
-    # Configurações adicionais para evitar detecção
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
+    if lean:
+        enable_lean_options(chrome_options)
+    use_eager_page_load(chrome_options)
     
     try:
-        # Tenta usar o ChromeDriver automático (mais fácil para Mac)
-        if platform.system() == "Darwin":
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            # Para Linux/Windows, usa caminho específico
-            driver = webdriver.Chrome(options=chrome_options)
+        # Driver resolvido uma vez por versão do navegador (sem rede nas execuções seguintes)
+        driver_path = resolve_chromedriver(browser_path)
+        service = Service(driver_path) if driver_path else Service()
+        driver = webdriver.Chrome(service=service, options=chrome_options)
         
         return driver
     except Exception as e:
         print(f"❌ Erro ao criar driver: {e}")
         return None
 
-def send_connection_request(driver, profile_url, message):
+def send_connection_request(driver, profile_url, message, negative_cache=None):
     """Envia solicitação de conexão com mensagem personalizada"""
     try:
         driver.get(profile_url)
-        time.sleep(3 + random() * 2)
+        wait_ready(driver, selector_present("main button"))
+        pause(1, 1)
         
         # Procura pelo botão "Conectar" ou "Connect"
         try:
@@ -112,99 +119,79 @@ def send_connection_request(driver, profile_url, message):
             
             # Scroll até o botão
             driver.execute_script("arguments[0].scrollIntoView(true);", connect_button)
-            time.sleep(1 + random())
+            pause(1, 1)
             
             # Clica no botão
             driver.execute_script("arguments[0].click();", connect_button)
-            time.sleep(2 + random() * 2)
+            pause(0.5, 1)
             
-            # Procura por "Adicionar nota" ou "Add a note"
-            try:
-                add_note = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Adicionar nota') or contains(text(), 'Add a note')]"))
-                )
-                add_note.click()
-                time.sleep(1 + random())
+            # Observa todas as variantes do modal ao mesmo tempo (a primeira que aparecer vence)
+            state = resolve_modal(driver, [ADD_NOTE, SEND_WITHOUT_NOTE, SEND, EMAIL_REQUIRED, LIMIT_REACHED, SENT], timeout=5)
+            if state == ADD_NOTE:
+                click_modal(driver, ADD_NOTE)
+                pause(1, 1)
                 
                 # Escreve a mensagem
-                message_field = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.ID, "custom-message"))
-                )
-                message_field.clear()
-                message_field.send_keys(message)
-                time.sleep(1 + random())
-                
-                # Envia o convite
-                send_button = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'Enviar convite') or contains(@aria-label, 'Send invitation') or contains(@aria-label, 'Send now')]"))
-                )
-                send_button.click()
-                
-                return True
+                if resolve_modal(driver, [NOTE_FIELD], timeout=5) == NOTE_FIELD:
+                    message_field = driver.find_element(By.CSS_SELECTOR, modal_selector(NOTE_FIELD))
+                    message_field.clear()
+                    message_field.send_keys(message)
+                    pause(1, 1)
+                    
+                    # Envia o convite
+                    if resolve_modal(driver, [SEND], timeout=5) == SEND:
+                        click_modal(driver, SEND)
+                        return True
                 
-            except TimeoutException:
                 # Se não conseguir adicionar nota, envia sem mensagem
-                try:
-                    send_without_note = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Enviar sem nota') or contains(text(), 'Send without note')]"))
-                    )
-                    send_without_note.click()
-                    return True
-                except TimeoutException:
-                    return False
+                state = resolve_modal(driver, [SEND_WITHOUT_NOTE, SEND], timeout=5)
+            
+            if state in (SEND_WITHOUT_NOTE, SEND):
+                click_modal(driver, state)
+                return True
+            if state == SENT:
+                return True
+            
+            if state == EMAIL_REQUIRED and negative_cache is not None:
+                negative_cache.add(profile_url, EMAIL_REQUIRED)
+            if resolve_modal(driver, [DISMISS], timeout=1) == DISMISS:
+                click_modal(driver, DISMISS)
+            return False
                     
         except TimeoutException:
-            print("Botão Conectar não encontrado")
+            # Guarda o motivo para não recarregar este perfil nas próximas execuções
+            reason = unconnectable_reason(driver)
+            if negative_cache is not None:
+                negative_cache.add(profile_url, reason)
+            print(f"Botão Conectar não encontrado ({reason})")
             return False
             
     except Exception as e:
         print(f"Erro ao enviar solicitação: {e}")
         return False
 
-def search_tech_recruiters(driver, max_pages=3):
-    """Busca Tech Recruiters no LinkedIn"""
+def search_tech_recruiters(driver, max_pages=3, lean=False):
+    """Busca Tech Recruiters no LinkedIn (lean aplica o modo leve também na aba de pré-carregamento)"""
     base_url = "https://www.linkedin.com/search/results/people/?keywords=tech%20recruiter&network=%5B%22S%22%5D"
     recruiters_found = []
     
-    for page in range(1, max_pages + 1):
-        url = f"{base_url}&page={page}"
-        driver.get(url)
-        time.sleep(3 + random() * 2)
+    # Páginas endereçadas por URL; a próxima já carrega em segundo plano
+    paginator = SearchPaginator(driver, base_url, max_pages=max_pages, on_new_tab=apply_lean_selenium if lean else None)
+    for page, cards in paginator.pages():
+        # Classifica a página inteira de uma vez
+        titles = [f"{card['name']} | {card['subtitle']}" for card in cards]
         
-        try:
-            # Aguarda os resultados carregarem
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "entity-result__item"))
-            )
+        for card, title_text, is_recruiter in zip(cards, titles, classify_many(titles)):
+            if not is_recruiter or not card['url']:
+                continue
             
-            # Encontra todos os cards de perfil
-            profile_cards = driver.find_elements(By.CLASS_NAME, "entity-result__item")
+            recruiters_found.append({
+                'title': title_text,
+                'url': card['url']
+            })
             
-            for card in profile_cards:
-                try:
-                    # Obtém informações do perfil
-                    title_element = card.find_element(By.CLASS_NAME, "entity-result__title-text")
-                    title_text = title_element.text
-                    
-                    # Verifica se é Tech Recruiter
-                    if is_tech_recruiter(title_text):
-                        # Obtém o link do perfil
-                        link_element = card.find_element(By.TAG_NAME, "a")
-                        profile_url = link_element.get_attribute("href")
-                        
-                        recruiters_found.append({
-                            'title': title_text,
-                            'url': profile_url
-                        })
-                        
-                        print(f"✅ Tech Recruiter encontrado: {title_text}")
-                    
-                except NoSuchElementException:
-                    continue
-                    
-        except TimeoutException:
-            print(f"⏰ Timeout na página {page}")
-            continue
+            print(f"✅ Tech Recruiter encontrado: {title_text}")
+    paginator.close()
     
     return recruiters_found
 
@@ -216,39 +203,15 @@ def main():
     
     # Configurações
     current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-    total_accounts = 0
     tech_recruiters_connected = 0
-    skip = False
     
-    # Verifica arquivo de log
-    if not os.path.exists("AccountLog.txt"):
-        open("AccountLog.txt", "w").close()
+    # Verifica limites semanais e diários no ledger
+    ledger = QuotaLedger()
+    total_accounts = ledger.sent_last_7_days()
+    max_daily, max_weekly = connection_limits()
+    skip = ledger.has_run_today()
     
-    # Verifica limites semanais e diários
-    with open("AccountLog.txt", "r") as log_file:
-        for line in log_file:
-            if " on " not in line:
-                continue
-            parts = line.strip().split(" on ")
-            if len(parts) < 2:
-                continue
-            
-            try:
-                accounts_count = int(parts[0].split(": ")[1])
-                log_date = datetime.datetime.strptime(parts[1], "%Y-%m-%d")
-                
-                # Verifica limite semanal
-                if log_date >= datetime.datetime.now() - datetime.timedelta(days=7):
-                    total_accounts += accounts_count
-                
-                # Verifica se já executou hoje
-                if current_date in line:
-                    skip = True
-                    
-            except (ValueError, IndexError):
-                continue
-    
-    if total_accounts >= 100:
+    if total_accounts >= max_weekly:
         print("❌ Limite semanal atingido!")
         return
     
@@ -256,21 +219,35 @@ def main():
         print(f"❌ Bot já executou hoje ({current_date})!")
         return
     
+    # Reserva as vagas na cota compartilhada com os outros bots
+    reservation = ledger.reserve(15, max_daily=max_daily, max_weekly=max_weekly)
+    if not reservation:
+        print("❌ Cota compartilhada esgotada por outros bots!")
+        return
+    
     # Obtém caminhos do sistema
     paths = get_system_paths()
     
     # Configura o driver
     print("🚀 Iniciando Chrome...")
-    driver = setup_driver(paths["browser"], paths["profile"])
+    lean = pop_flag("--lean")  # --lean: bloqueia imagens, fontes e rastreadores
+    headless = pop_flag("--headless")  # --headless: sem janela, preset de baixo consumo
+    attach = pop_flag("--attach")  # --attach: usa o navegador do daemon se estiver ativo
+    driver = setup_driver(paths["browser"], paths["profile"], headless=headless, lean=lean, attach=attach)
     
     if not driver:
         print("❌ Falha ao iniciar o Chrome!")
+        reservation.release()
         return
     
+    negative_cache = NegativeCache()
+    lean_stats = enable_lean_selenium(driver) if lean else None
+    rss = RssSampler(selenium_pid(driver)).start()
+    
     try:
         # Faz login no LinkedIn (se necessário)
         driver.get("https://www.linkedin.com/login")
-        time.sleep(5)
+        wait_ready(driver, document_ready())
         
         # Verifica se está na página de login
         if "login" in driver.current_url:
@@ -279,29 +256,31 @@ def main():
         
         # Busca Tech Recruiters
         print("🔍 Buscando Tech Recruiters...")
-        recruiters = search_tech_recruiters(driver, max_pages=2)
+        recruiters = search_tech_recruiters(driver, max_pages=2, lean=lean)
         
         print(f"📊 Encontrados {len(recruiters)} Tech Recruiters")
         
+        # Perfis sabidamente não convidáveis não são abertos de novo
+        recruiters = [r for r in recruiters if r['url'] not in negative_cache]
+        
         # Envia solicitações de conexão
-        for recruiter in recruiters[:15]:  # Limite de 15 por execução
-            if tech_recruiters_connected >= 15:
+        for recruiter in recruiters[:reservation.slots]:  # Limite reservado para esta execução
+            if tech_recruiters_connected >= reservation.slots:
                 break
                 
             print(f"📤 Conectando com: {recruiter['title']}")
             
-            if send_connection_request(driver, recruiter['url'], DEFAULT_MESSAGE):
+            if send_connection_request(driver, recruiter['url'], DEFAULT_MESSAGE, negative_cache):
                 tech_recruiters_connected += 1
                 print(f"✅ Conexão enviada #{tech_recruiters_connected}")
             else:
                 print(f"❌ Falha ao conectar")
             
             # Espera entre conexões
-            time.sleep(5 + random() * 5)
+            pause(5, 5)
         
         # Registra no log
-        with open("AccountLog.txt", "a") as log_file:
-            log_file.write(f"Tech Recruiters connected: {tech_recruiters_connected} on {current_date}\n")
+        ledger.log_summary("Tech Recruiters connected", tech_recruiters_connected, reservation)
         
         print(f"🎉 Total de Tech Recruiters conectados: {tech_recruiters_connected}")
         
@@ -309,7 +288,13 @@ def main():
         print(f"❌ Erro durante a execução: {e}")
         
     finally:
+        if lean_stats:
+            print(collect_selenium_stats(driver, lean_stats).summary())
         driver.quit()
+        rss.stop("bot_tech_recruiters_selenium.py")
+        reservation.release()
+        negative_cache.save()
+        compact_account_log()
         print("🏁 Bot finalizado")
 
 if __name__ == "__main__":
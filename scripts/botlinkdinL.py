@@ -2,13 +2,27 @@
 import datetime
 import os
 import sys
-import time
 from random import *
 from random import randint, random
 
 import nodriver as uc
 from nodriver import *
 
+from bot_config import connection_limits
+from bot_flags import pop_flag
+from browser_daemon import start_nodriver
+from browser_presets import RssSampler, nodriver_pid
+from grow_loader import collect_suggestions, connect_selector, load_suggestions, select_suggestions
+from lean_mode import enable_lean_nodriver
+from log_compaction import compact_account_log
+from pacing import human_pause
+from quota_ledger import QuotaLedger
+
+HEADLESS = pop_flag("--headless")  # --headless: sin ventana, preset de bajo consumo
+ATTACH = pop_flag("--attach")  # --attach: usa el navegador del daemon si está activo
+LEAN = pop_flag("--lean")  # --lean: bloquea imágenes, fuentes y rastreadores
+RECRUITERS_ONLY = pop_flag("--recruiters")  # --recruiters: solo invita sugerencias con titular de reclutador
+
 if len(sys.argv) > 3:
     browserPath = sys.argv[1]
     profilePath = sys.argv[2]
@@ -21,84 +35,72 @@ else:
 
 async def main():
     current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-    total_accounts = 0
     Skip = 0
 
-    if not os.path.exists("AccountLog.txt"):
-        open("AccountLog.txt", "w").close()
-
-    with open("AccountLog.txt", "r") as log_file:
-        for line in log_file:
-            if " on " not in line:
-                continue
-            parts = line.strip().split(" on ")
-            if len(parts) < 2:
-                continue
-            accounts_part = parts[0]
-            date_part = parts[1]
-
-            try:
-                accounts_count = int(accounts_part.split(": ")[1])
-            except (IndexError, ValueError):
-                continue
-
-            try:
-                log_date = datetime.datetime.strptime(date_part, "%Y-%m-%d")
-            except ValueError:
-                continue
-
-            if log_date >= datetime.datetime.now() - datetime.timedelta(days=7):
-                total_accounts += accounts_count
-
-    if total_accounts >= 100:
+    ledger = QuotaLedger()
+    total_accounts = ledger.sent_last_7_days()
+    max_daily, max_weekly = connection_limits()
+
+    if total_accounts >= max_weekly:
         Skip = 1
         print("Total de cuentas esta semana: " + str(total_accounts))
 
-    with open("AccountLog.txt", "r") as log_file:
-        for line in log_file:
-            if current_date in line:
-                Skip = 1
-                print(
-                    "La fecha actual ("
-                    + current_date
-                    + ") ya está en el archivo de log."
-                )
-                print("Total de cuentas esta semana: " + str(total_accounts))
+    if ledger.has_run_today():
+        Skip = 1
+        print(
+            "La fecha actual ("
+            + current_date
+            + ") ya está en el archivo de log."
+        )
+        print("Total de cuentas esta semana: " + str(total_accounts))
+
+    if not Skip:
+        # Reserva las vacantes antes de abrir el navegador (cuota compartida)
+        reservation = ledger.reserve(25, max_daily=max_daily, max_weekly=max_weekly)
+        if not reservation:
+            Skip = 1
+            print("Cuota compartida agotada por otros bots.")
 
     if not Skip:
         x = 0
-        y = 0
+        lean_stats = None
+        rss = None
         try:
-            driver = await uc.start(
-                headless=False,
-                browser_executable_path=browserPath,
-                user_data_dir=profilePath,
-                browser_args=[
-                    f"--window-size={randint(500, 1920)},{randint(500, 1080)}",
-                ],
-            )
-
-            tab = await driver.get("https://www.linkedin.com/mynetwork/grow/")
+            driver, attached = await start_nodriver(browserPath, profilePath, HEADLESS, ATTACH)
+            rss = RssSampler(nodriver_pid(driver)).start()
+
+            tab = await driver.get("about:blank", new_tab=attached)
+            if LEAN:
+                lean_stats = await enable_lean_nodriver(tab)
+            await tab.get("https://www.linkedin.com/mynetwork/grow/")
             if LoggedIn:
-                await driver.wait(time=random())  # Pausa aleatoria
-                bottomFrame = await tab.find("People you may know", timeout=25)
-                while y < 10:
-                    await bottomFrame.scroll_into_view()
-                    time.sleep(1)
-                    y += 1
-
-                connectBars = await tab.find_all("to connect", timeout=25)
-                for bar in connectBars:
-                    if x >= 25:
-                        break
-                    else:
-                        await bar.scroll_into_view()
-                        await bar.click()
-                        time.sleep(2 + 5 * random())
-                        x += 1
-
-                with open("AccountLog.txt", "a") as log_file:
-                    log_file.write(f"Accounts ran: {x} on {current_date}\n")
+                await human_pause(0, 1)  # Pausa aleatoria
+                await tab.find("People you may know", timeout=25)
+                # Rueda hasta tener tarjetas para la cuota o hasta que no carguen más
+                # (los reclutadores son pocos entre las sugerencias, así que se cargan todas)
+                await load_suggestions(tab, float("inf") if RECRUITERS_ONLY else reservation.slots)
+
+                # Nombre, titular y perfil de cada sugerencia en una sola consulta
+                suggestions = await collect_suggestions(tab)
+                chosen = select_suggestions(suggestions, reservation.slots, RECRUITERS_ONLY)
+                print(f"Sugerencias: {len(suggestions)}, seleccionadas: {len(chosen)}")
+                for suggestion in chosen:
+                    try:
+                        button = await tab.select(connect_selector(suggestion), timeout=5)
+                    except Exception:
+                        print(f"Omitida (la tarjeta ya no está en la página): {suggestion['name']}")
+                        continue
+                    await button.scroll_into_view()
+                    await button.click()
+                    # Una línea por invitación (a quién) en el log y en el ledger
+                    ledger.log_connection(suggestion["name"], suggestion["url"], suggestion["headline"], reservation=reservation)
+                    print(f"Invitado: {suggestion['name']} - {suggestion['headline']}")
+                    x += 1
+                    await human_pause(2, 5)
+
+                # Registra la ejecución aunque no se haya invitado a nadie
+                if x == 0:
+                    ledger.log_summary("Accounts ran", 0, reservation)
 
                 await tab.close()
             else:
@@ -106,10 +108,16 @@ async def main():
                 await tab.close()
         except Exception as e:
             print(e)
-            if x > 0:
-                with open("AccountLog.txt", "a") as log_file:
-                    log_file.write(f"Accounts ran: {x} on {current_date}\n")
+            # Las invitaciones anteriores al error ya quedaron registradas una por una
             await tab.close()
+        finally:
+            reservation.release()
+            if lean_stats:
+                print(lean_stats.summary())
+            if rss:
+                rss.stop("botlinkdinL.py")
+
+    compact_account_log()
 
 
 if __name__ == "__main__":
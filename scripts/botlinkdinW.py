@@ -1,14 +1,26 @@
 import datetime
 import random
 import sys
-import time
 from random import *
 
-import import
 import nodriver as uc
-import randit
 from nodriver import *
 
+from bot_config import connection_limits
+from bot_flags import pop_flag
+from browser_daemon import start_nodriver
+from browser_presets import RssSampler, nodriver_pid
+from grow_loader import collect_suggestions, connect_selector, load_suggestions, select_suggestions
+from lean_mode import enable_lean_nodriver
+from log_compaction import compact_account_log
+from pacing import human_pause
+from quota_ledger import QuotaLedger
+
+HEADLESS = pop_flag("--headless")  # --headless: no window, low-footprint preset
+ATTACH = pop_flag("--attach")  # --attach: reuse the daemon browser when it is running
+LEAN = pop_flag("--lean")  # --lean: block images, fonts and trackers
+RECRUITERS_ONLY = pop_flag("--recruiters")  # --recruiters: only invite suggestions with a recruiter headline
+
 if len(sys.argv) > 3:
     browserPath = sys.argv[1]
     profilePath = sys.argv[2]
@@ -20,71 +32,69 @@ else:
 
 async def main():
     current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-    total_accounts = 0
     Skip = 0
-    with open("AccountLog.txt", 'r') as log_file:
-        for line in log_file:
-            # Split the line to extract accounts and date
-            parts = line.strip().split(" on ")
-            accounts_part = parts[0]
-            date_part = parts[1]
-            
-            # Extract the number of accounts and the date
-            accounts_count = int(accounts_part.split(": ")[1])  # Extract number of accounts
-            log_date = datetime.datetime.strptime(date_part, '%Y-%m-%d')
+    ledger = QuotaLedger()
+    total_accounts = ledger.sent_last_7_days()
+    max_daily, max_weekly = connection_limits()
 
-            # Check if the log date is within the last 7 days
-            if log_date >= datetime.datetime.now()-datetime.timedelta(days=7):
-                total_accounts += accounts_count
-    
     # If More than 100 Accounts This Week, Skip
-    if (total_accounts >= 100):
+    if (total_accounts >= max_weekly):
         Skip = 1
         print("Total Accounts This Week: " + str(total_accounts))
 
      # If Already Ran today, Skip
-    with open("AccountLog.txt", 'r') as log_file:
-        for line in log_file:
-            if current_date in line:
-                Skip = 1
-                print("Current date: " + current_date + " is already in the log file.")
-                print("Total Accounts This Week: " + str(total_accounts))
+    if ledger.has_run_today():
+        Skip = 1
+        print("Current date: " + current_date + " is already in the log file.")
+        print("Total Accounts This Week: " + str(total_accounts))
+
+    # Reserve slots before starting the browser (quota shared with other bots)
+    if (not Skip):
+        reservation = ledger.reserve(25, max_daily=max_daily, max_weekly=max_weekly)
+        if not reservation:
+            Skip = 1
+            print("Shared quota already taken by other bots.")
     
     if (not Skip):
         x = 0
-        y = 0
+        lean_stats = None
+        rss = None
         try:
-            driver = await uc.start(
-            headless = False,
-            browser_executable_path=browserPath,
-            user_data_dir=profilePath,
-            browser_args=[
-            f"--window-size={randint(500, 1920)},{randint(500, 1080)}",
-            ]
-            )
+            driver, attached = await start_nodriver(browserPath, profilePath, HEADLESS, ATTACH)
+            rss = RssSampler(nodriver_pid(driver)).start()
 
-            tab = await driver.get("https://www.linkedin.com/mynetwork/grow/")
+            tab = await driver.get("about:blank", new_tab=attached)
+            if LEAN:
+                lean_stats = await enable_lean_nodriver(tab)
+            await tab.get("https://www.linkedin.com/mynetwork/grow/")
             if (LoggedIn):
-                await driver.wait(time=random()) # Wait
-                bottomFrame = await tab.find("People you may know",timeout=25)
-                while y < 10:
-                    await bottomFrame.scroll_into_view()
-                    time.sleep(1)
-                    y += 1
+                await human_pause(0, 1) # Wait
+                await tab.find("People you may know", timeout=25)
+                # Scroll until there are cards for the quota or no more cards load
+                # (recruiters are a small share of the suggestions, so load all of them)
+                await load_suggestions(tab, float("inf") if RECRUITERS_ONLY else reservation.slots)
 
-                connectBars = await tab.find_all("to connect",timeout=25)
-                for bar in connectBars:
-                    if (x >= 25):
-                        break
-                    else:
-                        await bar.scroll_into_view()
-                        await bar.click()
-                        time.sleep(2+5*random())
-                        x += 1
-                    
-                # Log this message into a text file
-                with open('AccountLog.txt', 'a') as log_file:  # Append mode
-                    log_file.write(f"Accounts ran: {x} on {current_date}\n")
+                # Name, headline and profile of every suggestion in a single query
+                suggestions = await collect_suggestions(tab)
+                chosen = select_suggestions(suggestions, reservation.slots, RECRUITERS_ONLY)
+                print(f"Suggestions: {len(suggestions)}, selected: {len(chosen)}")
+                for suggestion in chosen:
+                    try:
+                        button = await tab.select(connect_selector(suggestion), timeout=5)
+                    except Exception:
+                        print(f"Skipped (card no longer on the page): {suggestion['name']}")
+                        continue
+                    await button.scroll_into_view()
+                    await button.click()
+                    # One log line per invite (who it was sent to) into the text file and the quota ledger
+                    ledger.log_connection(suggestion["name"], suggestion["url"], suggestion["headline"], reservation=reservation)
+                    print(f"Invited: {suggestion['name']} - {suggestion['headline']}")
+                    x += 1
+                    await human_pause(2, 5)
+
+                # Record the run even when nobody was invited
+                if (x == 0):
+                    ledger.log_summary("Accounts ran", 0, reservation)
 
                 await tab.close()
             else:
@@ -92,11 +102,17 @@ async def main():
                 await tab.close()
         except Exception as e:
             print(e)
-            # Log this message into a text file (Error encountered, still record followed Accounts)
-            if (x>0):
-                with open('AccountLog.txt', 'a') as log_file:  # Append mode
-                    log_file.write(f"Accounts ran: {x} on {current_date}\n")
+            # Invites sent before the error were already logged one by one
             await tab.close()
+        finally:
+            reservation.release()
+            if lean_stats:
+                print(lean_stats.summary())
+            if rss:
+                rss.stop("botlinkdinW.py")
+
+    # Fold old log lines into daily rollups so startup stays cheap
+    compact_account_log()
 
 if __name__ == "__main__":
     uc.loop().run_until_complete(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Daemon do navegador: mantém um Chrome aberto com o perfil carregado e a porta CDP exposta
+Os bots rodados com --attach se conectam a ele em vez de abrir um Chrome novo a cada execução
+
+    python3 scripts/browser_daemon.py start [--headless] [--port 9222] [--profile-directory "Profile 1"]
+    python3 scripts/browser_daemon.py status
+    python3 scripts/browser_daemon.py stop
+"""
+
+import argparse
+import json
+import os
+import platform
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime
+from urllib.request import urlopen
+
+try:
+    import nodriver as uc
+except ImportError:
+    uc = None
+
+from browser_presets import HEADLESS_ARGS, nodriver_launch_options
+
+DAEMON_FILE = "browser_daemon.json"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9222
+START_URL = "https://www.linkedin.com/feed/"
+# Perfil dentro do user-data-dir: o mesmo dos bots Selenium (--profile-directory=Profile 1);
+# o nodriver não passa --profile-directory e usa o Default
+DEFAULT_PROFILE_DIRECTORY = "Profile 1"
+NODRIVER_PROFILE_DIRECTORY = "Default"
+
+
+def default_paths():
+    system = platform.system()
+    if system == "Darwin":  # MacOS
+        return ("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+                os.path.expanduser("~/Library/Application Support/Google/Chrome/Profile 1/"))
+    if system == "Linux":
+        return "/usr/bin/chromium", "/home/capi/Documents/botdata/"
+    return ("C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+            "C:\\Users\\%USERNAME%\\AppData\\Local\\Google\\Chrome\\User Data")
+
+
+def read_daemon_info(path=DAEMON_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_alive(host, port, timeout=1.0):
+    """O endpoint /json/version só responde se o Chrome estiver de pé com o CDP aberto"""
+    try:
+        with urlopen(f"http://{host}:{port}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def daemon_address(path=DAEMON_FILE):
+    """(host, porta) do daemon em execução, ou None"""
+    info = read_daemon_info(path)
+    if info and is_alive(info["host"], info["port"]):
+        return info["host"], info["port"]
+    return None
+
+
+def _same_path(a, b):
+    return os.path.normcase(os.path.abspath(os.path.expanduser(a))) == \
+        os.path.normcase(os.path.abspath(os.path.expanduser(b)))
+
+
+def matching_daemon(profile_path, profile_directory, path=DAEMON_FILE, warn=True):
+    """(host, porta) do daemon só se ele usa o mesmo perfil do bot; senão avisa e retorna None"""
+    address = daemon_address(path)
+    if not address:
+        return None
+    info = read_daemon_info(path)
+    daemon_profile = info.get("profile", "")
+    daemon_directory = info.get("profile_directory") or NODRIVER_PROFILE_DIRECTORY
+    if not _same_path(daemon_profile, profile_path) or daemon_directory != profile_directory:
+        if warn:
+            print(f"⚠️ O daemon usa outro perfil ({daemon_profile} / {daemon_directory}); "
+                  f"o bot espera {profile_path} / {profile_directory}. "
+                  "Reinicie o daemon com o perfil do bot (--profile / --profile-directory)")
+        return None
+    return address
+
+
+def start_daemon(browser_path, profile_path, port=DEFAULT_PORT, headless=False, path=DAEMON_FILE, timeout=30,
+                 profile_directory=DEFAULT_PROFILE_DIRECTORY):
+    address = daemon_address(path)
+    if address:
+        print(f"✅ Daemon já em execução em {address[0]}:{address[1]}")
+        return address
+
+    args = [
+        browser_path,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={profile_path}",
+        f"--profile-directory={profile_directory}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ]
+    if headless:
+        args += ["--headless=new"] + HEADLESS_ARGS
+    args.append(START_URL)
+
+    # Processo separado da sessão atual, para sobreviver ao terminal que o iniciou
+    if platform.system() == "Windows":
+        detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        detach = {"start_new_session": True}
+    process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **detach)
+
+    deadline = time.monotonic() + timeout
+    while not is_alive(DEFAULT_HOST, port):
+        if process.poll() is not None or time.monotonic() >= deadline:
+            print("❌ O navegador não abriu a porta de depuração")
+            return None
+        time.sleep(0.25)
+
+    info = {
+        "host": DEFAULT_HOST,
+        "port": port,
+        "pid": process.pid,
+        "profile": profile_path,
+        "profile_directory": profile_directory,
+        "headless": headless,
+        "started": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2)
+    print(f"🚀 Daemon iniciado em {DEFAULT_HOST}:{port} (pid {process.pid})")
+    return DEFAULT_HOST, port
+
+
+def stop_daemon(path=DAEMON_FILE):
+    info = read_daemon_info(path)
+    if not info:
+        print("Nenhum daemon registrado")
+        return
+    try:
+        os.kill(info["pid"], signal.SIGTERM)
+        print(f"⏹️ Daemon encerrado (pid {info['pid']})")
+    except OSError as e:
+        print(f"Daemon já não estava em execução: {e}")
+    os.remove(path)
+
+
+# Modo --attach dos bots
+
+async def start_nodriver(browser_path, profile_path, headless=False, attach=False):
+    """(browser, attached): conecta ao daemon quando pedido, disponível e no mesmo perfil, senão abre um Chrome novo"""
+    address = matching_daemon(profile_path, NODRIVER_PROFILE_DIRECTORY) if attach else None
+    if attach and not address:
+        print("⚠️ Daemon do navegador não encontrado, abrindo um Chrome novo")
+    if address:
+        print(f"🔌 Conectando ao daemon em {address[0]}:{address[1]}")
+        return await uc.start(host=address[0], port=address[1]), True
+    browser = await uc.start(
+        browser_executable_path=browser_path,
+        user_data_dir=profile_path,
+        **nodriver_launch_options(headless),
+    )
+    return browser, False
+
+
+def attach_selenium_options(options_class, profile_path, profile_directory=DEFAULT_PROFILE_DIRECTORY):
+    """Options do Selenium apontando para o daemon, ou None se ele não estiver de pé (ou em outro perfil)
+
+    Com debuggerAddress o chromedriver não aceita as demais opções de inicialização,
+    por isso as Options são criadas do zero.
+    """
+    address = matching_daemon(profile_path, profile_directory)
+    if not address:
+        print("⚠️ Daemon do navegador não disponível para este perfil, abrindo um Chrome novo")
+        return None
+    chrome_options = options_class()
+    chrome_options.add_experimental_option("debuggerAddress", f"{address[0]}:{address[1]}")
+    print(f"🔌 Conectando ao daemon em {address[0]}:{address[1]}")
+    return chrome_options
+
+
+def main():
+    browser_path, profile_path = default_paths()
+    parser = argparse.ArgumentParser(description="Navegador compartilhado pelos bots")
+    parser.add_argument("command", choices=["start", "stop", "status"])
+    parser.add_argument("--browser", default=browser_path)
+    parser.add_argument("--profile", default=profile_path)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--profile-directory", default=DEFAULT_PROFILE_DIRECTORY,
+                        help="perfil dentro do --profile (padrão: o dos bots Selenium)")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        started = start_daemon(args.browser, args.profile, args.port, args.headless,
+                               profile_directory=args.profile_directory)
+        sys.exit(0 if started else 1)
+    elif args.command == "stop":
+        stop_daemon()
+    else:
+        address = daemon_address()
+        if address:
+            info = read_daemon_info()
+            profile = f"{info['profile']} / {info.get('profile_directory') or NODRIVER_PROFILE_DIRECTORY}"
+            print(f"✅ Em execução em {address[0]}:{address[1]} ({profile})")
+        else:
+            print("⏹️ Parado")
+
+
+if __name__ == "__main__":
+    main()
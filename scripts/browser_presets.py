@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Presets de inicialização do navegador
+--headless: sem janela, GPU desligada, sem throttling de abas em segundo plano e com
+limite de processos de renderização, para rodar vários bots em VMs pequenas sem display.
+O pico de memória (RSS) do navegador é amostrado pelo /proc e gravado em browser_rss.log
+"""
+
+import os
+import threading
+from datetime import datetime
+from random import randint
+
+RSS_LOG_FILE = "browser_rss.log"
+
+# Comum ao nodriver e ao Selenium (o "--headless=new" é ligado à parte em cada um)
+HEADLESS_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--renderer-process-limit=2",
+    "--disable-extensions",
+    "--mute-audio",
+    "--window-size=1366,900",
+]
+
+
+def nodriver_launch_options(headless=False):
+    """Argumentos extras do uc.start: preset headless ou a janela de tamanho aleatório"""
+    if headless:
+        return {"headless": True, "browser_args": list(HEADLESS_ARGS)}
+    return {"headless": False, "browser_args": [f"--window-size={randint(500, 1920)},{randint(500, 1080)}"]}
+
+
+def apply_headless_options(chrome_options):
+    """Preset headless para o Selenium"""
+    chrome_options.add_argument("--headless=new")
+    for arg in HEADLESS_ARGS:
+        chrome_options.add_argument(arg)
+
+
+def _parent_map():
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as f:
+                # O nome do processo pode ter espaços; o PPID vem logo depois do ")"
+                parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return parents
+
+
+def _rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def process_tree_rss(pid):
+    """RSS somado (em KB) do processo e de todos os descendentes; 0 fora do Linux"""
+    if not pid or not os.path.isdir("/proc"):
+        return 0
+    parents = _parent_map()
+    tree, frontier = {pid}, [pid]
+    while frontier:
+        current = frontier.pop()
+        for child, parent in parents.items():
+            if parent == current and child not in tree:
+                tree.add(child)
+                frontier.append(child)
+    return sum(_rss_kb(p) for p in tree)
+
+
+class RssSampler:
+    """Amostra o RSS da árvore do navegador em uma thread e guarda o pico"""
+
+    def __init__(self, pid, interval=2.0):
+        self.pid = pid
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        if self.pid and os.path.isdir("/proc"):
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_kb = max(self.peak_kb, process_tree_rss(self.pid))
+            self._stop.wait(self.interval)
+
+    def stop(self, label, log_file=RSS_LOG_FILE):
+        """Para a amostragem e registra o pico no log"""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        if not self.peak_kb:
+            return 0
+        peak_mb = self.peak_kb / 1024
+        print(f"🧠 Pico de memória do navegador: {peak_mb:.0f} MB")
+        try:
+            with open(log_file, 'a') as f:
+                f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {label}: {peak_mb:.0f} MB\n")
+        except OSError as e:
+            print(f"Erro ao salvar pico de memória: {e}")
+        return peak_mb
+
+
+def nodriver_pid(browser):
+    return getattr(browser, "_process_pid", None)
+
+
+def selenium_pid(driver):
+    """PID do chromedriver; o Chrome roda como filho dele"""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
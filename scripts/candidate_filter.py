@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Filtro de candidatos da busca (recrutador, localização, empresa e caches)
+Compartilhado pelo bot de localização (Selenium) e pela coleta paralela (nodriver)
+"""
+
+from company_matcher import CompanyMatcher
+from location_index import load_location_index
+from negative_cache import PENDING
+from recruiter_matcher import classify_many
+
+
+class CandidateFilter:
+    """Decide quais cards extraídos valem um convite"""
+
+    def __init__(self, config, seen, negative_cache, location_index=None, company_matcher=None):
+        self.config = config
+        self.seen = seen
+        self.negative_cache = negative_cache
+        self.location_index = location_index or load_location_index(config)
+        self.company_matcher = company_matcher or CompanyMatcher.from_config(config)
+
+    def in_location(self, location_text):
+        """Verifica se está na localização desejada"""
+        if not location_text or not self.config["location"]:
+            return True  # Se não houver localização específica, aceita qualquer uma
+
+        return self.location_index.matches(location_text)
+
+    def from_desired_company(self, company_text):
+        """Verifica se é de uma empresa desejada"""
+        if not company_text or not self.config["companies"]:
+            return True  # Se não houver empresas específicas, aceita qualquer uma
+
+        return self.company_matcher.match(company_text) is not None
+
+    def select(self, cards):
+        """Cards que passam por todos os filtros, na ordem da página"""
+        # Perfis já convidados em execuções anteriores são ignorados
+        cards = [card for card in cards if card["url"] and card["url"] not in self.seen]
+        recruiter_flags = classify_many([f"{card['name']} {card['subtitle']}" for card in cards])
+
+        candidates = []
+        for card, is_recruiter in zip(cards, recruiter_flags):
+            if not is_recruiter:
+                continue
+            if not self.in_location(card["location"]) or not self.from_desired_company(card["subtitle"]):
+                continue
+
+            # Já conectado ou com convite pendente
+            if card["button_state"] in ("connected", "message"):
+                self.seen.add(card["url"])
+                continue
+            if card["button_state"] == "pending":
+                self.negative_cache.add(card["url"], PENDING)
+                continue
+
+            # Perfis sabidamente não convidáveis não são abertos de novo
+            reason = self.negative_cache.get(card["url"])
+            if reason:
+                print(f"⏭️ Pulando {card['name']} ({reason})")
+                continue
+
+            candidates.append(card)
+        return candidates
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Fila persistente de candidatos entre a coleta e o envio de convites
+A coleta grava os candidatos já classificados; o envio consome a fila dentro da cota diária
+"""
+
+import json
+import os
+import time
+
+from file_lock import lock_for
+from seen_profiles import canonical_profile_id
+
+CANDIDATE_QUEUE_FILE = "candidate_queue.json"
+DEFAULT_MAX_AGE_DAYS = 30
+MAX_ATTEMPTS = 3
+
+# Campos do card guardados na fila
+CANDIDATE_FIELDS = ("name", "url", "subtitle", "location", "button_state")
+
+
+class CandidateQueue:
+    """Fila FIFO de candidatos, indexada pelo perfil canônico
+
+    Cada operação lê e grava o arquivo sob lock, então a coleta e o envio podem rodar
+    em processos separados (ou ao mesmo tempo) sem perder entradas.
+    """
+
+    def __init__(self, path=CANDIDATE_QUEUE_FILE, max_age_days=DEFAULT_MAX_AGE_DAYS):
+        self.path = path
+        self.max_age_days = max_age_days
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar fila de candidatos: {e}")
+            return {}
+
+        oldest = time.time() - self.max_age_days * 24 * 60 * 60
+        return {key: entry for key, entry in entries.items() if entry.get("queued_at", 0) > oldest}
+
+    def _write(self, entries):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        return len(self._read())
+
+    def __contains__(self, profile_url):
+        return canonical_profile_id(profile_url) in self._read()
+
+    def push(self, cards, source=""):
+        """Enfileira os cards novos e retorna quantos entraram"""
+        with lock_for(self.path):
+            entries = self._read()
+            added = 0
+            for card in cards:
+                key = canonical_profile_id(card.get("url", ""))
+                if not key or key in entries:
+                    continue
+                entry = {field: card.get(field, "") for field in CANDIDATE_FIELDS}
+                entry.update({"queued_at": time.time(), "source": source, "attempts": 0})
+                entries[key] = entry
+                added += 1
+            self._write(entries)
+        return added
+
+    def peek(self, limit=None):
+        """Candidatos na ordem de chegada (sem remover)"""
+        candidates = sorted(self._read().values(), key=lambda entry: entry["queued_at"])
+        return candidates if limit is None else candidates[:limit]
+
+    def remove(self, profile_url):
+        """Tira o candidato da fila (convite enviado ou perfil descartado)"""
+        with lock_for(self.path):
+            entries = self._read()
+            if entries.pop(canonical_profile_id(profile_url), None) is not None:
+                self._write(entries)
+
+    def retry_later(self, profile_url):
+        """Conta uma falha; depois de MAX_ATTEMPTS o candidato sai da fila"""
+        with lock_for(self.path):
+            entries = self._read()
+            key = canonical_profile_id(profile_url)
+            entry = entries.get(key)
+            if entry is None:
+                return
+            entry["attempts"] = entry.get("attempts", 0) + 1
+            if entry["attempts"] >= MAX_ATTEMPTS:
+                del entries[key]
+            self._write(entries)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Extração dos cards da busca de pessoas em uma única ida ao navegador
+O mesmo script roda no Selenium (execute_script) e no nodriver (evaluate)
+"""
+
+import json
+
+# Cada card e seu botão principal recebem data-bot-card / data-bot-action = índice,
+# para que o bot consiga clicar depois sem procurar o elemento de novo
+_EXTRACT_CARDS_BODY = r"""
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : '';
+};
+const buttonState = (label) => {
+    label = label.toLowerCase();
+    if (label.includes('pending') || label.includes('pendente')) return 'pending';
+    if (label.includes('connect') || label.includes('conectar') || label.includes('invite')) return 'connect';
+    if (label.includes('message') || label.includes('mensagem')) return 'message';
+    if (label.includes('follow') || label.includes('seguir')) return 'follow';
+    return 'unknown';
+};
+let cards = Array.from(document.querySelectorAll("[data-view-name='search-entity-result']"));
+if (!cards.length) cards = Array.from(document.querySelectorAll('.entity-result__item'));
+if (!cards.length) cards = Array.from(document.querySelectorAll('li.reusable-search__result-container'));
+return JSON.stringify(cards.map((card, index) => {
+    card.setAttribute('data-bot-card', index);
+    const link = card.querySelector("a[href*='/in/']");
+    const nameEl = card.querySelector(".entity-result__title-text a span[aria-hidden='true']");
+    const button = card.querySelector('button');
+    let state = button ? buttonState((button.getAttribute('aria-label') || '') + ' ' + button.innerText) : 'none';
+    if (button) button.setAttribute('data-bot-action', index);
+    if (/\b(connected|conectado)\b/i.test(card.innerText) && state !== 'connect') state = 'connected';
+    return {
+        index: index,
+        name: nameEl ? nameEl.innerText.trim() : (link ? link.innerText.trim().split('\n')[0] : ''),
+        url: link ? link.href.split('?')[0] : '',
+        subtitle: text(card, '.entity-result__primary-subtitle'),
+        location: text(card, '.entity-result__secondary-subtitle'),
+        button_state: state
+    };
+}));
+"""
+
+EXTRACT_CARDS_JS = f"(() => {{{_EXTRACT_CARDS_BODY}}})()"
+
+
+def action_selector(card):
+    """Seletor CSS do botão principal de um card extraído"""
+    return f"[data-bot-action='{card['index']}']"
+
+
+def _parse(raw):
+    try:
+        return json.loads(raw) if raw else []
+    except (TypeError, ValueError):
+        return []
+
+
+def extract_cards(driver):
+    """Todos os cards da página atual (Selenium) como lista de dicts"""
+    return _parse(driver.execute_script(f"return {EXTRACT_CARDS_JS};"))
+
+
+async def extract_cards_async(tab):
+    """Todos os cards da página atual (nodriver) como lista de dicts"""
+    return _parse(await tab.evaluate(EXTRACT_CARDS_JS, return_by_value=True))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Identificação da empresa no subtítulo do card
+Trie de tokens montada uma vez a partir das empresas do config (com aliases)
+"""
+
+import re
+
+from recruiter_matcher import fold_text
+
+# alias -> empresa canônica (só entram as empresas que estão no config)
+# Produtos e subsidiárias que aparecem à toa em headlines (LinkedIn, GitHub, YouTube...)
+# ficam de fora; quem quiser pode incluí-los em company_aliases
+DEFAULT_COMPANY_ALIASES = {
+    "AWS": "Amazon",
+    "Amazon Web Services": "Amazon",
+    "Facebook": "Meta",
+    "Meta Platforms": "Meta",
+    "Alphabet": "Google",
+    "Google Cloud": "Google",
+    "Apple Inc": "Apple",
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[&+.][a-z0-9]+)*")
+_END = ""
+
+
+def tokenize(text):
+    return _TOKEN.findall(fold_text(text))
+
+
+class CompanyMatcher:
+    """Encontra a empresa canônica em uma única varredura da esquerda para a direita"""
+
+    def __init__(self, companies, aliases=None):
+        self.root = {}
+        self.companies = list(companies)
+        for company in self.companies:
+            self._insert(company, company)
+
+        wanted = {fold_text(c): c for c in self.companies}
+        for alias, canonical in (aliases or {}).items():
+            company = wanted.get(fold_text(canonical))
+            if company:
+                self._insert(alias, company)
+
+    @classmethod
+    def from_config(cls, config):
+        aliases = dict(DEFAULT_COMPANY_ALIASES)
+        aliases.update(config.get("company_aliases", {}))
+        return cls(config.get("companies", []), aliases)
+
+    def _insert(self, name, canonical):
+        tokens = tokenize(name)
+        if not tokens:
+            return
+        node = self.root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_END] = canonical
+
+    def match(self, text):
+        """Empresa canônica citada no texto (a mais longa na primeira posição) ou None"""
+        tokens = tokenize(text)
+        for start in range(len(tokens)):
+            node = self.root
+            found = None
+            for token in tokens[start:]:
+                node = node.get(token)
+                if node is None:
+                    break
+                found = node.get(_END, found)
+            if found:
+                return found
+        return None
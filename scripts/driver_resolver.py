@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Resolução do chromedriver com cache local
+O caminho do driver fica gravado junto com a versão do navegador instalado e só é
+resolvido de novo (pela rede) quando o navegador muda de versão; offline, usa o último driver
+(também gravado, para as próximas execuções offline não tentarem a rede a cada vez)
+"""
+
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import time
+
+from file_lock import lock_for
+
+DRIVER_CACHE_FILE = "driver_cache.json"
+# Um driver de fallback (offline) vale por um dia; depois a resolução pela rede é tentada de novo
+FALLBACK_RETRY_SECONDS = 24 * 60 * 60
+
+_VERSION = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+
+def browser_version(browser_path):
+    """Versão do Chrome/Chromium instalado (ex.: "126.0.6478.126") ou None"""
+    if platform.system() == "Windows":
+        # O chrome.exe não imprime a versão; o instalador registra em BLBeacon
+        command = ["reg", "query", "HKEY_CURRENT_USER\\Software\\Google\\Chrome\\BLBeacon", "/v", "version"]
+    else:
+        command = [browser_path, "--version"]
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION.search(output)
+    return match.group(1) if match else None
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _install_with_manager(version):
+    """Baixa/localiza o driver pelo webdriver_manager (precisa de rede)
+
+    A versão exata não é repassada: o patch de um Chromium de distro pode não estar publicado
+    no Chrome for Testing, e sem driver_version o manager escolhe o último patch do mesmo build.
+    """
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def _read_cache(cache_file):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_entry(cache_file, browser_path, entry):
+    with lock_for(cache_file):
+        cache = _read_cache(cache_file)
+        cache[browser_path] = entry
+        tmp_path = f"{cache_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cache_file)
+
+
+def resolve_chromedriver(browser_path, cache_file=DRIVER_CACHE_FILE, installer=_install_with_manager):
+    """Caminho do chromedriver para o navegador, ou None para deixar o Selenium Manager decidir
+
+    Caminho rápido: mesmo binário (mtime) e driver ainda no disco -> nenhuma chamada externa.
+    """
+    cache = _read_cache(cache_file)
+    entry = cache.get(browser_path, {})
+    driver_path = entry.get("driver_path")
+    driver_exists = bool(driver_path) and os.path.exists(driver_path)
+    # Um fallback vencido não serve: é hora de tentar a rede de novo
+    usable = driver_exists and (not entry.get("fallback") or time.time() < entry.get("retry_after", 0))
+    mtime = _mtime(browser_path)
+
+    if usable and entry.get("browser_mtime") == mtime:
+        return driver_path
+
+    version = browser_version(browser_path)
+    if usable and version and entry.get("browser_version") == version:
+        entry = dict(entry, browser_mtime=mtime)
+    else:
+        try:
+            entry = {"browser_version": version, "browser_mtime": mtime, "driver_path": installer(version)}
+        except Exception as e:
+            # Offline ou sem webdriver_manager: o último driver conhecido ou o do PATH
+            fallback = driver_path if driver_exists else shutil.which("chromedriver")
+            print(f"⚠️ Não foi possível resolver o chromedriver ({e}); usando {fallback or 'Selenium Manager'}")
+            if not fallback:
+                return None
+            entry = {
+                "browser_version": version,
+                "browser_mtime": mtime,
+                "driver_path": fallback,
+                "fallback": True,
+                "retry_after": time.time() + FALLBACK_RETRY_SECONDS,
+            }
+
+    _write_entry(cache_file, browser_path, entry)
+    return entry["driver_path"]
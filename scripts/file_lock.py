@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Lock de arquivo entre processos (fcntl no Linux/MacOS, msvcrt no Windows)
+"""
+
+import os
+import platform
+import time
+
+if platform.system() == "Windows":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Lock exclusivo baseado em um arquivo .lock, usado como context manager"""
+
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.timeout = timeout
+        self.handle = None
+
+    def acquire(self):
+        self.handle = open(self.path, 'a+')
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                if platform.system() == "Windows":
+                    self.handle.seek(0)
+                    msvcrt.locking(self.handle.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return self
+            except OSError:
+                if time.time() >= deadline:
+                    self.handle.close()
+                    self.handle = None
+                    raise TimeoutError(f"Lock ocupado: {self.path}")
+                time.sleep(0.05)
+
+    def release(self):
+        if not self.handle:
+            return
+        try:
+            if platform.system() == "Windows":
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.handle.close()
+            self.handle = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def lock_for(path):
+    """Lock padrão associado a um arquivo de estado"""
+    return FileLock(f"{path}.lock")
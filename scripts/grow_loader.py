@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Carregamento adaptativo da página "People you may know" (/mynetwork/grow/)
+Rola enquanto cada rolagem trouxer cards novos e até ter candidatos para a cota restante,
+em vez de um número fixo de rolagens com pausa fixa.
+As sugestões são lidas (nome, headline, perfil) em uma única consulta estruturada,
+sem a busca por texto do tab.find_all, e o botão de cada uma fica marcado para o clique
+"""
+
+import asyncio
+import json
+
+from recruiter_matcher import classify_many
+
+# Botões de convite das sugestões ("Invite Fulano to connect" / "Convidar Fulano para se conectar")
+COUNT_CONNECT_JS = r"""
+Array.from(document.querySelectorAll('button')).filter(
+    (b) => /to connect|para se conectar|para conectar/i.test(b.getAttribute('aria-label') || '')
+).length
+"""
+
+# Leva o último card para a tela, o que dispara o carregamento do próximo lote
+SCROLL_JS = r"""
+(() => {
+    const buttons = Array.from(document.querySelectorAll('button')).filter(
+        (b) => /to connect|para se conectar|para conectar/i.test(b.getAttribute('aria-label') || ''));
+    if (buttons.length) buttons[buttons.length - 1].scrollIntoView({block: 'end'});
+    window.scrollBy(0, window.innerHeight);
+})()
+"""
+
+
+# Cada botão de convite recebe data-bot-connect = índice; o card é o ancestral com o link do perfil
+COLLECT_SUGGESTIONS_JS = r"""
+(() => {
+    const pattern = /to connect|para se conectar|para conectar/i;
+    const buttons = Array.from(document.querySelectorAll('button')).filter(
+        (b) => pattern.test(b.getAttribute('aria-label') || ''));
+    return JSON.stringify(buttons.map((button, index) => {
+        button.setAttribute('data-bot-connect', index);
+        let card = button.parentElement;
+        while (card && card !== document.body && !card.querySelector("a[href*='/in/']")) {
+            card = card.parentElement;
+        }
+        const link = card && card !== document.body ? card.querySelector("a[href*='/in/']") : null;
+        const lines = (link || button.parentElement || button).innerText.split('\n').map((l) => l.trim()).filter(Boolean);
+        const label = (button.getAttribute('aria-label') || '').match(
+            /^(?:invite|convidar)\s+(.+?)\s+(?:to connect|para se conectar|para conectar)/i);
+        const name = label ? label[1] : (lines[0] || '');
+        return {
+            index: index,
+            name: name,
+            headline: lines.find((l) => l !== name) || '',
+            url: link ? link.href.split('?')[0] : ''
+        };
+    }));
+})()
+"""
+
+
+async def count_suggestions(tab):
+    count = await tab.evaluate(COUNT_CONNECT_JS, return_by_value=True)
+    # Com 0 botões o nodriver devolve o RemoteObject em vez do número
+    return int(count) if isinstance(count, (int, float)) else 0
+
+
+async def load_suggestions(tab, wanted, max_scrolls=30, settle=3.0, poll=0.25):
+    """Rola até ter `wanted` cards ou até uma rolagem não trazer nada novo; retorna o total
+
+    Depois de cada rolagem espera no máximo `settle` segundos pelo lote seguinte,
+    mas segue assim que ele aparece.
+    """
+    loop = asyncio.get_event_loop()
+    count = await count_suggestions(tab)
+    print(f"Cards iniciais: {count}")
+
+    scrolls = 0
+    while count < wanted and scrolls < max_scrolls:
+        await tab.evaluate(SCROLL_JS)
+        scrolls += 1
+
+        deadline = loop.time() + settle
+        new_count = await count_suggestions(tab)
+        while new_count <= count and loop.time() < deadline:
+            await asyncio.sleep(poll)
+            new_count = await count_suggestions(tab)
+
+        print(f"Rolagem {scrolls}: +{new_count - count} cards (total {new_count})")
+        if new_count <= count:
+            break
+        count = new_count
+
+    return count
+
+
+async def collect_suggestions(tab):
+    """Todas as sugestões carregadas como dicts (index, name, headline, url)"""
+    raw = await tab.evaluate(COLLECT_SUGGESTIONS_JS, return_by_value=True)
+    try:
+        return json.loads(raw) if raw else []
+    except (TypeError, ValueError):
+        return []
+
+
+def connect_selector(suggestion):
+    """Seletor CSS do botão de convite de uma sugestão coletada"""
+    return f"button[data-bot-connect='{suggestion['index']}']"
+
+
+def select_suggestions(suggestions, limit, recruiters_only=False):
+    """Sugestões a convidar: só as de recrutadores (pela headline) se pedido, até `limit`"""
+    if recruiters_only:
+        matches = classify_many([s["headline"] for s in suggestions])
+        suggestions = [s for s, is_match in zip(suggestions, matches) if is_match]
+    return suggestions[:max(0, limit)]
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Coleta paralela de Tech Recruiters (nodriver)
+Uma busca por termo (ou termo x localização) em abas simultâneas do mesmo navegador,
+com limite de concorrência; os resultados são mesclados, filtrados e enfileirados
+"""
+
+import asyncio
+import os
+import platform
+import sys
+from urllib.parse import quote
+
+try:
+    import nodriver as uc
+except ImportError:
+    uc = None
+
+from api_harvest import harvest_search_page
+from bot_config import load_config
+from bot_flags import pop_flag
+from browser_daemon import start_nodriver
+from browser_presets import RssSampler, nodriver_pid
+from candidate_filter import CandidateFilter
+from candidate_queue import CandidateQueue
+from negative_cache import NegativeCache
+from lean_mode import LeanStats, enable_lean_nodriver
+from pacing import human_pause
+from search_paginator import page_url
+from seen_profiles import SeenProfiles, canonical_profile_id
+
+SEARCH_BASE_URL = "https://www.linkedin.com/search/results/people/?keywords="
+
+
+def build_queries(config):
+    """Uma busca por termo, ou por termo x localização quando houver localizações"""
+    locations = config["harvest_locations"] or ([config["location"]] if config["location"] else [])
+    if not locations:
+        return [f'"{term}"' for term in config["search_terms"]]
+    return [f'"{term}" AND "{location}"' for term in config["search_terms"] for location in locations]
+
+
+def get_system_paths():
+    if len(sys.argv) > 2:
+        return sys.argv[1], sys.argv[2]
+    system = platform.system()
+    if system == "Darwin":  # MacOS
+        return ("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+                os.path.expanduser("~/Library/Application Support/Google/Chrome/Profile 1/"))
+    if system == "Linux":
+        return "/usr/bin/chromium", "/home/capi/Documents/botdata/"
+    return ("C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+            "C:\\Users\\%USERNAME%\\AppData\\Local\\Google\\Chrome\\User Data")
+
+
+class ParallelHarvester:
+    """Junta as abas em um único fluxo de candidatos sem repetição"""
+
+    def __init__(self, browser, config, candidate_filter, queue, lean_stats=None):
+        self.browser = browser
+        self.lean_stats = lean_stats
+        self.config = config
+        self.candidate_filter = candidate_filter
+        self.queue = queue
+        self.semaphore = asyncio.Semaphore(max(1, int(config["harvest_concurrency"])))
+        self.seen_ids = set()
+        self.queued = 0
+
+    def _merge(self, query, cards):
+        """Descarta o que outra aba já trouxe e enfileira o que passar nos filtros"""
+        fresh = []
+        for card in cards:
+            key = canonical_profile_id(card["url"])
+            if key and key not in self.seen_ids:
+                self.seen_ids.add(key)
+                fresh.append(card)
+        added = self.queue.push(self.candidate_filter.select(fresh), source=query)
+        self.queued += added
+        return len(fresh), added
+
+    async def harvest_query(self, query):
+        async with self.semaphore:
+            tab = await self.browser.get("about:blank", new_tab=True)
+            try:
+                if self.lean_stats is not None:
+                    await enable_lean_nodriver(tab, self.lean_stats)
+                for page in range(1, self.config["harvest_max_pages"] + 1):
+                    url = page_url(SEARCH_BASE_URL + quote(query), page)
+                    tab, cards = await harvest_search_page(self.browser, url, timeout=15, tab=tab)
+                    if not cards:
+                        break
+                    fresh, added = self._merge(query, cards)
+                    print(f"🔍 {query} | página {page}: {fresh} novos perfis, {added} na fila")
+                    await human_pause(2, 3)
+            except Exception as e:
+                print(f"Erro na busca {query}: {e}")
+            finally:
+                await tab.close()
+
+    async def run(self, queries):
+        await asyncio.gather(*(self.harvest_query(query) for query in queries))
+        return self.queued
+
+
+async def main():
+    lean_stats = LeanStats() if pop_flag("--lean") else None
+    headless = pop_flag("--headless")
+    attach = pop_flag("--attach")
+    rss = None
+    config = load_config()
+    queries = build_queries(config)
+    browser_path, profile_path = get_system_paths()
+
+    seen = SeenProfiles()
+    negative_cache = NegativeCache(ttl_days=config["negative_cache_days"])
+    queue = CandidateQueue()
+    candidate_filter = CandidateFilter(config, seen, negative_cache)
+
+    print(f"🚀 Coleta paralela: {len(queries)} buscas, {config['harvest_concurrency']} abas por vez")
+    try:
+        browser, attached = await start_nodriver(browser_path, profile_path, headless, attach)
+        rss = RssSampler(nodriver_pid(browser)).start()
+        harvester = ParallelHarvester(browser, config, candidate_filter, queue, lean_stats)
+        queued = await harvester.run(queries)
+        print(f"📥 {queued} candidatos novos na fila ({len(harvester.seen_ids)} perfis vistos)")
+        if not attached:
+            browser.stop()
+        if lean_stats:
+            print(lean_stats.summary())
+    finally:
+        seen.close()
+        negative_cache.save()
+        if rss:
+            rss.stop("harvest_recruiters.py")
+
+
+if __name__ == "__main__":
+    uc.loop().run_until_complete(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Resolução do modal de convite
+Observa todas as variantes conhecidas ao mesmo tempo e retorna assim que a primeira aparece,
+em vez de encadear um timeout por variante
+"""
+
+import asyncio
+import json
+import time
+
+# Estados possíveis do modal / página depois de clicar em Conectar
+ADD_NOTE = "add_note"
+NOTE_FIELD = "note_field"
+SEND_WITHOUT_NOTE = "send_without_note"
+SEND = "send"
+EMAIL_REQUIRED = "email_required"
+LIMIT_REACHED = "limit_reached"
+DISMISS = "dismiss"
+SENT = "sent"
+
+_PROBE_JS = r"""
+((wanted) => {
+    const dialog = document.querySelector("[role='dialog'], .artdeco-modal");
+    const scope = dialog || document;
+    const label = (el) => ((el.getAttribute('aria-label') || '') + ' ' + (el.innerText || '')).toLowerCase();
+    const button = (phrases, exact) => Array.from(scope.querySelectorAll('button')).find((b) => {
+        if (b.disabled) return false;
+        const text = (b.innerText || '').trim().toLowerCase();
+        return phrases.some((p) => label(b).includes(p)) || (exact || []).includes(text);
+    });
+    const probes = {
+        add_note: () => button(['add a note', 'adicionar nota']),
+        note_field: () => scope.querySelector("textarea#custom-message, textarea[name='message']"),
+        send_without_note: () => button(['send without', 'enviar sem']),
+        send: () => button(['send invitation', 'send now', 'enviar convite', 'enviar agora'], ['send', 'enviar']),
+        email_required: () => dialog && dialog.querySelector("input[type='email']"),
+        limit_reached: () => dialog && /invitation limit|limite de convites|limite semanal/i.test(dialog.innerText) ? dialog : null,
+        dismiss: () => dialog && button(['dismiss', 'fechar']),
+        sent: () => !dialog && Array.from(document.querySelectorAll(".artdeco-toast-item, [role='alert']"))
+            .find((t) => /invitation sent|convite enviado/i.test(t.innerText))
+    };
+    for (const state of wanted) {
+        const el = probes[state] && probes[state]();
+        if (el) {
+            document.querySelectorAll('[data-bot-modal]').forEach((e) => e.removeAttribute('data-bot-modal'));
+            el.setAttribute('data-bot-modal', state);
+            return state;
+        }
+    }
+    return null;
+})(%s)
+"""
+
+
+def probe_script(states):
+    """Expressão JS que devolve o primeiro estado presente (na ordem de prioridade pedida)"""
+    return _PROBE_JS % json.dumps(list(states))
+
+
+def modal_selector(state):
+    """Seletor CSS do elemento marcado pelo último probe"""
+    return f"[data-bot-modal='{state}']"
+
+
+def resolve_modal(driver, states, timeout=10, poll=0.2):
+    """Selenium: espera qualquer um dos estados e retorna o primeiro que aparecer (ou None)"""
+    script = f"return {probe_script(states)};"
+    deadline = time.monotonic() + timeout
+    while True:
+        state = driver.execute_script(script)
+        if state or time.monotonic() >= deadline:
+            return state
+        time.sleep(poll)
+
+
+def click_modal(driver, state):
+    driver.execute_script(f"document.querySelector(\"{modal_selector(state)}\").click();")
+
+
+async def resolve_modal_async(tab, states, timeout=10, poll=0.2):
+    """nodriver: mesma lógica do resolve_modal, sem bloquear o event loop"""
+    script = probe_script(states)
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    while True:
+        state = await tab.evaluate(script, return_by_value=True)
+        # Para valores falsos (null) o nodriver devolve o próprio RemoteObject, não None
+        if not isinstance(state, str):
+            state = None
+        if state or loop.time() >= deadline:
+            return state
+        await asyncio.sleep(poll)
+
+
+async def click_modal_async(tab, state):
+    await tab.evaluate(f"document.querySelector(\"{modal_selector(state)}\").click()")
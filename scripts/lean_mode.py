@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Modo leve (opcional) para as páginas da busca e do /mynetwork/grow/
+Bloqueia imagens, mídia, fontes e rastreadores via CDP (Network.setBlockedURLs) e injeta
+um CSS sem transições/animações, para o modal de convite responder na hora
+"""
+
+import json
+from collections import Counter
+
+try:
+    import nodriver as uc
+except ImportError:
+    uc = None
+
+BLOCKED_URL_PATTERNS = [
+    # Imagens (avatares, banners, logos de empresa)
+    "*media.licdn.com/dms/image*",
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*",
+    # Vídeo e áudio
+    "*.mp4*", "*.webm*", "*.m3u8*", "*dms.licdn.com/playlist*",
+    # Fontes
+    "*.woff*", "*.ttf*", "*.otf*",
+    # Rastreamento e analytics
+    "*/li/track*", "*px.ads.linkedin.com*", "*/collect?*", "*/sensorCollect*",
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*",
+]
+
+NO_ANIMATION_CSS = (
+    "*, *::before, *::after {"
+    " transition: none !important; animation: none !important; scroll-behavior: auto !important; }"
+)
+
+# Injetado em todo documento novo da aba, antes dos scripts da página
+NO_ANIMATION_JS = f"""
+(() => {{
+    const add = () => {{
+        const style = document.createElement('style');
+        style.setAttribute('data-bot-lean', '');
+        style.textContent = {json.dumps(NO_ANIMATION_CSS)};
+        (document.head || document.documentElement).appendChild(style);
+    }};
+    if (document.documentElement) add(); else document.addEventListener('DOMContentLoaded', add);
+}})();
+"""
+
+# Tamanho médio (bytes) de cada tipo bloqueado, usado só para estimar a economia
+AVERAGE_BYTES = {
+    "Image": 25_000,
+    "Media": 400_000,
+    "Font": 40_000,
+    "Ping": 500,
+    "XHR": 2_000,
+    "Fetch": 2_000,
+    "Script": 30_000,
+    "Other": 5_000,
+}
+
+
+class LeanStats:
+    """Requisições bloqueadas por tipo e bytes realmente recebidos"""
+
+    def __init__(self):
+        self.blocked = Counter()
+        self.received_bytes = 0
+        self.requests = 0
+
+    def record_blocked(self, resource_type):
+        self.blocked[resource_type or "Other"] += 1
+
+    def record_finished(self, encoded_bytes):
+        self.requests += 1
+        self.received_bytes += int(encoded_bytes or 0)
+
+    def saved_bytes(self):
+        """Estimativa dos bytes economizados (o corpo bloqueado nunca chega a ser baixado)"""
+        return sum(AVERAGE_BYTES.get(kind, AVERAGE_BYTES["Other"]) * count for kind, count in self.blocked.items())
+
+    def summary(self):
+        blocked = sum(self.blocked.values())
+        kinds = ", ".join(f"{kind}: {count}" for kind, count in self.blocked.most_common()) or "nenhuma"
+        return (
+            f"🪶 Modo leve: {blocked} requisições bloqueadas ({kinds}), "
+            f"~{self.saved_bytes() / 1_000_000:.1f} MB economizados; "
+            f"{self.requests} requisições carregadas ({self.received_bytes / 1_000_000:.1f} MB)"
+        )
+
+
+# Selenium
+
+def enable_lean_options(chrome_options):
+    """Liga os logs de performance, de onde saem as estatísticas no Selenium"""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def apply_lean_selenium(driver):
+    """Aplica o bloqueio e o CSS na aba atual do driver (as próximas navegações herdam)
+
+    O execute_cdp_cmd só alcança a aba atual: cada aba nova (pré-carregamento da busca,
+    aba de perfis) precisa passar por aqui antes da primeira navegação.
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NO_ANIMATION_JS})
+
+
+def enable_lean_selenium(driver):
+    """Liga o modo leve na aba atual e retorna as estatísticas da execução"""
+    apply_lean_selenium(driver)
+    return LeanStats()
+
+
+def collect_selenium_stats(driver, stats):
+    """Lê os eventos de rede acumulados no log de performance"""
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return stats
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        params = message.get("params", {})
+        if message.get("method") == "Network.loadingFailed" and params.get("blockedReason"):
+            stats.record_blocked(params.get("type"))
+        elif message.get("method") == "Network.loadingFinished":
+            stats.record_finished(params.get("encodedDataLength"))
+    return stats
+
+
+# nodriver
+
+async def enable_lean_nodriver(tab, stats=None):
+    """Aplica o bloqueio e o CSS na aba; chame antes de navegar"""
+    stats = stats or LeanStats()
+
+    async def on_failed(event):
+        if event.blocked_reason:
+            stats.record_blocked(event.type_.value if event.type_ else None)
+
+    async def on_finished(event):
+        stats.record_finished(event.encoded_data_length)
+
+    await tab.send(uc.cdp.network.enable())
+    await tab.send(uc.cdp.network.set_blocked_ur_ls(urls=BLOCKED_URL_PATTERNS))
+    await tab.send(uc.cdp.page.add_script_to_evaluate_on_new_document(source=NO_ANIMATION_JS))
+    tab.add_handler(uc.cdp.network.LoadingFailed, on_failed)
+    tab.add_handler(uc.cdp.network.LoadingFinished, on_finished)
+    return stats
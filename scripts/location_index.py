@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Índice de localizações para o filtro do bot
+Aliases sem acento -> caminho (país, estado, cidade), montado a partir do config_location.json
+e salvo em disco; só é reconstruído quando o config muda
+"""
+
+import hashlib
+import json
+import os
+
+from recruiter_matcher import fold_text
+
+LOCATION_INDEX_FILE = "location_index.json"
+INDEX_VERSION = 2
+
+REMOTE = ("remote",)
+REMOTE_WORDS = ("remote", "remoto", "remota", "home office", "anywhere", "teletrabalho")
+
+# Palavras que o LinkedIn coloca em volta do nome do lugar
+NOISE_PREFIXES = ("greater ", "grande ", "regiao metropolitana de ", "regiao de ")
+NOISE_SUFFIXES = (" metropolitan area", " metropolitan region", " area", " region",
+                  " e regiao", " and region", " metro")
+
+# país -> aliases
+COUNTRIES = {
+    "brasil": ["brasil", "brazil", "br"],
+    "portugal": ["portugal", "pt"],
+    "estados unidos": ["estados unidos", "eua", "united states", "usa", "us"],
+}
+
+# (país, sigla) -> nome do estado
+STATES = {
+    ("brasil", "ac"): "acre", ("brasil", "al"): "alagoas", ("brasil", "ap"): "amapa",
+    ("brasil", "am"): "amazonas", ("brasil", "ba"): "bahia", ("brasil", "ce"): "ceara",
+    ("brasil", "df"): "distrito federal", ("brasil", "es"): "espirito santo",
+    ("brasil", "go"): "goias", ("brasil", "ma"): "maranhao", ("brasil", "mt"): "mato grosso",
+    ("brasil", "ms"): "mato grosso do sul", ("brasil", "mg"): "minas gerais",
+    ("brasil", "pa"): "para", ("brasil", "pb"): "paraiba", ("brasil", "pr"): "parana",
+    ("brasil", "pe"): "pernambuco", ("brasil", "pi"): "piaui", ("brasil", "rj"): "rio de janeiro",
+    ("brasil", "rn"): "rio grande do norte", ("brasil", "rs"): "rio grande do sul",
+    ("brasil", "ro"): "rondonia", ("brasil", "rr"): "roraima", ("brasil", "sc"): "santa catarina",
+    ("brasil", "sp"): "sao paulo", ("brasil", "se"): "sergipe", ("brasil", "to"): "tocantins",
+    ("portugal", "lisboa"): "distrito de lisboa", ("portugal", "porto"): "distrito do porto",
+}
+
+# (país, estado) -> cidades
+CITIES = {
+    ("brasil", "sp"): ["sao paulo", "campinas", "santos", "sao jose dos campos", "ribeirao preto",
+                       "sorocaba", "osasco", "barueri", "santo andre", "sao bernardo do campo",
+                       "jundiai", "guarulhos", "sao carlos"],
+    ("brasil", "rj"): ["rio de janeiro", "niteroi", "petropolis"],
+    ("brasil", "mg"): ["belo horizonte", "uberlandia", "juiz de fora"],
+    ("brasil", "pr"): ["curitiba", "londrina", "maringa"],
+    ("brasil", "rs"): ["porto alegre", "caxias do sul"],
+    ("brasil", "sc"): ["florianopolis", "joinville", "blumenau"],
+    ("brasil", "df"): ["brasilia"],
+    ("brasil", "pe"): ["recife"], ("brasil", "ba"): ["salvador"], ("brasil", "ce"): ["fortaleza"],
+    ("brasil", "go"): ["goiania"], ("brasil", "am"): ["manaus"], ("brasil", "pa"): ["belem"],
+    ("brasil", "es"): ["vitoria"], ("brasil", "rn"): ["natal"], ("brasil", "pb"): ["joao pessoa"],
+    ("brasil", "al"): ["maceio"], ("brasil", "se"): ["aracaju"], ("brasil", "pi"): ["teresina"],
+    ("brasil", "ma"): ["sao luis"], ("brasil", "mt"): ["cuiaba"], ("brasil", "ms"): ["campo grande"],
+    ("portugal", "lisboa"): ["lisboa"], ("portugal", "porto"): ["porto"],
+}
+
+# grafia alternativa -> nome canônico da cidade (mesmo caminho no índice)
+CITY_ALIASES = {"lisbon": "lisboa", "oporto": "porto"}
+
+
+def strip_noise(text):
+    for prefix in NOISE_PREFIXES:
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+    for suffix in NOISE_SUFFIXES:
+        if text.endswith(suffix):
+            text = text[:-len(suffix)]
+    return text.strip()
+
+
+def place_parts(text):
+    """Partes do texto já sem acento ("Campinas, São Paulo (Remote)" -> campinas, sao paulo, remote)"""
+    for part in text.replace("(", ",").replace(")", ",").replace(" - ", ",").split(","):
+        part = strip_noise(part.strip())
+        if part:
+            yield part
+
+
+def build_aliases(location_aliases=None):
+    """Monta o dicionário alias -> caminho; cidades vencem estados com o mesmo nome"""
+    aliases = {}
+    for country, names in COUNTRIES.items():
+        for name in names:
+            aliases[name] = (country,)
+    for (country, code), name in STATES.items():
+        aliases.setdefault(code, (country, code))
+        aliases[name] = (country, code)
+        aliases[f"estado de {name}"] = (country, code)
+        aliases[f"state of {name}"] = (country, code)
+    for (country, code), cities in CITIES.items():
+        for city in cities:
+            aliases[city] = (country, code, city)
+    for alias, city in CITY_ALIASES.items():
+        aliases[alias] = aliases[city]
+    return aliases
+
+
+class LocationIndex:
+    """Resolve o texto de localização de um card com uma consulta de dicionário"""
+
+    def __init__(self, aliases, target_text="", include_remote=False):
+        self.aliases = aliases
+        self.target_text = fold_text(target_text)
+        self.include_remote = include_remote
+        # Memo das consultas; separado de `aliases`, que é o que vai para o disco
+        self._resolved = {}
+        self.target = self.resolve(target_text) if target_text else None
+        self._matches = {}
+
+    @classmethod
+    def build(cls, config):
+        aliases = build_aliases()
+        index = cls(aliases)
+        # Aliases do usuário apontam para qualquer texto que o índice já resolve
+        for alias, location in config.get("location_aliases", {}).items():
+            path = index.resolve(location)
+            if path:
+                aliases[fold_text(alias)] = path
+        return cls(aliases, config.get("location", ""), config.get("include_remote", False))
+
+    def resolve(self, location_text):
+        """Caminho mais específico encontrado no texto, REMOTE se só há "remoto", ou None"""
+        place, remote = self._lookup(location_text)
+        return place or (REMOTE if remote else None)
+
+    def _lookup(self, location_text):
+        """(caminho do lugar ou None, texto fala em remoto); o remoto não substitui o lugar"""
+        text = fold_text(location_text)
+        if text in self._resolved:
+            return self._resolved[text]
+
+        remote = any(word in text for word in REMOTE_WORDS)
+        best = self.aliases.get(text)
+        if best is None:
+            for part in place_parts(text):
+                path = self.aliases.get(part)
+                if not path:
+                    continue
+                if path == REMOTE:
+                    remote = True
+                elif best is None or (len(path) > len(best) and path[:len(best)] == best):
+                    best = path
+                # Partes contraditórias (ex: "Campinas, RJ"): fica com a primeira
+        if best == REMOTE:
+            best, remote = None, True
+        self._resolved[text] = (best, remote)
+        return best, remote
+
+    def _names_target(self, text):
+        """O texto cita o alvo pelo nome em alguma parte (ex: "Campinas, São Paulo, Brasil")"""
+        return any(self.aliases.get(part) == self.target for part in place_parts(fold_text(text)))
+
+    def matches(self, location_text):
+        """Mesma regra do filtro antigo (um contém o outro), mas por região
+
+        Um card que cita o alvo pelo nome também passa, como no filtro antigo: para o alvo
+        "São Paulo", "Campinas, São Paulo, Brasil" é aceito (o estado tem o nome da cidade).
+        """
+        if location_text in self._matches:
+            return self._matches[location_text]
+
+        path, remote = self._lookup(location_text)
+        if self.target == REMOTE:
+            result = remote
+        elif path and self.target:
+            shorter = min(len(path), len(self.target))
+            result = path[:shorter] == self.target[:shorter] or self._names_target(location_text)
+            result = result or (remote and self.include_remote)
+        elif remote:
+            result = self.include_remote
+        else:
+            # Lugar fora do índice: comparação textual sem acentos
+            text = fold_text(location_text)
+            result = bool(text) and (self.target_text in text or text in self.target_text)
+
+        self._matches[location_text] = result
+        return result
+
+    def to_dict(self):
+        return {
+            "aliases": {alias: list(path) for alias, path in self.aliases.items() if path},
+            "target_text": self.target_text,
+            "include_remote": self.include_remote,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        aliases = {alias: tuple(path) for alias, path in data["aliases"].items()}
+        return cls(aliases, data["target_text"], data["include_remote"])
+
+
+def config_fingerprint(config):
+    relevant = {
+        "version": INDEX_VERSION,
+        "location": config.get("location", ""),
+        "location_aliases": config.get("location_aliases", {}),
+        "include_remote": config.get("include_remote", False),
+    }
+    return hashlib.sha1(json.dumps(relevant, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_location_index(config, cache_file=LOCATION_INDEX_FILE):
+    """Carrega o índice do disco; reconstrói e salva se o config mudou"""
+    fingerprint = config_fingerprint(config)
+    try:
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("fingerprint") == fingerprint:
+                return LocationIndex.from_dict(cached)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Erro ao ler índice de localização: {e}")
+
+    index = LocationIndex.build(config)
+    try:
+        data = index.to_dict()
+        data["fingerprint"] = fingerprint
+        tmp_path = f"{cache_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        print(f"Erro ao salvar índice de localização: {e}")
+    return index
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Compactação do AccountLog.txt
+Dobra entradas antigas em rollups diários e arquiva as linhas brutas em segmentos .gz
+"""
+
+import gzip
+import os
+from datetime import datetime, timedelta
+
+from file_lock import lock_for
+from quota_ledger import ACCOUNT_LOG, WINDOW_DAYS, parse_log_line, rollup_path
+
+ARCHIVE_DIR = "logs"
+ROLLUP_LABEL = "Daily rollup"
+
+
+def load_rollups(path):
+    """Lê os rollups existentes como {data: quantidade}"""
+    rollups = {}
+    if not os.path.exists(path):
+        return rollups
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            parsed = parse_log_line(line)
+            if parsed:
+                day, count = parsed
+                rollups[day] = rollups.get(day, 0) + count
+    return rollups
+
+
+def write_atomic(path, lines):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+
+
+def compact_account_log(log_file=ACCOUNT_LOG, window_days=WINDOW_DAYS, archive_dir=ARCHIVE_DIR):
+    """Mantém no log apenas a janela de cota; o resto vira rollup + segmento arquivado
+
+    Retorna o número de linhas arquivadas.
+    """
+    with lock_for(log_file):
+        return _compact_locked(log_file, window_days, archive_dir)
+
+
+def _compact_locked(log_file, window_days, archive_dir):
+    if not os.path.exists(log_file):
+        return 0
+
+    cutoff = (datetime.now().date() - timedelta(days=window_days - 1)).strftime("%Y-%m-%d")
+
+    with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+        lines = f.readlines()
+
+    live_lines = []
+    archived_lines = []
+    folded = {}
+    for line in lines:
+        parsed = parse_log_line(line)
+        if parsed and parsed[0] >= cutoff:
+            live_lines.append(line)
+            continue
+
+        archived_lines.append(line)
+        if parsed:
+            day, count = parsed
+            folded[day] = folded.get(day, 0) + count
+
+    if not archived_lines:
+        return 0
+
+    # Segmento comprimido com as linhas brutas, antes de tocar no log vivo
+    os.makedirs(archive_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    name = os.path.splitext(os.path.basename(log_file))[0]
+    segment = os.path.join(archive_dir, f"{name}-{stamp}.txt.gz")
+    with gzip.open(segment, 'at', encoding='utf-8') as f:
+        f.writelines(archived_lines)
+
+    # Log vivo primeiro: se o processo cair antes do rollup, as linhas ficam só no segmento,
+    # nunca no log e no rollup ao mesmo tempo (o ledger as contaria em dobro)
+    write_atomic(log_file, live_lines)
+
+    rollups_file = rollup_path(log_file)
+    rollups = load_rollups(rollups_file)
+    for day, count in folded.items():
+        rollups[day] = rollups.get(day, 0) + count
+    write_atomic(rollups_file, [f"{ROLLUP_LABEL}: {count} on {day}\n" for day, count in sorted(rollups.items())])
+    print(f"🗜️ Log compactado: {len(archived_lines)} linhas arquivadas em {segment}")
+    return len(archived_lines)
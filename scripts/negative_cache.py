@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Cache negativo de perfis que não podem ser convidados
+Evita recarregar perfis que só oferecem Seguir, já têm convite pendente ou escondem o Conectar
+"""
+
+import json
+import os
+import time
+
+from file_lock import lock_for
+from invite_modal import EMAIL_REQUIRED
+from seen_profiles import canonical_profile_id
+
+NEGATIVE_CACHE_FILE = "negative_cache.json"
+DEFAULT_TTL_DAYS = 14
+
+# Códigos de motivo
+FOLLOW_ONLY = "follow_only"
+PENDING = "pending"
+NO_CONNECT = "no_connect"
+# EMAIL_REQUIRED (de invite_modal): o modal de convite pede o e-mail do perfil
+
+# Lê os botões do topo do perfil e devolve o motivo (ou null se há Conectar)
+PROFILE_ACTIONS_JS = """
+const labels = Array.from(document.querySelectorAll('main button'))
+    .map(b => ((b.getAttribute('aria-label') || '') + ' ' + b.innerText).toLowerCase());
+if (labels.some(l => l.includes('pending') || l.includes('pendente'))) return 'pending';
+if (labels.some(l => l.includes('connect') || l.includes('conectar'))) return null;
+if (labels.some(l => l.includes('follow') || l.includes('seguir'))) return 'follow_only';
+return 'no_connect';
+"""
+
+
+def unconnectable_reason(driver):
+    """Motivo pelo qual o perfil aberto no driver Selenium não pode ser convidado"""
+    try:
+        return driver.execute_script(PROFILE_ACTIONS_JS) or NO_CONNECT
+    except Exception:
+        return NO_CONNECT
+
+
+class NegativeCache:
+    """Perfis não convidáveis com motivo e data de expiração"""
+
+    def __init__(self, path=NEGATIVE_CACHE_FILE, ttl_days=DEFAULT_TTL_DAYS):
+        self.path = path
+        self.ttl_days = ttl_days
+        self.entries = self._read()
+        self.dirty = {}
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar cache negativo: {e}")
+            return {}
+
+        now = time.time()
+        return {key: entry for key, entry in entries.items() if entry.get("expires", 0) > now}
+
+    def get(self, profile_url):
+        """Retorna o motivo se o perfil ainda está no cache, senão None"""
+        entry = self.entries.get(canonical_profile_id(profile_url))
+        if entry and entry["expires"] > time.time():
+            return entry["reason"]
+        return None
+
+    def __contains__(self, profile_url):
+        return self.get(profile_url) is not None
+
+    def add(self, profile_url, reason, ttl_days=None):
+        ttl_days = self.ttl_days if ttl_days is None else ttl_days
+        entry = {"reason": reason, "expires": time.time() + ttl_days * 24 * 60 * 60}
+        key = canonical_profile_id(profile_url)
+        self.entries[key] = entry
+        self.dirty[key] = entry
+
+    def save(self):
+        """Mescla as entradas novas com o que outros bots gravaram"""
+        if not self.dirty:
+            return
+
+        with lock_for(self.path):
+            entries = self._read()
+            entries.update(self.dirty)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+        self.entries = entries
+        self.dirty = {}
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Pausas "humanas" entre ações do bot
+Nos bots nodriver a pausa é um asyncio.sleep, então o loop continua atendendo o CDP,
+os handlers e as outras tarefas enquanto o bot espera. Nos bots Selenium é um time.sleep,
+mas só para o ritmo escolhido: esperar a página carregar é papel do page_readiness
+"""
+
+import asyncio
+import random
+import time
+
+
+def pause_length(base, jitter=0.0):
+    """Duração da pausa: base + até `jitter` segundos aleatórios"""
+    return base + jitter * random.random()
+
+
+async def human_pause(base, jitter=0.0):
+    """Pausa sem bloquear o event loop (substitui time.sleep nos bots assíncronos)"""
+    await asyncio.sleep(pause_length(base, jitter))
+
+
+def pause(base, jitter=0.0):
+    """Mesma pausa para os bots síncronos (Selenium)"""
+    time.sleep(pause_length(base, jitter))
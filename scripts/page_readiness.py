@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Prontidão da página no Selenium: espera uma condição nomeada em vez de um sleep fixo
+(seletor presente, documento pronto, rede ociosa ou quantidade de resultados estável).
+As pausas "humanas" ficam no pacing; aqui só se espera o tempo real de carregamento
+"""
+
+import time
+
+# Mesmos containers que o card_extractor procura
+SEARCH_CARD_SELECTOR = (
+    "[data-view-name='search-entity-result'], .entity-result__item, li.reusable-search__result-container"
+)
+NO_RESULTS_SELECTOR = ".search-reusable-search-no-results, .search-no-results"
+
+
+class ReadyCondition:
+    """Condição com nome (para o log) avaliada a cada poll"""
+
+    def __init__(self, name, check):
+        self.name = name
+        self.check = check
+
+    def __call__(self, driver):
+        return self.check(driver)
+
+
+def selector_present(selector):
+    return ReadyCondition(
+        f"seletor {selector}",
+        lambda driver: driver.execute_script("return document.querySelector(arguments[0]) !== null;", selector),
+    )
+
+
+def document_ready():
+    return ReadyCondition(
+        "documento pronto",
+        lambda driver: driver.execute_script("return document.readyState;") in ("interactive", "complete"),
+    )
+
+
+def _stable(name, read, stable_for, accept):
+    """Pronta quando o valor lido não muda por `stable_for` segundos (e é aceito)"""
+    state = {"value": None, "since": 0.0}
+
+    def check(driver):
+        value = read(driver)
+        now = time.monotonic()
+        if value != state["value"]:
+            state["value"], state["since"] = value, now
+            return False
+        return accept(value) and now - state["since"] >= stable_for
+
+    return ReadyCondition(name, check)
+
+
+def network_idle(idle_for=0.5):
+    """Nenhum recurso novo (Resource Timing) por `idle_for` segundos depois do DOM pronto"""
+    script = (
+        "return document.readyState === 'loading' ? -1 : performance.getEntriesByType('resource').length;"
+    )
+    return _stable("rede ociosa", lambda driver: driver.execute_script(script), idle_for, lambda n: n >= 0)
+
+
+def results_stable(selector=SEARCH_CARD_SELECTOR, stable_for=0.75, minimum=1):
+    """Quantidade de resultados parada por `stable_for` segundos (renderização terminou)"""
+    script = "return document.querySelectorAll(arguments[0]).length;"
+    return _stable(
+        "resultados estáveis",
+        lambda driver: driver.execute_script(script, selector),
+        stable_for,
+        lambda n: n >= minimum,
+    )
+
+
+def any_of(*conditions):
+    """Pronta quando qualquer uma das condições estiver pronta"""
+    def check(driver):
+        # Avalia todas a cada poll, para as condições de estabilidade acompanharem o tempo
+        return any([condition(driver) for condition in conditions])
+
+    return ReadyCondition(" ou ".join(condition.name for condition in conditions), check)
+
+
+def wait_ready(driver, condition, timeout=15, poll=0.1):
+    """Espera a condição; retorna False (sem exceção) se o tempo acabar"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if condition(driver):
+                return True
+        except Exception:
+            pass  # Página no meio da navegação: tenta de novo no próximo poll
+        if time.monotonic() >= deadline:
+            print(f"⏰ Página não ficou pronta ({condition.name}) em {timeout}s")
+            return False
+        time.sleep(poll)
+
+
+def use_eager_page_load(chrome_options):
+    """driver.get retorna no DOMContentLoaded, sem esperar imagens e iframes"""
+    chrome_options.page_load_strategy = "eager"
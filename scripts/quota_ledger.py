@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Ledger de cotas - contadores diários de conexões compartilhados pelos bots
+Substitui as leituras completas do AccountLog.txt por baldes indexados por dia
+"""
+
+import json
+import os
+import re
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from file_lock import lock_for
+
+LEDGER_FILE = "quota_ledger.json"
+ACCOUNT_LOG = "AccountLog.txt"
+WINDOW_DAYS = 7
+# Reservas de processos que morreram sem release() expiram sozinhas
+RESERVATION_TTL = 2 * 60 * 60
+
+# "Accounts ran: 12 on 2024-05-01" / "Tech Recruiters connected: 3 on 2024-05-01"
+SUMMARY_LINE = re.compile(r"^[^:\[]+:\s*(\d+)\s+on\s+(\d{4}-\d{2}-\d{2})\s*$")
+# "[2024-05-01 10:22:13] Conexão enviada: Nome | Empresa | Local | URL"
+CONNECTION_LINE = re.compile(r"^\[(\d{4}-\d{2}-\d{2})[ T][\d:]+\]\s*Conexão enviada:")
+
+
+def parse_log_line(line):
+    """Converte uma linha do AccountLog.txt em (data, quantidade) ou None"""
+    line = line.strip()
+    match = SUMMARY_LINE.match(line)
+    if match:
+        return match.group(2), int(match.group(1))
+
+    match = CONNECTION_LINE.match(line)
+    if match:
+        return match.group(1), 1
+
+    return None
+
+
+def rollup_path(log_file):
+    """Arquivo de rollups ao lado do log (AccountLog.txt -> AccountLog.rollup.txt)"""
+    base, ext = os.path.splitext(log_file)
+    return f"{base}.rollup{ext or '.txt'}"
+
+
+class Reservation:
+    """Vagas reservadas por um processo; devolvidas no release() ou quando expiram"""
+
+    def __init__(self, ledger, reservation_id, slots):
+        self.ledger = ledger
+        self.id = reservation_id
+        self.slots = slots
+        self.used = 0
+
+    @property
+    def remaining(self):
+        return self.slots - self.used
+
+    def commit(self, count=1):
+        """Converte vagas reservadas em conexões enviadas"""
+        if count > 0:
+            self.ledger.commit(self.id, count)
+            self.used += count
+
+    def release(self):
+        """Devolve as vagas não usadas para os outros bots"""
+        self.ledger.release(self.id)
+        self.slots = self.used
+
+
+class QuotaLedger:
+    """Contadores de conexões por dia com consulta da janela móvel
+
+    Todas as escritas releem o arquivo sob um lock exclusivo, então vários
+    bots podem compartilhar o mesmo ledger (e a mesma conta) ao mesmo tempo.
+    """
+
+    def __init__(self, path=LEDGER_FILE, log_file=ACCOUNT_LOG):
+        self.path = path
+        self.log_file = log_file
+        self.days = {}
+        self.reservations = {}
+        self.load()
+
+    def load(self):
+        """Carrega o ledger; na primeira vez importa o histórico do log em texto"""
+        with lock_for(self.path):
+            if os.path.exists(self.path):
+                self._read()
+                return
+
+            if self.log_file:
+                self.import_account_log(rollup_path(self.log_file))
+            self.import_account_log(self.log_file)
+            self._write()
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.days = {day: int(count) for day, count in data.get("days", {}).items()}
+            self.reservations = data.get("reservations", {})
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar ledger: {e}")
+            self.days = {}
+            self.reservations = {}
+
+    def _write(self):
+        """Grava o ledger de forma atômica (chamar com o lock adquirido)"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"days": self.days, "reservations": self.reservations}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def import_account_log(self, log_file):
+        """Importa uma única vez as linhas antigas do AccountLog.txt"""
+        if not log_file or not os.path.exists(log_file):
+            return 0
+
+        imported = 0
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                parsed = parse_log_line(line)
+                if not parsed:
+                    continue
+                day, count = parsed
+                self.days[day] = self.days.get(day, 0) + count
+                imported += 1
+        return imported
+
+    def record(self, count=1, day=None):
+        """Soma conexões enviadas ao balde do dia"""
+        day = day or datetime.now().strftime("%Y-%m-%d")
+        with lock_for(self.path):
+            self._read()
+            self.days[day] = self.days.get(day, 0) + count
+            self._write()
+
+    def reserve(self, slots, max_daily, max_weekly, ttl=RESERVATION_TTL):
+        """Reserva até `slots` vagas sem ultrapassar os limites compartilhados
+
+        Retorna uma Reservation (possivelmente menor que o pedido) ou None.
+        """
+        with lock_for(self.path):
+            self._read()
+            now = time.time()
+            self.reservations = {
+                rid: r for rid, r in self.reservations.items() if r["expires"] > now
+            }
+            pending = sum(r["slots"] for r in self.reservations.values())
+            granted = min(
+                slots,
+                max_daily - self.sent_today() - pending,
+                max_weekly - self.sent_last_7_days() - pending,
+            )
+            if granted <= 0:
+                self._write()
+                return None
+
+            reservation_id = uuid.uuid4().hex
+            self.reservations[reservation_id] = {
+                "slots": granted,
+                "pid": os.getpid(),
+                "expires": now + ttl,
+            }
+            self._write()
+        return Reservation(self, reservation_id, granted)
+
+    def commit(self, reservation_id, count):
+        """Move `count` vagas da reserva para o balde de hoje"""
+        day = datetime.now().strftime("%Y-%m-%d")
+        with lock_for(self.path):
+            self._read()
+            reservation = self.reservations.get(reservation_id)
+            if reservation:
+                reservation["slots"] = max(0, reservation["slots"] - count)
+            self.days[day] = self.days.get(day, 0) + count
+            self._write()
+
+    def release(self, reservation_id):
+        with lock_for(self.path):
+            self._read()
+            self.reservations.pop(reservation_id, None)
+            self._write()
+
+    def log_summary(self, label, count, reservation=None):
+        """Escreve a linha de resumo no AccountLog.txt e atualiza o ledger"""
+        day = datetime.now().strftime("%Y-%m-%d")
+        with lock_for(self.log_file):
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(f"{label}: {count} on {day}\n")
+        if reservation:
+            reservation.commit(count)
+        else:
+            self.record(count, day)
+
+    def log_connection(self, name, profile_url, *details, reservation=None):
+        """Escreve uma linha por convite (quem recebeu) no AccountLog.txt e conta 1 no ledger"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        fields = " | ".join([name, *details, profile_url])
+        with lock_for(self.log_file):
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(f"[{timestamp}] Conexão enviada: {fields}\n")
+        if reservation:
+            reservation.commit(1)
+        else:
+            self.record(1)
+
+    def sent_on(self, day):
+        return self.days.get(day, 0)
+
+    def sent_today(self):
+        return self.sent_on(datetime.now().strftime("%Y-%m-%d"))
+
+    def sent_last_7_days(self):
+        """Total da janela móvel de 7 dias (hoje incluído)"""
+        today = datetime.now().date()
+        return sum(
+            self.sent_on((today - timedelta(days=offset)).strftime("%Y-%m-%d"))
+            for offset in range(WINDOW_DAYS)
+        )
+
+    def has_run_today(self):
+        """Indica se algum bot já registrou execução hoje"""
+        return datetime.now().strftime("%Y-%m-%d") in self.days
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Classificador de Tech Recruiters compartilhado pelos bots
+As palavras-chave são compiladas uma única vez em uma regex com limites de palavra e sem acentos
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+
+RECRUITER_KEYWORDS = [
+    "tech recruiter", "technical recruiter", "recruiter",
+    "talent acquisition", "talent sourcer", "talent hunter",
+    "recruitment specialist", "headhunter", "staffing",
+    "hr specialist", "human resources",
+    "recrutador", "recrutadora", "recrutamento", "contratação", "rh"
+]
+
+_SPACES = re.compile(r"\s+")
+
+
+def fold_text(text):
+    """Minúsculas, sem acentos e com espaços normalizados ('São  Paulo' -> 'sao paulo')"""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _SPACES.sub(" ", stripped.casefold()).strip()
+
+
+class KeywordMatcher:
+    """Regex única com todas as palavras-chave (aceita plural simples: recruiters)"""
+
+    def __init__(self, keywords):
+        folded = sorted({fold_text(k) for k in keywords if k}, key=len, reverse=True)
+        alternatives = "|".join(re.escape(k) for k in folded)
+        self.pattern = re.compile(rf"\b(?:{alternatives})s?\b")
+
+    def matches(self, text):
+        return bool(self.pattern.search(fold_text(text)))
+
+    def classify_many(self, texts):
+        """Classifica vários textos com uma única varredura da regex"""
+        folded = [fold_text(t) for t in texts]
+        results = [False] * len(folded)
+        if not folded:
+            return results
+
+        # Cada texto já tem os espaços normalizados, então '\n' nunca faz parte de um match
+        starts = []
+        offset = 0
+        for text in folded:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        for match in self.pattern.finditer("\n".join(folded)):
+            results[bisect_right(starts, match.start()) - 1] = True
+        return results
+
+
+DEFAULT_MATCHER = KeywordMatcher(RECRUITER_KEYWORDS)
+
+
+def is_tech_recruiter(profile_text):
+    """Verifica se o perfil é de um tech recruiter baseado nas palavras-chave"""
+    if not profile_text:
+        return False
+    return DEFAULT_MATCHER.matches(profile_text)
+
+
+def classify_many(texts):
+    """Versão em lote de is_tech_recruiter (uma página de resultados ou um corpus offline)"""
+    return DEFAULT_MATCHER.classify_many(texts)
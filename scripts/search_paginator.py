@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Paginação da busca de pessoas por URL (&page=N) com pré-carregamento
+Enquanto os candidatos da página N são processados, a página N+1 já carrega em uma aba de fundo
+"""
+
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+from card_extractor import extract_cards
+from page_readiness import NO_RESULTS_SELECTOR, any_of, results_stable, selector_present, wait_ready
+
+# As duas abas trocam de papel a cada página (atual <-> pré-carregamento)
+TAB_NAMES = ("bot-page-a", "bot-page-b")
+
+
+def page_url(base_url, page):
+    """URL da busca apontando para a página pedida (substitui um &page existente)"""
+    parts = urlparse(base_url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    query["page"] = [str(page)]
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+
+class SearchPaginator:
+    """Percorre as páginas da busca no Selenium, sempre com a próxima já carregando"""
+
+    def __init__(self, driver, base_url, max_pages=100, timeout=15, poll=0.25, on_new_tab=None):
+        self.driver = driver
+        # Chamado com o driver dentro da aba de pré-carregamento recém-criada (ex.: modo leve)
+        self.on_new_tab = on_new_tab
+        self.base_url = base_url
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.poll = poll
+        self.handles = {}
+        self.current = 0
+
+    def _wait_for_cards(self):
+        # Pronta quando a lista para de crescer (ou a busca mostra "nenhum resultado")
+        wait_ready(
+            self.driver,
+            any_of(results_stable(), selector_present(NO_RESULTS_SELECTOR)),
+            self.timeout,
+            self.poll,
+        )
+        return extract_cards(self.driver)
+
+    def _open_tab(self, name):
+        """Cria a aba de fundo em branco e a prepara antes da primeira navegação"""
+        before = set(self.driver.window_handles)
+        self.driver.execute_script("window.open('about:blank', arguments[0]);", name)
+        handle = (set(self.driver.window_handles) - before).pop()
+        if self.on_new_tab:
+            current = self.driver.current_window_handle
+            self.driver.switch_to.window(handle)
+            self.on_new_tab(self.driver)
+            self.driver.switch_to.window(current)
+        return handle
+
+    def _prefetch(self, page):
+        """Carrega a página na aba de fundo, sem tirar o foco do driver da aba atual"""
+        name = TAB_NAMES[1 - self.current]
+        if name not in self.handles:
+            self.handles[name] = self._open_tab(name)
+        self.driver.execute_script("window.open(arguments[0], arguments[1]);", page_url(self.base_url, page), name)
+
+    def _swap(self):
+        self.current = 1 - self.current
+        self.driver.switch_to.window(self.handles[TAB_NAMES[self.current]])
+
+    def pages(self):
+        """Gera (página, cards) até acabar os resultados ou atingir max_pages"""
+        self.driver.get(page_url(self.base_url, 1))
+        self.driver.execute_script("window.name = arguments[0];", TAB_NAMES[0])
+        self.handles[TAB_NAMES[0]] = self.driver.current_window_handle
+
+        page = 1
+        while page <= self.max_pages:
+            cards = self._wait_for_cards()
+            if not cards:
+                break
+            if page < self.max_pages:
+                self._prefetch(page + 1)
+            yield page, cards
+            page += 1
+            if page <= self.max_pages:
+                self._swap()
+
+    def close(self):
+        """Fecha a aba extra e volta para a aba original"""
+        original = self.handles.get(TAB_NAMES[0])
+        extra = self.handles.pop(TAB_NAMES[1], None)
+        if extra and extra in self.driver.window_handles:
+            self.driver.switch_to.window(extra)
+            self.driver.close()
+        if original:
+            self.driver.switch_to.window(original)
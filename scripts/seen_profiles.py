@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Conjunto persistente de perfis já vistos/convidados
+Hashes de 64 bits ordenados em um arquivo binário, lido via mmap com busca binária
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from urllib.parse import unquote, urlparse
+
+from file_lock import lock_for
+
+SEEN_FILE = "seen_profiles.bin"
+RECORD = struct.Struct("<Q")
+
+
+def canonical_profile_id(profile_url):
+    """Normaliza a URL do perfil para 'in/<slug>' (sem query, barra final ou caixa)"""
+    if not profile_url:
+        return ""
+
+    parsed = urlparse(profile_url.strip())
+    parts = [unquote(p) for p in parsed.path.split('/') if p]
+    if len(parts) >= 2 and parts[0] == "in":
+        return f"in/{parts[1].lower()}"
+    return f"{parsed.netloc.lower()}/{'/'.join(parts).lower()}"
+
+
+def profile_hash(profile_url):
+    digest = hashlib.blake2b(canonical_profile_id(profile_url).encode('utf-8'), digest_size=8).digest()
+    return RECORD.unpack(digest)[0]
+
+
+class SeenProfiles:
+    """Conjunto de perfis com carga instantânea, mesmo com centenas de milhares de entradas"""
+
+    def __init__(self, path=SEEN_FILE):
+        self.path = path
+        self.pending = set()
+        self._file = None
+        self._map = None
+        self._count = 0
+        self._open()
+
+    def _open(self):
+        self._close()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < RECORD.size:
+            return
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count = len(self._map) // RECORD.size
+
+    def _close(self):
+        if self._map:
+            self._map.close()
+        if self._file:
+            self._file.close()
+        self._map = None
+        self._file = None
+        self._count = 0
+
+    def _on_disk(self, value):
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = RECORD.unpack_from(self._map, mid * RECORD.size)[0]
+            if current < value:
+                lo = mid + 1
+            elif current > value:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def __contains__(self, profile_url):
+        value = profile_hash(profile_url)
+        return value in self.pending or self._on_disk(value)
+
+    def __len__(self):
+        return self._count + len(self.pending)
+
+    def add(self, profile_url):
+        if profile_url:
+            self.pending.add(profile_hash(profile_url))
+
+    def flush(self):
+        """Mescla os perfis novos no arquivo (outros bots podem ter gravado no meio tempo)"""
+        if not self.pending:
+            return
+
+        with lock_for(self.path):
+            self._close()
+            values = array('Q')
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as f:
+                    values.frombytes(f.read())
+                if sys.byteorder == 'big':
+                    values.byteswap()
+
+            merged = array('Q', sorted(set(values).union(self.pending)))
+            if sys.byteorder == 'big':
+                merged.byteswap()
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                merged.tofile(f)
+            os.replace(tmp_path, self.path)
+
+        self.pending.clear()
+        self._open()
+
+    def close(self):
+        self.flush()
+        self._close()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Teste da coleta pela API de busca contra um servidor local com JSON gravado
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import urlopen
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+import api_harvest
+from api_harvest import SearchResponseCollector, harvest_search_page, is_search_response
+from recruiter_matcher import classify_many
+
+# Resposta gravada (reduzida) de /voyager/api/search/dash/clusters
+RECORDED_PAYLOAD = {
+    "data": {"paging": {"start": 0, "count": 10}},
+    "included": [
+        {
+            "$type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+            "title": {"text": "Ana Souza"},
+            "primarySubtitle": {"text": "Tech Recruiter at Google"},
+            "secondarySubtitle": {"text": "São Paulo, Brasil"},
+            "navigationUrl": "https://www.linkedin.com/in/ana-souza?miniProfileUrn=urn%3Ali%3Afs",
+        },
+        {
+            "$type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+            "title": {"text": "Bruno Lima"},
+            "primarySubtitle": {"text": "Backend Developer"},
+            "secondarySubtitle": {"text": "Curitiba"},
+            "navigationUrl": "https://www.linkedin.com/in/bruno-lima",
+        },
+        {
+            "$type": "com.linkedin.voyager.dash.search.SearchClusterViewModel",
+            "title": {"text": "Pessoas"},
+            "navigationUrl": "https://www.linkedin.com/search/results/people/",
+        },
+    ],
+}
+
+
+class RecordedSearchHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps(RECORDED_PAYLOAD).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_is_search_response():
+    assert is_search_response("https://www.linkedin.com/voyager/api/graphql?queryId=voyagerSearchDashClusters.abc")
+    assert not is_search_response("https://www.linkedin.com/voyager/api/me")
+
+
+class ResponseReceived:
+    pass
+
+
+class LoadingFinished:
+    pass
+
+
+FAKE_UC = SimpleNamespace(cdp=SimpleNamespace(network=SimpleNamespace(
+    enable=lambda: "Network.enable",
+    get_response_body=lambda request_id: ("Network.getResponseBody", request_id),
+    ResponseReceived=ResponseReceived,
+    LoadingFinished=LoadingFinished,
+)))
+
+
+class FakeTab:
+    """Como no nodriver 0.48.1, remove_handler apagaria todos os handlers do evento"""
+
+    def __init__(self):
+        self.handlers = {}
+
+    async def send(self, command):
+        return None
+
+    def add_handler(self, event_type, handler):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def remove_handler(self, event_type, handler=None):
+        raise AssertionError("remove_handler derrubaria os handlers do modo leve")
+
+    def fire(self, event_type, event):
+        for handler in self.handlers.get(event_type, []):
+            asyncio.run(handler(event))
+
+
+class RecordingTab(FakeTab):
+    """Aba que "navega" buscando a URL no servidor local e emite os eventos CDP da resposta"""
+
+    def __init__(self, base64_bodies=False):
+        super().__init__()
+        self.base64_bodies = base64_bodies
+        self.bodies = {}
+
+    async def get(self, url):
+        request_id = str(len(self.bodies) + 1)
+        with urlopen(url) as response:
+            body = response.read()
+        self.bodies[request_id] = body
+        for event_type, event in (
+            (ResponseReceived, SimpleNamespace(request_id=request_id, response=SimpleNamespace(url=url))),
+            (LoadingFinished, SimpleNamespace(request_id=request_id)),
+        ):
+            for handler in self.handlers.get(event_type, []):
+                await handler(event)
+
+    async def send(self, command):
+        if isinstance(command, tuple) and command[0] == "Network.getResponseBody":
+            body = self.bodies[command[1]]
+            if self.base64_bodies:
+                return base64.b64encode(body).decode("ascii"), True
+            return body.decode("utf-8"), False
+        return None
+
+
+def test_collector_reads_recorded_response():
+    """ResponseReceived + LoadingFinished com o corpo vindo do servidor local"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordedSearchHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    original_uc = api_harvest.uc
+    api_harvest.uc = FAKE_UC
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/voyager/api/search/dash/clusters?q=all"
+        for base64_bodies in (False, True):
+            tab = RecordingTab(base64_bodies)
+            returned_tab, cards = asyncio.run(harvest_search_page(None, url, timeout=5, tab=tab))
+            assert returned_tab is tab
+            assert [card["url"] for card in cards] == [
+                "https://www.linkedin.com/in/ana-souza",
+                "https://www.linkedin.com/in/bruno-lima",
+            ]
+            assert cards[0]["subtitle"] == "Tech Recruiter at Google"
+            assert cards[0]["location"] == "São Paulo, Brasil"
+            assert classify_many([f"{c['name']} {c['subtitle']}" for c in cards]) == [True, False]
+
+            # Tudo consumido: a próxima página começa com o coletor vazio
+            collector = SearchResponseCollector.for_tab(tab)
+            assert collector.pending == {} and collector.tasks == [] and collector.cards == []
+    finally:
+        api_harvest.uc = original_uc
+        server.shutdown()
+
+
+def test_collector_keeps_other_handlers():
+    original_uc = api_harvest.uc
+    api_harvest.uc = FAKE_UC
+    try:
+        tab = FakeTab()
+        finished = []
+
+        async def lean_counter(event):
+            finished.append(event)
+
+        tab.add_handler(LoadingFinished, lean_counter)
+
+        for _ in range(3):
+            collector = asyncio.run(SearchResponseCollector.for_tab(tab).start())
+            collector.stop()
+        # Um coletor por aba, registrado uma única vez
+        assert SearchResponseCollector.for_tab(tab) is collector
+        assert len(tab.handlers[LoadingFinished]) == 2
+
+        # Parado, o coletor ignora as respostas; o contador do modo leve continua recebendo
+        url = "https://www.linkedin.com/voyager/api/graphql?queryId=voyagerSearchDashClusters.abc"
+        tab.fire(ResponseReceived, SimpleNamespace(request_id="1", response=SimpleNamespace(url=url)))
+        tab.fire(LoadingFinished, SimpleNamespace(request_id="1"))
+        assert collector.pending == {} and collector.tasks == []
+        assert len(finished) == 1
+    finally:
+        api_harvest.uc = original_uc
+
+
+if __name__ == "__main__":
+    test_collector_reads_recorded_response()
+    test_is_search_response()
+    test_collector_keeps_other_handlers()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Teste do config único (esquema, cache por mtime e recarga)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from bot_config import (
+    DEFAULT_CONFIG, BotConfig, ConfigError, ConfigWatcher, connection_limits, load_config, save_config,
+)
+
+
+def write(path, data, mtime):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.utime(path, (mtime, mtime))
+
+
+def test_defaults_and_coercion():
+    """Valores salvos como texto pela TUI antiga viram números; inválidos voltam ao padrão"""
+    config = BotConfig.from_dict({
+        "location": " São Paulo ",
+        "companies": "Google, Meta,",
+        "max_daily_connections": "20",
+        "max_weekly_connections": -5,
+        "include_remote": "true",
+        "harvest_concurrency": "muitas",
+        "campo_novo": 1,
+    })
+    assert config.location == "São Paulo"
+    assert config["companies"] == ["Google", "Meta"]
+    assert config.max_daily_connections == 20
+    assert config.max_weekly_connections == DEFAULT_CONFIG["max_weekly_connections"]
+    assert config.include_remote is True
+    assert config.harvest_concurrency == DEFAULT_CONFIG["harvest_concurrency"]
+    assert len(config.errors) == 2
+    assert config.get("search_terms") == DEFAULT_CONFIG["search_terms"]
+    assert config.to_dict()["campo_novo"] == 1
+
+    # Os padrões não são compartilhados entre instâncias
+    config.search_terms.append("headhunter")
+    assert "headhunter" not in BotConfig().search_terms
+
+
+def test_set_field():
+    config = BotConfig()
+    config.set_field("max_daily_connections", "12")
+    config["search_terms"] = "recruiter, rh"
+    assert config.max_daily_connections == 12
+    assert config.search_terms == ["recruiter", "rh"]
+    for name, value in (("max_daily_connections", "doze"), ("harvest_max_pages", 0), ("nao_existe", 1)):
+        try:
+            config.set_field(name, value)
+        except ConfigError:
+            continue
+        raise AssertionError(f"{name}={value!r} deveria ser rejeitado")
+
+
+def test_cache_and_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "config_location.json")
+        assert load_config(path) == BotConfig()
+
+        write(path, {"search_terms": ["recruiter"], "max_daily_connections": 10}, 1000)
+        watcher = ConfigWatcher(path)
+        assert watcher.config.search_terms == ["recruiter"]
+        # Mesmo mtime: nada é relido, mas cada chamada recebe uma cópia
+        assert load_config(path) == watcher.config
+        assert load_config(path) is not watcher.config
+        assert not watcher.refresh()
+
+        # Edição não salva (como na TUI) não vaza para o próximo load_config()
+        edited = load_config(path)
+        edited.set_field("max_daily_connections", "3")
+        edited.search_terms.append("rh")
+        assert load_config(path).max_daily_connections == 10
+        assert load_config(path).search_terms == ["recruiter"]
+
+        write(path, {"search_terms": ["rh"], "max_daily_connections": 5}, 2000)
+        assert watcher.refresh()
+        assert watcher.config.search_terms == ["rh"]
+        assert watcher.config.max_daily_connections == 5
+
+        # Gravado por este processo: o cache já está atualizado
+        watcher.config.set_field("location", "Remote")
+        save_config(watcher.config, path)
+        assert not watcher.refresh()
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved["location"] == "Remote"
+        # Só os campos do arquivo e os editados; os padrões continuam vindo do SCHEMA
+        assert set(saved) == {"search_terms", "max_daily_connections", "location"}
+
+
+def test_connection_limits():
+    """Os limites de todos os bots vêm do mesmo config"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "config_location.json")
+        assert connection_limits(path) == (DEFAULT_CONFIG["max_daily_connections"],
+                                           DEFAULT_CONFIG["max_weekly_connections"])
+        write(path, {"max_daily_connections": 8, "max_weekly_connections": 40}, 1000)
+        assert connection_limits(path) == (8, 40)
+
+
+if __name__ == "__main__":
+    test_defaults_and_coercion()
+    test_set_field()
+    test_cache_and_reload()
+    test_connection_limits()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Teste dos eventos de progresso e do subprocesso do bot usado pela TUI
+"""
+
+import io
+import os
+import platform
+import sys
+import textwrap
+import time
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from bot_progress import EVENT_PREFIX, PROGRESS_ENV, BotProcess, ProgressLog, emit, parse_event
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts')
+
+# Bot falso: alguns eventos, depois espera o cancelamento e limpa como o bot real
+FAKE_BOT = textwrap.dedent("""
+    import sys, time
+    sys.path.insert(0, sys.argv[1])
+    from bot_progress import emit, install_cancel_handler
+    install_cancel_handler()
+    emit("start", mode="all")
+    emit("quota", quota_left=3)
+    emit("page", page=1, cards=10, matches=2)
+    print("linha de log comum")
+    emit("invite", name="Ana", quota_left=2)
+    try:
+        if sys.argv[2] == "wait":
+            time.sleep(30)
+        emit("done")
+    except KeyboardInterrupt:
+        print("interrompido")
+        emit("cancelled")
+""")
+
+# Bot falso que abre um filho (como o chromedriver/Chrome) e ignora o Ctrl+C
+FAKE_TREE_BOT = textwrap.dedent("""
+    import signal, subprocess, sys, time
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    print(child.pid, flush=True)
+    time.sleep(60)
+""")
+
+
+def run_until_finished(process, progress, timeout=15):
+    deadline = time.monotonic() + timeout
+    while not process.finished():
+        progress.feed(process.drain())
+        assert time.monotonic() < deadline, "o bot falso não terminou"
+        time.sleep(0.05)
+    progress.feed(process.drain())
+
+
+def test_emit_only_when_enabled():
+    previous = os.environ.pop(PROGRESS_ENV, None)
+    try:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            emit("page", page=1)
+            os.environ[PROGRESS_ENV] = "1"
+            emit("page", page=2, cards=5)
+        lines = output.getvalue().splitlines()
+        assert len(lines) == 1
+        assert parse_event(lines[0]) == {"event": "page", "page": 2, "cards": 5}
+    finally:
+        os.environ.pop(PROGRESS_ENV, None)
+        if previous is not None:
+            os.environ[PROGRESS_ENV] = previous
+
+
+def test_parse_and_state():
+    assert parse_event("📄 Página 1") is None
+    assert parse_event(EVENT_PREFIX + "{quebrado") is None
+    progress = ProgressLog()
+    progress.feed([
+        EVENT_PREFIX + '{"event": "quota", "quota_left": 5}',
+        EVENT_PREFIX + '{"event": "page", "page": 1, "cards": 10, "matches": 3}',
+        EVENT_PREFIX + '{"event": "page", "page": 2, "cards": 8, "matches": 1}',
+        EVENT_PREFIX + '{"event": "invite", "name": "Bia", "quota_left": 4}',
+        "🎯 Encontrado: Bia",
+        "",
+    ])
+    state = progress.state
+    assert (state.page, state.cards_seen, state.matches, state.invites_sent, state.quota_left) == (2, 18, 4, 1, 4)
+    assert list(progress.tail) == ["🎯 Encontrado: Bia"]
+    assert "Último convite: Bia" in state.lines()
+
+
+def test_process_streams_events():
+    process = BotProcess([sys.executable, "-c", FAKE_BOT, SCRIPTS_DIR, "run"])
+    progress = ProgressLog()
+    run_until_finished(process, progress)
+    assert process.returncode == 0
+    assert progress.state.status == "concluído"
+    assert progress.state.invites_sent == 1
+    assert progress.state.quota_left == 2
+    assert "linha de log comum" in progress.tail
+
+
+def test_cancel_stops_cleanly():
+    process = BotProcess([sys.executable, "-c", FAKE_BOT, SCRIPTS_DIR, "wait"])
+    progress = ProgressLog()
+    deadline = time.monotonic() + 15
+    while progress.state.invites_sent == 0:
+        progress.feed(process.drain())
+        assert time.monotonic() < deadline, "o bot falso não começou"
+        time.sleep(0.05)
+    process.cancel()
+    run_until_finished(process, progress)
+    assert process.cancelled
+    assert progress.state.status == "cancelado"
+    assert "interrompido" in progress.tail
+
+
+def test_kill_takes_the_whole_tree():
+    if platform.system() == "Windows":
+        return  # taskkill /T; o teste usa os sinais POSIX
+    process = BotProcess([sys.executable, "-c", FAKE_TREE_BOT])
+    deadline = time.monotonic() + 15
+    lines = []
+    while not lines:
+        lines = process.drain()
+        assert time.monotonic() < deadline, "o bot falso não começou"
+        time.sleep(0.05)
+    child_pid = int(lines[0])
+
+    process.kill()
+    process.process.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            os.kill(child_pid, 0)
+        except ProcessLookupError:
+            break
+        assert time.monotonic() < deadline, "o filho do bot continuou rodando"
+        time.sleep(0.05)
+
+
+if __name__ == "__main__":
+    test_emit_only_when_enabled()
+    test_parse_and_state()
+    test_process_streams_events()
+    test_cancel_stops_cleanly()
+    test_kill_takes_the_whole_tree()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Teste do daemon do navegador com um "Chrome" falso que só responde ao /json/version
+"""
+
+import os
+import socket
+import stat
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from browser_daemon import (
+    DEFAULT_PROFILE_DIRECTORY, daemon_address, matching_daemon, read_daemon_info, start_daemon, stop_daemon
+)
+
+FAKE_BROWSER = """#!{python}
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+port = int(next(a for a in sys.argv if a.startswith("--remote-debugging-port=")).split("=")[1])
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200 if self.path == "/json/version" else 404)
+        self.end_headers()
+        self.wfile.write(b'{{"Browser": "Chrome/126.0"}}')
+
+    def log_message(self, *args):
+        pass
+
+
+HTTPServer(("127.0.0.1", port), Handler).serve_forever()
+"""
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_browser_daemon():
+    with tempfile.TemporaryDirectory() as tmp:
+        browser = os.path.join(tmp, "fake-chrome")
+        with open(browser, 'w') as f:
+            f.write(FAKE_BROWSER.format(python=sys.executable))
+        os.chmod(browser, os.stat(browser).st_mode | stat.S_IEXEC)
+        daemon_file = os.path.join(tmp, "browser_daemon.json")
+        port = free_port()
+
+        assert daemon_address(daemon_file) is None
+        assert start_daemon(browser, tmp, port=port, path=daemon_file, timeout=10) == ("127.0.0.1", port)
+        try:
+            assert daemon_address(daemon_file) == ("127.0.0.1", port)
+            assert read_daemon_info(daemon_file)["profile"] == tmp
+            assert read_daemon_info(daemon_file)["profile_directory"] == DEFAULT_PROFILE_DIRECTORY
+            # Só conecta quando o perfil do bot é o mesmo do daemon
+            assert matching_daemon(tmp + os.sep, DEFAULT_PROFILE_DIRECTORY, daemon_file) == ("127.0.0.1", port)
+            assert matching_daemon(tmp, "Default", daemon_file) is None
+            assert matching_daemon(os.path.join(tmp, "outro"), DEFAULT_PROFILE_DIRECTORY, daemon_file) is None
+            # Segunda chamada reaproveita o daemon em execução
+            assert start_daemon(browser, tmp, port=port, path=daemon_file) == ("127.0.0.1", port)
+        finally:
+            pid = read_daemon_info(daemon_file)["pid"]
+            stop_daemon(daemon_file)
+            os.waitpid(pid, 0)
+        assert daemon_address(daemon_file) is None
+        assert not os.path.exists(daemon_file)
+
+
+if __name__ == "__main__":
+    test_browser_daemon()
+    print("🎉 Todos os testes passaram!")
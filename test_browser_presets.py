@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Teste do preset headless e da amostragem de memória pelo /proc
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from browser_presets import HEADLESS_ARGS, RssSampler, apply_headless_options, nodriver_launch_options, process_tree_rss
+
+
+class FakeOptions:
+    def __init__(self):
+        self.arguments = []
+
+    def add_argument(self, arg):
+        self.arguments.append(arg)
+
+
+def test_launch_presets():
+    options = nodriver_launch_options(headless=True)
+    assert options["headless"] is True and "--renderer-process-limit=2" in options["browser_args"]
+    windowed = nodriver_launch_options(headless=False)
+    assert windowed["headless"] is False and windowed["browser_args"][0].startswith("--window-size=")
+
+    chrome_options = FakeOptions()
+    apply_headless_options(chrome_options)
+    assert chrome_options.arguments == ["--headless=new"] + HEADLESS_ARGS
+
+
+def test_rss_sampler():
+    if not os.path.isdir("/proc"):
+        assert process_tree_rss(os.getpid()) == 0
+        return
+
+    # A árvore inclui os filhos do processo
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        time.sleep(0.2)
+        assert process_tree_rss(os.getpid()) > process_tree_rss(child.pid) > 0
+
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = os.path.join(tmp, "browser_rss.log")
+            sampler = RssSampler(os.getpid(), interval=0.05).start()
+            time.sleep(0.2)
+            peak_mb = sampler.stop("teste", log_file)
+            assert peak_mb > 0
+            with open(log_file) as f:
+                assert "teste:" in f.read()
+    finally:
+        child.kill()
+        child.wait()
+
+
+if __name__ == "__main__":
+    test_launch_presets()
+    test_rss_sampler()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Teste da fila persistente de candidatos (coleta -> envio)
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from candidate_queue import MAX_ATTEMPTS, CandidateQueue
+
+
+def card(slug):
+    return {"name": slug, "url": f"https://www.linkedin.com/in/{slug}/", "subtitle": "Tech Recruiter",
+            "location": "São Paulo", "button_state": "connect", "index": 3}
+
+
+def test_candidate_queue():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "candidate_queue.json")
+        harvest = CandidateQueue(path)
+        assert harvest.push([card("ana"), card("bia"), card("ana")]) == 2
+        # Mesmo perfil com outra URL não entra de novo
+        assert harvest.push([{"url": "https://linkedin.com/in/ANA?trk=x"}, card("caio")]) == 1
+
+        # Outro processo (a etapa de envio) vê a fila na ordem de chegada
+        invite = CandidateQueue(path)
+        assert [c["name"] for c in invite.peek()] == ["ana", "bia", "caio"]
+        assert "index" not in invite.peek(1)[0]
+
+        invite.remove("https://www.linkedin.com/in/ana/")
+        assert len(harvest) == 2 and "https://www.linkedin.com/in/ana/" not in harvest
+
+        # Falhas repetidas tiram o candidato da fila
+        for _ in range(MAX_ATTEMPTS):
+            invite.retry_later("https://www.linkedin.com/in/bia/")
+        assert [c["name"] for c in invite.peek()] == ["caio"]
+
+        # Entradas antigas expiram
+        assert len(CandidateQueue(path, max_age_days=-1)) == 0
+
+
+if __name__ == "__main__":
+    test_candidate_queue()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Teste do identificador de empresas (trie de tokens com aliases)
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from company_matcher import CompanyMatcher
+
+
+def test_company_matcher():
+    matcher = CompanyMatcher.from_config({
+        "companies": ["Google", "Amazon", "Microsoft", "Meta", "Apple", "Banco do Brasil"],
+        "company_aliases": {"BB": "Banco do Brasil"},
+    })
+    assert matcher.match("Tech Recruiter at Google") == "Google"
+    assert matcher.match("Talent Acquisition | AWS") == "Amazon"
+    assert matcher.match("Recruiter @ Facebook (Meta)") == "Meta"
+    assert matcher.match("Recrutadora no Banco do Brasil") == "Banco do Brasil"
+    assert matcher.match("RH - BB Tecnologia") == "Banco do Brasil"
+    # Palavras que só contêm o nome não contam
+    assert matcher.match("Metadata engineer, Applestore fan") is None
+    assert matcher.match("Recruiter at Nubank") is None
+    # Produtos citados na headline não viram a empresa dona deles
+    assert matcher.match("Tech Recruiter | LinkedIn Certified Professional Recruiter") is None
+    assert matcher.match("Recruiter | GitHub enthusiast") is None
+    # ...a menos que o config peça
+    custom = CompanyMatcher.from_config({"companies": ["Microsoft"], "company_aliases": {"GitHub": "Microsoft"}})
+    assert custom.match("Talent Partner at GitHub") == "Microsoft"
+    # Alias de empresa que não está no config é ignorado
+    assert CompanyMatcher.from_config({"companies": ["Google"]}).match("Recruiter at AWS") is None
+
+
+if __name__ == "__main__":
+    test_company_matcher()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Teste do cache de resolução do chromedriver (um "Chrome" falso informa a versão)
+"""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from driver_resolver import browser_version, resolve_chromedriver
+
+def write_browser(path, version):
+    with open(path, 'w') as f:
+        f.write(f"#!/bin/sh\necho 'Chromium {version} built on Debian'\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+
+def test_driver_resolver():
+    if sys.platform == "win32":
+        return  # O navegador falso é um script shell
+    with tempfile.TemporaryDirectory() as tmp:
+        browser = os.path.join(tmp, "chromium")
+        cache_file = os.path.join(tmp, "driver_cache.json")
+        write_browser(browser, "126.0.6478.126")
+        assert browser_version(browser) == "126.0.6478.126"
+
+        installs = []
+
+        def installer(version):
+            installs.append(version)
+            driver = os.path.join(tmp, f"chromedriver-{version}")
+            open(driver, 'w').close()
+            return driver
+
+        first = resolve_chromedriver(browser, cache_file, installer)
+        assert first.endswith("chromedriver-126.0.6478.126")
+        # Mesmo navegador: nada é resolvido de novo
+        assert resolve_chromedriver(browser, cache_file, installer) == first
+        assert installs == ["126.0.6478.126"]
+
+        # Navegador atualizado: nova resolução para a nova versão
+        write_browser(browser, "127.0.6533.72")
+        os.utime(browser, (0, 0))
+        second = resolve_chromedriver(browser, cache_file, installer)
+        assert second.endswith("chromedriver-127.0.6533.72") and installs[-1] == "127.0.6533.72"
+
+        # Offline: usa o último driver conhecido e o grava, sem ir à rede nas próximas execuções
+        attempts = []
+
+        def offline(version):
+            attempts.append(version)
+            raise OSError("sem rede")
+
+        write_browser(browser, "128.0.6613.84")
+        os.utime(browser, (1, 1))
+        assert resolve_chromedriver(browser, cache_file, offline) == second
+        assert resolve_chromedriver(browser, cache_file, offline) == second
+        assert attempts == ["128.0.6613.84"]
+
+        # Depois da validade do fallback, a rede é tentada de novo
+        with open(cache_file, encoding='utf-8') as f:
+            cache = json.load(f)
+        cache[browser]["retry_after"] = 0
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        third = resolve_chromedriver(browser, cache_file, installer)
+        assert third.endswith("chromedriver-128.0.6613.84")
+        assert resolve_chromedriver(browser, cache_file, offline) == third
+        assert attempts == ["128.0.6613.84"]
+
+
+if __name__ == "__main__":
+    test_driver_resolver()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Teste do carregamento adaptativo da página de sugestões
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from grow_loader import COUNT_CONNECT_JS, collect_suggestions, connect_selector, load_suggestions, select_suggestions
+
+
+class RemoteObject:
+    """O que o nodriver devolve no evaluate quando o valor do JS é falso"""
+
+
+class FakeTab:
+    """Cada rolagem carrega o próximo lote depois de `delay` leituras"""
+
+    def __init__(self, batches, delay=2):
+        self.batches = list(batches)
+        self.count = self.batches.pop(0)
+        self.delay = delay
+        self.pending = None
+        self.scrolls = 0
+
+    async def evaluate(self, script, return_by_value=False):
+        if script == COUNT_CONNECT_JS:
+            if self.pending is not None:
+                self.pending[0] -= 1
+                if self.pending[0] <= 0:
+                    self.count += self.pending[1]
+                    self.pending = None
+            # Valor falso (0): o nodriver devolve o RemoteObject, não o número
+            return self.count or RemoteObject()
+        self.scrolls += 1
+        if self.batches:
+            self.pending = [self.delay, self.batches.pop(0)]
+
+
+def run(tab, wanted):
+    return asyncio.run(load_suggestions(tab, wanted, settle=0.5, poll=0.01))
+
+
+def test_stops_when_quota_is_covered():
+    tab = FakeTab([8, 8, 8, 8, 8])
+    assert run(tab, 20) == 24
+    assert tab.scrolls == 2
+
+
+def test_stops_when_nothing_new_loads():
+    tab = FakeTab([8, 6])
+    assert run(tab, 100) == 14
+    assert tab.scrolls == 2
+
+
+def test_no_scroll_when_enough_cards():
+    tab = FakeTab([30, 8])
+    assert run(tab, 25) == 30
+    assert tab.scrolls == 0
+
+
+def test_zero_cards_before_render():
+    # Logo depois do "People you may know" ainda não há cards: continua rolando
+    tab = FakeTab([0, 8, 8])
+    assert run(tab, 10) == 16
+    assert tab.scrolls == 2
+
+
+SUGGESTIONS = [
+    {"index": 0, "name": "Ana", "headline": "Software Engineer at Nubank", "url": "https://www.linkedin.com/in/ana"},
+    {"index": 1, "name": "Bia", "headline": "Tech Recruiter | Talent Acquisition", "url": "https://www.linkedin.com/in/bia"},
+    {"index": 2, "name": "Caio", "headline": "Recrutador de TI", "url": "https://www.linkedin.com/in/caio"},
+    {"index": 3, "name": "Duda", "headline": "Product Manager", "url": "https://www.linkedin.com/in/duda"},
+]
+
+
+def test_collect_suggestions_parses_single_query():
+    class CollectTab:
+        calls = 0
+
+        async def evaluate(self, script, return_by_value=False):
+            self.calls += 1
+            return json.dumps(SUGGESTIONS)
+
+    tab = CollectTab()
+    suggestions = asyncio.run(collect_suggestions(tab))
+    assert tab.calls == 1
+    assert [s["name"] for s in suggestions] == ["Ana", "Bia", "Caio", "Duda"]
+    assert connect_selector(suggestions[2]) == "button[data-bot-connect='2']"
+
+
+def test_select_only_recruiters():
+    chosen = select_suggestions(SUGGESTIONS, 5, recruiters_only=True)
+    assert [s["name"] for s in chosen] == ["Bia", "Caio"]
+    assert [s["name"] for s in select_suggestions(SUGGESTIONS, 1, recruiters_only=True)] == ["Bia"]
+    assert len(select_suggestions(SUGGESTIONS, 3)) == 3
+    assert select_suggestions(SUGGESTIONS, 0) == []
+
+
+if __name__ == "__main__":
+    test_stops_when_quota_is_covered()
+    test_stops_when_nothing_new_loads()
+    test_no_scroll_when_enough_cards()
+    test_zero_cards_before_render()
+    test_collect_suggestions_parses_single_query()
+    test_select_only_recruiters()
+    print("🎉 Todos os testes passaram!")
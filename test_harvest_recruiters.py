@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Teste da coleta paralela: limite de abas simultâneas e mescla sem repetição
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+import harvest_recruiters
+from bot_config import DEFAULT_CONFIG
+from candidate_filter import CandidateFilter
+from candidate_queue import CandidateQueue
+from harvest_recruiters import ParallelHarvester, build_queries
+
+
+class FakeTab:
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    async def get(self, url, new_tab=False):
+        return FakeTab()
+
+
+class FakeNegativeCache:
+    def get(self, url):
+        return None
+
+    def add(self, url, reason):
+        pass
+
+
+def card(slug, subtitle="Tech Recruiter"):
+    return {"index": None, "name": slug, "url": f"https://www.linkedin.com/in/{slug}", "subtitle": subtitle,
+            "location": "São Paulo, Brasil", "button_state": "unknown"}
+
+
+def test_build_queries():
+    config = dict(DEFAULT_CONFIG, search_terms=["tech recruiter", "recrutador"])
+    assert build_queries(config) == ['"tech recruiter"', '"recrutador"']
+    config["harvest_locations"] = ["São Paulo", "Remote"]
+    assert len(build_queries(config)) == 4
+    assert '"recrutador" AND "Remote"' in build_queries(config)
+
+
+def test_parallel_harvest():
+    active = {"now": 0, "peak": 0}
+
+    # Cada busca devolve uma página com perfis em comum com as outras
+    async def fake_harvest(browser, url, timeout=15, tab=None):
+        if "page=2" in url:
+            return tab, []
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return tab, [card("ana"), card("bia"), card("dev", "Backend Developer"), card(url.split("%22")[1][:5])]
+
+    async def no_pause(base, jitter=0.0):
+        pass
+
+    original = harvest_recruiters.harvest_search_page, harvest_recruiters.human_pause
+    harvest_recruiters.harvest_search_page, harvest_recruiters.human_pause = fake_harvest, no_pause
+
+    config = dict(DEFAULT_CONFIG, search_terms=["tech recruiter", "recrutador", "talent acquisition", "recruiter"],
+                  harvest_concurrency=2, harvest_max_pages=3)
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = CandidateQueue(os.path.join(tmp, "candidate_queue.json"))
+        candidate_filter = CandidateFilter(config, set(), FakeNegativeCache(), location_index=object())
+        harvester = ParallelHarvester(FakeBrowser(), config, candidate_filter, queue)
+        try:
+            queued = asyncio.run(harvester.run(build_queries(config)))
+        finally:
+            harvest_recruiters.harvest_search_page, harvest_recruiters.human_pause = original
+
+        assert active["peak"] == 2
+        # ana, bia + um perfil por termo (o "dev" não é recrutador)
+        assert queued == len(queue) == 2 + 3
+        assert len(harvester.seen_ids) == 3 + 4 - 1
+
+
+if __name__ == "__main__":
+    test_build_queries()
+    test_parallel_harvest()
+    print("🎉 Todos os testes passaram!")
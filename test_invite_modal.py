@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Teste do resolvedor de estados do modal de convite
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from invite_modal import SEND, SEND_WITHOUT_NOTE, modal_selector, probe_script, resolve_modal, resolve_modal_async
+
+
+class FakeDriver:
+    """Simula o modal aparecendo depois de algumas leituras"""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.scripts = []
+
+    def execute_script(self, script):
+        self.scripts.append(script)
+        return self.states.pop(0) if self.states else None
+
+
+def test_invite_modal():
+    # A prioridade é a ordem pedida
+    assert '["send_without_note", "send"]' in probe_script([SEND_WITHOUT_NOTE, SEND])
+    assert modal_selector(SEND) == "[data-bot-modal='send']"
+
+    # Retorna assim que o primeiro estado aparece, sem esperar o timeout
+    driver = FakeDriver([None, None, SEND])
+    start = time.monotonic()
+    assert resolve_modal(driver, [SEND_WITHOUT_NOTE, SEND], timeout=10, poll=0.01) == SEND
+    assert time.monotonic() - start < 1
+    assert len(driver.scripts) == 3
+
+    # Nenhum estado: None depois do timeout
+    assert resolve_modal(FakeDriver([]), [SEND], timeout=0.05, poll=0.01) is None
+
+
+class RemoteObject:
+    """O que o nodriver devolve no evaluate quando o valor do JS é falso (null)"""
+
+
+class FakeTab:
+    def __init__(self, states):
+        self.states = list(states)
+        self.calls = 0
+
+    async def evaluate(self, script, return_by_value=False):
+        self.calls += 1
+        return self.states.pop(0) if self.states else RemoteObject()
+
+
+def test_invite_modal_async_polls_until_found():
+    # "Nada encontrado" chega como RemoteObject e não pode encerrar a espera
+    tab = FakeTab([RemoteObject(), RemoteObject(), SEND])
+    assert asyncio.run(resolve_modal_async(tab, [SEND], timeout=10, poll=0.01)) == SEND
+    assert tab.calls == 3
+
+    assert asyncio.run(resolve_modal_async(FakeTab([]), [SEND], timeout=0.05, poll=0.01)) is None
+
+
+if __name__ == "__main__":
+    test_invite_modal()
+    test_invite_modal_async_polls_until_found()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Teste do modo leve: flags de linha de comando e contagem do que foi bloqueado
+"""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from bot_flags import pop_flag
+from lean_mode import AVERAGE_BYTES, LeanStats, collect_selenium_stats, enable_lean_selenium
+
+
+def perf_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+    def get_log(self, kind):
+        return [
+            perf_entry("Network.loadingFailed", type="Image", blockedReason="inspector"),
+            perf_entry("Network.loadingFailed", type="Image", blockedReason="inspector"),
+            perf_entry("Network.loadingFailed", type="Font", blockedReason="inspector"),
+            perf_entry("Network.loadingFailed", type="XHR", errorText="net::ERR_ABORTED"),
+            perf_entry("Network.loadingFinished", encodedDataLength=1500),
+            perf_entry("Network.loadingFinished", encodedDataLength=500),
+            {"message": "não é json"},
+        ]
+
+
+def test_pop_flag():
+    argv = ["bot.py", "--lean", "/usr/bin/chromium", "/perfil", "1"]
+    assert pop_flag("--lean", argv) is True
+    assert argv == ["bot.py", "/usr/bin/chromium", "/perfil", "1"]
+    assert pop_flag("--lean", argv) is False
+
+
+def test_lean_stats():
+    driver = FakeDriver()
+    stats = enable_lean_selenium(driver)
+    assert [command for command, _ in driver.commands] == [
+        "Network.enable", "Network.setBlockedURLs", "Page.addScriptToEvaluateOnNewDocument"]
+
+    collect_selenium_stats(driver, stats)
+    assert stats.blocked == {"Image": 2, "Font": 1}
+    assert stats.requests == 2 and stats.received_bytes == 2000
+    assert stats.saved_bytes() == 2 * AVERAGE_BYTES["Image"] + AVERAGE_BYTES["Font"]
+    assert "3 requisições bloqueadas" in stats.summary()
+    assert "nenhuma" in LeanStats().summary()
+
+
+if __name__ == "__main__":
+    test_pop_flag()
+    test_lean_stats()
+    print("🎉 Todos os testes passaram!")
@@ -3,43 +3,22 @@
 Teste do novo bot com localização - Versão simples
 """
 
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from bot_config import CONFIG_FILE, load_config, save_config
 
 class SimpleConfigTest:
     def __init__(self):
-        self.config_file = "config_location.json"
-        self.config = self.load_config()
-    
-    def load_config(self):
-        """Carrega configurações salvas"""
-        default_config = {
-            "location": "São Paulo, Brasil",
-            "companies": ["Google", "Amazon", "Microsoft", "Meta", "Apple"],
-            "search_terms": ["tech recruiter", "recrutador", "talent acquisition"],
-            "max_daily_connections": 15,
-            "max_weekly_connections": 100
-        }
-        
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge com config padrão
-                    for key, value in default_config.items():
-                        if key not in loaded_config:
-                            loaded_config[key] = value
-                    return loaded_config
-        except Exception as e:
-            print(f"Erro ao carregar config: {e}")
-            
-        return default_config
+        self.config_file = CONFIG_FILE
+        self.config = load_config(self.config_file)
     
     def save_config(self):
         """Salva configurações"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            save_config(self.config, self.config_file)
             print(f"✅ Config salvo: {self.config_file}")
         except Exception as e:
             print(f"Erro ao salvar config: {e}")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Teste do índice de localizações usado pelo filtro is_in_location
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from location_index import REMOTE, LocationIndex, load_location_index
+
+
+def test_resolve_variants():
+    """Testa acentos, 'Greater ... Area' e siglas de estado"""
+    index = LocationIndex.build({"location": "São Paulo, Brasil"})
+    sao_paulo = ("brasil", "sp", "sao paulo")
+    assert index.resolve("São Paulo, Brasil") == sao_paulo
+    assert index.resolve("Sao Paulo") == sao_paulo
+    assert index.resolve("Greater São Paulo Area") == sao_paulo
+    assert index.resolve("São Paulo e Região") == sao_paulo
+    assert index.resolve("Campinas, SP") == ("brasil", "sp", "campinas")
+    assert index.resolve("Brazil") == ("brasil",)
+    assert index.resolve("Remote") == REMOTE
+    assert index.resolve("São Paulo (Remote)") == sao_paulo
+    assert index.resolve("Atlantis") is None
+
+
+def test_matches():
+    index = LocationIndex.build({"location": "São Paulo, Brasil"})
+    assert index.matches("Greater Sao Paulo Area")
+    assert index.matches("Brasil")
+    assert not index.matches("Rio de Janeiro, RJ")
+    # Cita o alvo pelo nome (o estado tem o nome da cidade), como no filtro antigo
+    assert index.matches("Campinas, São Paulo, Brasil")
+    assert not index.matches("Campinas, SP")
+    assert not index.matches("Remote")
+    assert index.matches("São Paulo (Remote)")
+
+    state = LocationIndex.build({"location": "Estado de São Paulo", "include_remote": True})
+    assert state.matches("Campinas, SP")
+    assert state.matches("Remote")
+    assert not state.matches("Curitiba, Paraná")
+    assert state.matches("Rio de Janeiro (Remote)")
+    assert not index.matches("Rio de Janeiro (Remote)")
+
+    custom = LocationIndex.build({"location": "Sampa", "location_aliases": {"Sampa": "São Paulo"}})
+    assert custom.matches("São Paulo, SP")
+
+    unknown = LocationIndex.build({"location": "Berlin"})
+    assert unknown.matches("Berlin, Germany")
+    assert not unknown.matches("São Paulo")
+
+
+def test_city_spellings_share_one_path():
+    """Grafias do mesmo lugar resolvem para o caminho da cidade canônica, nos dois sentidos"""
+    lisboa = ("portugal", "lisboa", "lisboa")
+    english = LocationIndex.build({"location": "Lisbon"})
+    assert english.target == lisboa
+    assert english.matches("Lisboa, Portugal")
+    assert english.matches("Grande Lisboa")
+    assert not english.matches("Porto, Portugal")
+
+    canonical = LocationIndex.build({"location": "Lisboa"})
+    assert canonical.resolve("Lisbon Metropolitan Area") == lisboa
+    assert canonical.matches("Lisbon Metropolitan Area")
+    assert canonical.matches("Lisbon, Portugal")
+
+
+def test_memo_stays_out_of_disk_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, "location_index.json")
+        index = load_location_index({"location": "Curitiba"}, cache_file)
+        aliases = dict(index.aliases)
+        assert index.matches("Curitiba, Paraná, Brasil")
+        assert index.aliases == aliases
+        assert "curitiba, parana, brasil" not in index.to_dict()["aliases"]
+
+
+def test_disk_cache_rebuilds_on_change():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, "location_index.json")
+        load_location_index({"location": "Curitiba"}, cache_file)
+        with open(cache_file, encoding="utf-8") as f:
+            first = json.load(f)
+
+        cached = load_location_index({"location": "Curitiba"}, cache_file)
+        assert cached.matches("Curitiba, Paraná, Brasil")
+
+        changed = load_location_index({"location": "Recife"}, cache_file)
+        with open(cache_file, encoding="utf-8") as f:
+            assert json.load(f)["fingerprint"] != first["fingerprint"]
+        assert changed.matches("Recife, PE")
+        assert not changed.matches("Curitiba")
+
+
+if __name__ == "__main__":
+    test_resolve_variants()
+    test_matches()
+    test_city_spellings_share_one_path()
+    test_memo_stays_out_of_disk_cache()
+    test_disk_cache_rebuilds_on_change()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Teste do cache negativo de perfis não convidáveis
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from negative_cache import FOLLOW_ONLY, PENDING, NegativeCache
+
+
+def test_entries_expire():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "negative_cache.json")
+        cache = NegativeCache(path, ttl_days=14)
+        cache.add("https://www.linkedin.com/in/ana", FOLLOW_ONLY)
+        cache.add("https://www.linkedin.com/in/bia", PENDING, ttl_days=-1)
+        assert cache.get("https://www.linkedin.com/in/ana") == FOLLOW_ONLY
+        assert "https://www.linkedin.com/in/bia" not in cache
+
+        # Entradas vencidas não voltam do disco
+        cache.save()
+        reloaded = NegativeCache(path)
+        assert "https://www.linkedin.com/in/ana" in reloaded
+        assert reloaded.get("https://www.linkedin.com/in/bia") is None
+        assert list(reloaded.entries) == ["in/ana"]
+
+
+def test_any_url_form_finds_the_profile():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = NegativeCache(os.path.join(tmp, "negative_cache.json"))
+        cache.add("https://www.linkedin.com/in/ana-souza/?miniProfileUrn=urn%3Ali%3Afs", FOLLOW_ONLY)
+        assert cache.get("https://www.linkedin.com/in/ana-souza") == FOLLOW_ONLY
+        assert cache.get("http://linkedin.com/in/Ana-Souza/") == FOLLOW_ONLY
+        assert cache.get("https://www.linkedin.com/in/bruno-lima") is None
+
+
+def test_save_merges_with_other_processes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "negative_cache.json")
+        bot_a = NegativeCache(path)
+        bot_b = NegativeCache(path)
+        bot_a.add("https://www.linkedin.com/in/ana", FOLLOW_ONLY)
+        bot_b.add("https://www.linkedin.com/in/bia", PENDING)
+        bot_a.save()
+        bot_b.save()
+
+        merged = NegativeCache(path)
+        assert merged.get("https://www.linkedin.com/in/ana") == FOLLOW_ONLY
+        assert merged.get("https://www.linkedin.com/in/bia") == PENDING
+        # Depois do save o processo também enxerga o que o outro gravou
+        assert bot_b.get("https://www.linkedin.com/in/ana") == FOLLOW_ONLY
+
+
+if __name__ == "__main__":
+    test_entries_expire()
+    test_any_url_form_finds_the_profile()
+    test_save_merges_with_other_processes()
+    print("🎉 Todos os testes passaram!")
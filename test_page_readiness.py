@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Teste das condições de prontidão da página (sem navegador)
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from page_readiness import any_of, results_stable, selector_present, use_eager_page_load, wait_ready
+
+
+class FakeDriver:
+    """Os resultados crescem a cada leitura até `final`; o seletor só existe se `present`"""
+
+    def __init__(self, final, step=2, present=False):
+        self.count = 0
+        self.final = final
+        self.step = step
+        self.present = present
+
+    def execute_script(self, script, *args):
+        if "querySelectorAll" in script:
+            self.count = min(self.count + self.step, self.final)
+            return self.count
+        if "querySelector(" in script:
+            return self.present
+        raise AssertionError(f"script inesperado: {script}")
+
+
+def test_results_stable_waits_for_growth_to_stop():
+    driver = FakeDriver(final=10)
+    assert wait_ready(driver, results_stable(stable_for=0.05), timeout=2, poll=0.01)
+    assert driver.count == 10
+
+
+def test_results_stable_needs_minimum():
+    driver = FakeDriver(final=0)
+    start = time.monotonic()
+    assert not wait_ready(driver, results_stable(stable_for=0.01), timeout=0.2, poll=0.01)
+    assert time.monotonic() - start >= 0.2
+
+
+def test_any_of_accepts_no_results_page():
+    driver = FakeDriver(final=0, present=True)
+    condition = any_of(results_stable(), selector_present(".search-no-results"))
+    assert wait_ready(driver, condition, timeout=1, poll=0.01)
+    assert "resultados estáveis" in condition.name
+
+
+def test_errors_during_navigation_are_retried():
+    calls = {"n": 0}
+
+    class Navigating:
+        def execute_script(self, script, *args):
+            calls["n"] += 1
+            if calls["n"] < 3:
+                raise RuntimeError("stale context")
+            return True
+
+    assert wait_ready(Navigating(), selector_present("main"), timeout=1, poll=0.01)
+    assert calls["n"] == 3
+
+
+def test_eager_page_load():
+    class Options:
+        page_load_strategy = "normal"
+
+    options = Options()
+    use_eager_page_load(options)
+    assert options.page_load_strategy == "eager"
+
+
+if __name__ == "__main__":
+    test_results_stable_waits_for_growth_to_stop()
+    test_results_stable_needs_minimum()
+    test_any_of_accepts_no_results_page()
+    test_errors_during_navigation_are_retried()
+    test_eager_page_load()
+    print("🎉 Todos os testes passaram!")
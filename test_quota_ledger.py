@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Teste do ledger de cotas compartilhado pelos bots
+"""
+
+import glob
+import gzip
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+import log_compaction
+from log_compaction import compact_account_log
+from quota_ledger import QuotaLedger, parse_log_line, rollup_path
+
+
+def days_ago(n):
+    return (datetime.now() - timedelta(days=n)).strftime("%Y-%m-%d")
+
+
+def test_parse_log_line():
+    """Testa os formatos de linha já existentes no AccountLog.txt"""
+    assert parse_log_line("Accounts ran: 25 on 2024-05-01\n") == ("2024-05-01", 25)
+    assert parse_log_line("Tech Recruiters connected: 3 on 2024-05-02") == ("2024-05-02", 3)
+    assert parse_log_line(
+        "[2024-05-03 10:22:13] Conexão enviada: Ana | Google | São Paulo | https://x\n"
+    ) == ("2024-05-03", 1)
+    assert parse_log_line("linha qualquer") is None
+    assert parse_log_line("") is None
+
+
+def test_import_and_window():
+    """Testa a importação única e a janela móvel de 7 dias"""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "AccountLog.txt")
+        ledger_file = os.path.join(tmp, "quota_ledger.json")
+        with open(log_file, "w", encoding="utf-8") as f:
+            f.write(f"Accounts ran: 25 on {days_ago(10)}\n")
+            f.write(f"Accounts ran: 20 on {days_ago(6)}\n")
+            f.write(f"Tech Recruiters connected: 4 on {days_ago(1)}\n")
+            f.write(f"[{days_ago(0)} 09:00:00] Conexão enviada: Ana | Google | SP | url\n")
+            f.write(f"[{days_ago(0)} 09:05:00] Conexão enviada: Bia | Meta | SP | url\n")
+
+        ledger = QuotaLedger(ledger_file, log_file)
+        assert ledger.sent_today() == 2
+        assert ledger.sent_last_7_days() == 26
+        assert ledger.has_run_today()
+
+        # A importação acontece apenas na criação do ledger
+        ledger.log_summary("Accounts ran", 3)
+        reloaded = QuotaLedger(ledger_file, log_file)
+        assert reloaded.sent_today() == 5
+        assert reloaded.sent_last_7_days() == 29
+
+
+def test_compaction_keeps_counts():
+    """Testa que a compactação não perde histórico"""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "AccountLog.txt")
+        archive_dir = os.path.join(tmp, "logs")
+        with open(log_file, "w", encoding="utf-8") as f:
+            f.write(f"Accounts ran: 25 on {days_ago(30)}\n")
+            f.write(f"[{days_ago(30)} 09:00:00] Conexão enviada: Ana | Google | SP | url\n")
+            f.write(f"Accounts ran: 10 on {days_ago(9)}\n")
+            f.write(f"Accounts ran: 7 on {days_ago(2)}\n")
+
+        assert compact_account_log(log_file, archive_dir=archive_dir) == 3
+        with open(log_file, encoding="utf-8") as f:
+            assert f.read() == f"Accounts ran: 7 on {days_ago(2)}\n"
+        with open(rollup_path(log_file), encoding="utf-8") as f:
+            rollups = f.read()
+        assert f"Daily rollup: 26 on {days_ago(30)}" in rollups
+        assert f"Daily rollup: 10 on {days_ago(9)}" in rollups
+
+        segments = glob.glob(os.path.join(archive_dir, "*.txt.gz"))
+        assert len(segments) == 1
+        with gzip.open(segments[0], "rt", encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+
+        # Nada mais a compactar na segunda execução
+        assert compact_account_log(log_file, archive_dir=archive_dir) == 0
+
+        # Um ledger novo reconstrói o histórico a partir do log + rollups
+        ledger = QuotaLedger(os.path.join(tmp, "quota_ledger.json"), log_file)
+        assert ledger.sent_on(days_ago(30)) == 26
+        assert ledger.sent_last_7_days() == 7
+
+
+def test_compaction_crash_never_counts_twice():
+    """Queda entre as duas gravações: as linhas não podem estar no log e no rollup"""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "AccountLog.txt")
+        archive_dir = os.path.join(tmp, "logs")
+        with open(log_file, "w", encoding="utf-8") as f:
+            f.write(f"Accounts ran: 25 on {days_ago(30)}\n")
+            f.write(f"Accounts ran: 7 on {days_ago(2)}\n")
+
+        write_atomic = log_compaction.write_atomic
+        writes = []
+
+        def crash_on_second_write(path, lines):
+            if writes:
+                raise OSError("queda simulada")
+            writes.append(path)
+            write_atomic(path, lines)
+
+        log_compaction.write_atomic = crash_on_second_write
+        try:
+            compact_account_log(log_file, archive_dir=archive_dir)
+            raise AssertionError("a queda simulada não aconteceu")
+        except OSError:
+            pass
+        finally:
+            log_compaction.write_atomic = write_atomic
+
+        ledger = QuotaLedger(os.path.join(tmp, "quota_ledger.json"), log_file)
+        assert ledger.sent_on(days_ago(30)) <= 25
+        assert ledger.sent_last_7_days() == 7
+        # As linhas brutas continuam no segmento arquivado
+        segments = glob.glob(os.path.join(archive_dir, "*.txt.gz"))
+        with gzip.open(segments[0], "rt", encoding="utf-8") as f:
+            assert f"25 on {days_ago(30)}" in f.read()
+
+
+def test_reservations_share_caps():
+    """Testa reserva / commit / release entre duas instâncias do mesmo ledger"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_file = os.path.join(tmp, "quota_ledger.json")
+        bot_a = QuotaLedger(ledger_file, None)
+        bot_b = QuotaLedger(ledger_file, None)
+
+        first = bot_a.reserve(10, max_daily=15, max_weekly=100)
+        second = bot_b.reserve(10, max_daily=15, max_weekly=100)
+        assert first.slots == 10
+        assert second.slots == 5
+        assert bot_a.reserve(1, max_daily=15, max_weekly=100) is None
+
+        first.commit(3)
+        first.release()
+        second.commit(5)
+        second.release()
+
+        # 8 enviadas, sobram 7 vagas no dia
+        third = QuotaLedger(ledger_file, None).reserve(20, max_daily=15, max_weekly=100)
+        assert third.slots == 7
+        third.release()
+        assert QuotaLedger(ledger_file, None).sent_today() == 8
+
+
+def test_expired_reservation_returns_slots():
+    """Testa que reservas de processos mortos expiram"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_file = os.path.join(tmp, "quota_ledger.json")
+        ledger = QuotaLedger(ledger_file, None)
+        assert ledger.reserve(15, max_daily=15, max_weekly=100, ttl=-1).slots == 15
+        assert ledger.reserve(15, max_daily=15, max_weekly=100).slots == 15
+
+
+def test_log_connection_counts_each_invite():
+    """Testa a linha por convite (com a identidade do perfil) usada na página de sugestões"""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "AccountLog.txt")
+        ledger_file = os.path.join(tmp, "quota_ledger.json")
+        ledger = QuotaLedger(ledger_file, log_file)
+        reservation = ledger.reserve(5, max_daily=25, max_weekly=100)
+        ledger.log_connection("Bia", "https://www.linkedin.com/in/bia", "Tech Recruiter", reservation=reservation)
+        ledger.log_connection("Caio", "https://www.linkedin.com/in/caio", "Recrutador", reservation=reservation)
+        assert reservation.remaining == 3
+        reservation.release()
+
+        with open(log_file, encoding="utf-8") as f:
+            lines = f.readlines()
+        assert "Conexão enviada: Bia | Tech Recruiter | https://www.linkedin.com/in/bia" in lines[0]
+        assert [parse_log_line(line)[1] for line in lines] == [1, 1]
+        assert QuotaLedger(ledger_file, log_file).sent_today() == 2
+
+
+if __name__ == "__main__":
+    test_parse_log_line()
+    test_import_and_window()
+    test_compaction_keeps_counts()
+    test_compaction_crash_never_counts_twice()
+    test_reservations_share_caps()
+    test_expired_reservation_returns_slots()
+    test_log_connection_counts_each_invite()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Teste do classificador de Tech Recruiters compartilhado
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from recruiter_matcher import classify_many, fold_text, is_tech_recruiter
+
+
+def test_fold_text():
+    assert fold_text("  São   Paulo ") == "sao paulo"
+    assert fold_text("CONTRATAÇÃO") == "contratacao"
+    assert fold_text(None) == ""
+
+
+def test_is_tech_recruiter():
+    """Testa acentos, plural e limites de palavra"""
+    assert is_tech_recruiter("Tech Recruiter at Google")
+    assert is_tech_recruiter("Senior Technical Recruiters | Meta")
+    assert is_tech_recruiter("Analista de Contratacao e RH")
+    assert is_tech_recruiter("Recrutadora Tech")
+    assert not is_tech_recruiter("Senior Software Engineer at Google")
+    # 'rh' não pode casar dentro de outras palavras
+    assert not is_tech_recruiter("Rhythm game developer")
+    assert not is_tech_recruiter("")
+
+
+def test_classify_many():
+    """Testa que o lote dá o mesmo resultado que a versão unitária"""
+    perfis = [
+        "Senior Software Engineer at Google",
+        "Tech Recruiter | Talent Acquisition Specialist",
+        "HR Manager - Human Resources",
+        "Full Stack Developer",
+        "",
+        "Headhunter & Talent Hunter",
+        "Product Manager",
+        "Recrutamento e Seleção",
+    ]
+    assert classify_many(perfis) == [is_tech_recruiter(p) for p in perfis]
+    assert classify_many(perfis) == [False, True, True, False, False, True, False, True]
+    assert classify_many([]) == []
+
+
+if __name__ == "__main__":
+    test_fold_text()
+    test_is_tech_recruiter()
+    test_classify_many()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Teste da paginação por URL com pré-carregamento da próxima página
+"""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from search_paginator import SearchPaginator, page_url
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Duas abas nomeadas; cada página da busca tem um card até `last_page`"""
+
+    def __init__(self, last_page):
+        self.last_page = last_page
+        self.tabs = {"main": None}
+        self.names = {}
+        self.current_window_handle = "main"
+        self.switch_to = FakeSwitch(self)
+        self.log = []
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    def get(self, url):
+        self.tabs[self.current_window_handle] = url
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        if script.startswith("window.name"):
+            self.names[args[0]] = self.current_window_handle
+        elif script.startswith("window.open"):
+            url, name = args if len(args) == 2 else ("about:blank", args[0])
+            handle = self.names.setdefault(name, f"tab{len(self.tabs)}")
+            self.tabs[handle] = url
+            if url != "about:blank":
+                self.log.append(("prefetch", url))
+        else:
+            page = int(self.tabs[self.current_window_handle].split("page=")[1])
+            cards = [{"index": 0, "url": f"https://www.linkedin.com/in/p{page}/"}] if page <= self.last_page else []
+            return json.dumps(cards)
+
+
+def test_search_paginator():
+    base = "https://www.linkedin.com/search/results/people/?keywords=tech%20recruiter&page=7"
+    assert page_url(base, 2) == "https://www.linkedin.com/search/results/people/?keywords=tech+recruiter&page=2"
+
+    driver = FakeDriver(last_page=3)
+    paginator = SearchPaginator(driver, base, max_pages=10, timeout=0)
+    seen = []
+    for page, cards in paginator.pages():
+        # A próxima página já foi pedida antes do lote atual ser processado
+        assert driver.log[-1] == ("prefetch", page_url(base, page + 1))
+        seen.append((page, cards[0]["url"]))
+    assert seen == [(page, f"https://www.linkedin.com/in/p{page}/") for page in (1, 2, 3)]
+
+    # Só duas abas são usadas, alternando os papéis
+    assert len(driver.tabs) == 2
+    paginator.close()
+    assert driver.window_handles == ["main"] and driver.current_window_handle == "main"
+
+    # max_pages limita e não pré-carrega além do limite
+    driver = FakeDriver(last_page=5)
+    paginator = SearchPaginator(driver, base, max_pages=2, timeout=0)
+    assert [page for page, _ in paginator.pages()] == [1, 2]
+    assert len(driver.log) == 1
+
+
+def test_new_tab_is_prepared_before_loading():
+    """O on_new_tab (modo leve) roda na aba de fundo antes da primeira página carregar nela"""
+    driver = FakeDriver(last_page=4)
+    prepared = []
+
+    def on_new_tab(d):
+        prepared.append((d.current_window_handle, d.tabs[d.current_window_handle]))
+
+    paginator = SearchPaginator(driver, "https://x/?keywords=a", max_pages=4, timeout=0, on_new_tab=on_new_tab)
+    list(paginator.pages())
+    # Uma vez só, ainda em branco, e o foco volta para a aba da busca
+    assert prepared == [("tab1", "about:blank")]
+    paginator.close()
+    assert driver.current_window_handle == "main"
+
+
+if __name__ == "__main__":
+    test_search_paginator()
+    test_new_tab_is_prepared_before_loading()
+    print("🎉 Todos os testes passaram!")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Teste do conjunto persistente de perfis já vistos
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from seen_profiles import SeenProfiles, canonical_profile_id
+
+
+def test_canonical_profile_id():
+    """Testa que variações da mesma URL viram o mesmo ID"""
+    assert canonical_profile_id("https://www.linkedin.com/in/Ana-Silva/") == "in/ana-silva"
+    assert canonical_profile_id("https://linkedin.com/in/ana-silva?miniProfileUrn=abc") == "in/ana-silva"
+    assert canonical_profile_id("https://www.linkedin.com/in/jo%C3%A3o/overlay/") == "in/joão"
+
+
+def test_seen_profiles_persist():
+    """Testa gravação, recarga e mescla entre instâncias"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen_profiles.bin")
+        seen = SeenProfiles(path)
+        urls = [f"https://www.linkedin.com/in/recruiter-{i}/" for i in range(1000)]
+        for url in urls:
+            seen.add(url)
+        seen.close()
+
+        other = SeenProfiles(path)
+        assert len(other) == 1000
+        assert all(url in other for url in urls)
+        assert "https://www.linkedin.com/in/RECRUITER-7?trk=x" in other
+        assert "https://www.linkedin.com/in/someone-else/" not in other
+
+        # Dois bots gravando no mesmo arquivo não perdem entradas
+        first = SeenProfiles(path)
+        second = SeenProfiles(path)
+        first.add("https://www.linkedin.com/in/novo-a/")
+        second.add("https://www.linkedin.com/in/novo-b/")
+        first.close()
+        second.close()
+        merged = SeenProfiles(path)
+        assert len(merged) == 1002
+        assert "https://www.linkedin.com/in/novo-a/" in merged
+        merged.close()
+        other.close()
+
+
+if __name__ == "__main__":
+    test_canonical_profile_id()
+    test_seen_profiles_persist()
+    print("🎉 Todos os testes passaram!")